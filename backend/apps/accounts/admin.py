@@ -5,7 +5,7 @@ Accounts 관리자 페이지 설정
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User
+from .models import LockoutEvent, User
 
 
 @admin.register(User)
@@ -19,3 +19,18 @@ class CustomUserAdmin(UserAdmin):
     fieldsets = UserAdmin.fieldsets + (
         ('추가 정보', {'fields': ('phone', 'organization', 'profile_image')}),
     )
+
+
+@admin.register(LockoutEvent)
+class LockoutEventAdmin(admin.ModelAdmin):
+    """로그인 잠금 기록 (읽기 전용)"""
+    list_display = ['created_at', 'username', 'ip_address', 'failures', 'path_info']
+    list_filter = ['created_at']
+    search_fields = ['username', 'ip_address']
+    readonly_fields = ['username', 'ip_address', 'user_agent', 'path_info', 'failures', 'created_at']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -10,3 +10,6 @@ class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.accounts'
     verbose_name = '사용자 관리'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,186 @@
+"""
+JWT 인증 (사용자 캐시)
+- simplejwt의 JWTAuthentication은 인증된 요청마다 사용자 행을 DB에서 조회합니다.
+- CachedJWTAuthentication은 사용자 필드 값을 두 단계 캐시에서 찾고, 둘 다 없을 때만 DB를 조회합니다.
+    1. 프로세스 메모리: AUTH_USER_CACHE_LOCAL_TIMEOUT초 (다른 프로세스의 변경은 이 시간 안에 반영)
+    2. 공유 캐시(AUTH_USER_CACHE_ALIAS): AUTH_USER_CACHE_TIMEOUT초
+- 공유 캐시 키는 사용자 ID와 버전으로 구성합니다. 사용자가 저장/삭제되면(프로필/비밀번호 변경, 관리자 수정)
+  커밋 후 버전을 새로 발급해 이전 항목을 모두 무효화합니다. (signals.py)
+  키를 지우지 않고 버전을 바꾸므로, 변경 직전에 DB에서 읽은 요청이 이전 값을 캐시에 다시 넣어도 쓰이지 않습니다.
+- 공유 캐시가 프로세스 메모리(locmem)/더미 캐시이면 다른 워커의 무효화를 받을 수 없으므로 캐시를 쓰지 않고
+  매 요청 DB에서 조회합니다. (비활성화/권한 변경이 캐시 시간 동안 반영되지 않는 문제 방지)
+- 쓰기 요청(POST/PUT/PATCH/DELETE)은 항상 DB에서 조회한 사용자를 씁니다.
+  캐시의 사용자는 조금 늦은 값일 수 있어, 그대로 save()하면 이전 값(비밀번호 해시 등)을 되돌려 쓸 수 있습니다.
+- 토큰 사용자 모드(JWT_TOKEN_USER_READS): token_user_reads = True인 뷰의 안전한 요청(GET/HEAD/OPTIONS)은
+  DB와 캐시 없이 토큰 클레임(user_id, username, is_staff)으로 만든 TokenUser를 사용합니다.
+  클레임은 토큰 발급 시점 값이므로 권한 변경은 토큰이 만료될 때 반영됩니다.
+"""
+
+import threading
+import time
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+CACHE_PREFIX = 'auth-user:'
+VERSION_PREFIX = 'auth-user-version:'
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+
+
+class UserCache:
+    """인증 사용자 필드 값 캐시 (프로세스 메모리 + 공유 캐시)"""
+
+    def __init__(self):
+        self._local = {}
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'AUTH_USER_CACHE_ALIAS', 'default')]
+
+    @property
+    def enabled(self):
+        """여러 프로세스가 함께 보는 캐시 백엔드일 때만 사용"""
+        return not isinstance(self.cache, PROCESS_LOCAL_BACKENDS)
+
+    @property
+    def fields(self):
+        return [field.attname for field in get_user_model()._meta.concrete_fields]
+
+    def get(self, user_id):
+        """사용자 ID(USER_ID_FIELD 값)로 사용자 조회, 없으면 None"""
+        user_id = str(user_id)  # 토큰 클레임은 문자열, 시그널의 pk는 정수일 수 있음
+        values = self._get_local(user_id)
+        if values is None:
+            values = self._get_shared(user_id)
+            if values is None:
+                return None
+            self._set_local(user_id, values)
+        return get_user_model().from_db('default', self.fields, values)
+
+    def invalidate(self, user_id):
+        """버전을 새로 발급해 공유 캐시의 이전 항목을 무효화하고, 현재 프로세스의 항목도 제거"""
+        if not self.enabled:
+            return
+        user_id = str(user_id)
+        self.cache.set(f'{VERSION_PREFIX}{user_id}', uuid.uuid4().hex, None)
+        with self._lock:
+            self._local.pop(user_id, None)
+
+    def snapshot(self):
+        with self._lock:
+            return {'local_hits': self._counts['local'], 'shared_hits': self._counts['shared'],
+                    'misses': self._counts['miss'], 'local_entries': len(self._local)}
+
+    # ----- 단계별 조회 -----
+
+    def _get_local(self, user_id):
+        with self._lock:
+            entry = self._local.get(user_id)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._counts['local'] += 1
+            return entry[1]
+
+    def _set_local(self, user_id, values):
+        timeout = getattr(settings, 'AUTH_USER_CACHE_LOCAL_TIMEOUT', 5)
+        if timeout <= 0:
+            return
+        with self._lock:
+            self._local[user_id] = (time.monotonic() + timeout, values)
+
+    def _get_shared(self, user_id):
+        cache = self.cache
+        key = f'{CACHE_PREFIX}{user_id}:{self._version(cache, user_id)}'
+        values = cache.get(key)
+        if values is not None:
+            with self._lock:
+                self._counts['shared'] += 1
+            return values
+        with self._lock:
+            self._counts['miss'] += 1
+        values = (
+            get_user_model()._default_manager.using('default')
+            .filter(**{api_settings.USER_ID_FIELD: user_id})
+            .values_list(*self.fields).first()
+        )
+        if values is not None:
+            cache.set(key, values, getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 300))
+        return values
+
+    def _version(self, cache, user_id):
+        key = f'{VERSION_PREFIX}{user_id}'
+        version = cache.get(key)
+        if version is None:
+            # 처음이거나 캐시에서 밀려난 경우 새 버전 (동시에 만든 요청이 있으면 그 값을 사용)
+            cache.add(key, uuid.uuid4().hex, None)
+            version = cache.get(key)
+        return version
+
+
+user_cache = UserCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    사용자 캐시를 쓰는 JWT 인증 (JWTAuthentication 대체)
+    - 토큰 검증은 simplejwt와 같고, 안전한 요청의 사용자 조회만 user_cache를 거칩니다.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        if self.use_token_user(request):
+            return self.get_token_user(validated_token), validated_token
+        if request.method not in SAFE_METHODS or not user_cache.enabled:
+            return super().get_user(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def use_token_user(self, request):
+        """
+        토큰 사용자를 쓸지 여부
+        - 뷰에 token_user_reads = True를 두면 JWT_TOKEN_USER_READS일 때 그 뷰의 GET/HEAD/OPTIONS 요청은
+          DB와 캐시 없이 토큰 클레임(user_id, username, is_staff)으로 사용자를 구성합니다.
+        - request.user의 다른 필드를 읽거나 저장하는 뷰에는 두지 않습니다. (TokenUser에는 클레임 값만 있음)
+        """
+        if not getattr(settings, 'JWT_TOKEN_USER_READS', False) or request.method not in SAFE_METHODS:
+            return False
+        view = (getattr(request, 'parser_context', None) or {}).get('view')
+        return getattr(view, 'token_user_reads', False)
+
+    def get_token_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken('토큰에 사용자 정보가 없습니다.')
+        return api_settings.TOKEN_USER_CLASS(validated_token)
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('토큰에 사용자 정보가 없습니다.')
+
+        user = user_cache.get(user_id)
+        if user is None:
+            raise AuthenticationFailed('사용자를 찾을 수 없습니다.', code='user_not_found')
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed('비활성화된 사용자입니다.', code='user_inactive')
+        if getattr(api_settings, 'CHECK_REVOKE_TOKEN', False):
+            from rest_framework_simplejwt.utils import get_md5_hash_password
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed('비밀번호가 변경되었습니다.', code='password_changed')
+        return user
@@ -0,0 +1,251 @@
+"""
+비밀번호 해시 서비스
+- PBKDF2/Argon2 해시는 한 번에 수십 ms의 CPU를 씁니다. 요청 워커에서 바로 계산하면 로그인/회원가입이 몰릴 때
+  같은 워커의 다른 요청까지 느려지고, 인증 처리량이 워커 수만큼으로 묶입니다.
+- PasswordHashingService는 해시를 별도 프로세스 풀(PASSWORD_HASHING_WORKERS개)에서 계산합니다.
+    - 동시에 계산/대기할 수 있는 요청은 워커 수 + PASSWORD_HASHING_QUEUE_SIZE개입니다.
+      자리가 없으면 PASSWORD_HASHING_QUEUE_TIMEOUT초까지 기다린 뒤 PasswordHashingBusy(503)로 거절합니다. (역압)
+    - 동기 뷰는 결과가 나올 때까지 요청 스레드만 기다리고, 비동기 뷰는 await으로 이벤트 루프를 막지 않습니다.
+    - 풀 프로세스가 죽으면(BrokenProcessPool) 풀을 새로 만들고 그 요청은 현재 스레드에서 계산합니다.
+- User.set_password/check_password/acheck_password가 이 서비스를 쓰므로 회원가입, 로그인(ModelBackend),
+  비밀번호 변경이 모두 풀을 거칩니다.
+- PASSWORD_HASHING_WORKERS=0(기본값)이면 풀 없이 현재 스레드에서 계산합니다. 풀은 배포 환경에서 워커 수를 지정해 켭니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, check_password, make_password
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashingBusy(APIException):
+    """해시 대기열이 가득 참 (잠시 후 재시도)"""
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요.'
+    default_code = 'password_hashing_busy'
+
+    def __init__(self, detail=None, code=None, wait=1):
+        super().__init__(detail, code)
+        self.wait = wait  # DRF 예외 처리기가 Retry-After 헤더로 내보냄
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id (설정: ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM)
+    - Django 기본값(parallelism=8, 100MiB)은 해시 하나가 여러 코어와 많은 메모리를 쓰므로,
+      프로세스 풀에서 동시에 여러 해시를 계산할 때는 해시 하나가 코어 하나를 쓰도록 줄입니다.
+    - 알고리즘 이름이 같아(argon2) 기본 Argon2 해시도 확인하고, 설정이 바뀌면 로그인 시 새 설정으로 다시 해시합니다.
+    """
+
+    @property
+    def time_cost(self):
+        return getattr(settings, 'ARGON2_TIME_COST', 2)
+
+    @property
+    def memory_cost(self):
+        return getattr(settings, 'ARGON2_MEMORY_COST', 19 * 1024)
+
+    @property
+    def parallelism(self):
+        return getattr(settings, 'ARGON2_PARALLELISM', 1)
+
+
+# ----- 풀 프로세스에서 실행되는 함수 (pickle 가능하도록 모듈 최상위) -----
+
+def _init_worker():
+    import django
+    django.setup()
+
+
+def _make(raw_password, hasher):
+    return make_password(raw_password, hasher=hasher)
+
+
+def _check(raw_password, encoded, preferred):
+    """(일치 여부, 다시 계산한 해시 또는 None) - 해시 방식/설정이 바뀐 경우 같은 프로세스에서 새 해시까지 계산"""
+    upgraded = []
+    is_correct = check_password(
+        raw_password, encoded,
+        setter=lambda raw: upgraded.append(make_password(raw, hasher=preferred)),
+        preferred=preferred,
+    )
+    return is_correct, upgraded[0] if upgraded else None
+
+
+class PasswordHashingService:
+    """비밀번호 해시를 프로세스 풀에서 계산 (값을 주지 않은 설정은 settings.PASSWORD_HASHING_*)"""
+
+    def __init__(self, workers=None, queue_size=None, queue_timeout=None):
+        self._workers = workers
+        self._queue_size = queue_size
+        self._queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+        self._pid = None
+        self._in_flight = 0
+        self._counts = Counter()
+
+    @property
+    def workers(self):
+        if self._workers is not None:
+            return self._workers
+        return getattr(settings, 'PASSWORD_HASHING_WORKERS', 0)
+
+    @property
+    def queue_size(self):
+        if self._queue_size is not None:
+            return self._queue_size
+        return getattr(settings, 'PASSWORD_HASHING_QUEUE_SIZE', 32)
+
+    @property
+    def queue_timeout(self):
+        if self._queue_timeout is not None:
+            return self._queue_timeout
+        return getattr(settings, 'PASSWORD_HASHING_QUEUE_TIMEOUT', 5)
+
+    # ----- 공개 API (django.contrib.auth.hashers와 같은 인자) -----
+
+    def make_password(self, raw_password, hasher='default'):
+        if raw_password is None:
+            return make_password(None)  # 사용할 수 없는 비밀번호 (해시 계산 없음)
+        return self._run(_make, raw_password, hasher)
+
+    def check_password(self, raw_password, encoded, preferred='default'):
+        """(일치 여부, 저장할 새 해시 또는 None) 반환"""
+        return self._run(_check, raw_password, encoded, preferred)
+
+    async def amake_password(self, raw_password, hasher='default'):
+        if raw_password is None:
+            return make_password(None)
+        return await self._arun(_make, raw_password, hasher)
+
+    async def acheck_password(self, raw_password, encoded, preferred='default'):
+        return await self._arun(_check, raw_password, encoded, preferred)
+
+    def snapshot(self):
+        with self._lock:
+            return {'pooled': self._counts['pooled'], 'inline': self._counts['inline'],
+                    'rejected': self._counts['rejected'], 'fallbacks': self._counts['fallback'],
+                    'in_flight': self._in_flight}
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    # ----- 실행 -----
+
+    def _run(self, func, *args):
+        if self.workers <= 0:
+            self._count('inline')
+            return func(*args)
+        self._acquire()
+        try:
+            return self._submit(func, args).result()
+        except BrokenProcessPool:
+            return self._fallback(func, args)
+
+    async def _arun(self, func, *args):
+        if self.workers <= 0:
+            self._count('inline')
+            return await sync_to_async(func, thread_sensitive=False)(*args)
+        if not self._try_acquire():
+            # 대기열이 찼을 때만 스레드에서 자리를 기다림 (이벤트 루프를 막지 않도록)
+            await sync_to_async(self._acquire, thread_sensitive=False)()
+        try:
+            return await asyncio.wrap_future(self._submit(func, args))
+        except BrokenProcessPool:
+            return await sync_to_async(self._fallback, thread_sensitive=False)(func, args)
+
+    def _try_acquire(self):
+        slots = self._get_slots()
+        if slots.acquire(blocking=False):
+            self._started()
+            return True
+        return False
+
+    def _acquire(self):
+        if not self._get_slots().acquire(timeout=self.queue_timeout):
+            self._count('rejected')
+            logger.warning('비밀번호 해시 대기열이 가득 차 요청을 거절했습니다. (워커 %d, 대기열 %d)',
+                           self.workers, self.queue_size)
+            raise PasswordHashingBusy()
+        self._started()
+
+    def _submit(self, func, args):
+        """자리를 얻은 뒤 호출. 작업이 끝나면(실패 포함) 자리를 반납"""
+        slots = self._get_slots()
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BaseException:
+            self._finished(slots)
+            raise
+        future.add_done_callback(lambda _: self._finished(slots))
+        self._count('pooled')
+        return future
+
+    def _fallback(self, func, args):
+        logger.error('비밀번호 해시 프로세스 풀이 중단되어 다시 만듭니다.')
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self._count('fallback')
+        return func(*args)
+
+    def _started(self):
+        with self._lock:
+            self._in_flight += 1
+
+    def _finished(self, slots):
+        with self._lock:
+            self._in_flight -= 1
+        slots.release()
+
+    def _count(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    # ----- 풀 -----
+
+    def _reset_if_forked(self):
+        # 서버가 워커 프로세스를 fork한 경우 부모의 풀/세마포어는 쓰지 않고 새로 만듦 (잠금을 잡은 채 호출)
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._executor = None
+            self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+            self._in_flight = 0
+
+    def _get_slots(self):
+        with self._lock:
+            self._reset_if_forked()
+            return self._slots
+
+    def _get_executor(self):
+        with self._lock:
+            self._reset_if_forked()
+            if self._executor is None:
+                # fork는 요청 처리 스레드의 잠금 상태까지 복사하므로 spawn으로 새 인터프리터를 띄움
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+
+password_hasher = PasswordHashingService()
@@ -0,0 +1,47 @@
+"""
+로그인 시도 제한 (django-axes 캐시 핸들러)
+- 기본 DB 핸들러는 로그인 요청마다 AccessAttempt/AccessLog 행을 쓰므로, 크리덴셜 스터핑 같은
+  대량 로그인 시도가 들어오면 가장 바쁜 쓰기 경로가 됩니다.
+- CacheLockoutHandler는 실패 횟수를 캐시(AXES_CACHE)에만 셉니다. 키의 만료 시간은 실패할 때마다
+  AXES_COOLOFF_TIME으로 다시 잡히므로(슬라이딩 윈도), 마지막 실패 후 쿨오프 시간이 지나면 초기화되는
+  기존 AXES_FAILURE_LIMIT/AXES_COOLOFF_TIME 동작과 같습니다.
+- 잠금이 걸리는 순간(실패 횟수가 한도에 도달)만 LockoutEvent로 DB에 기록합니다.
+- 여러 서버/워커가 횟수를 공유하려면 AXES_CACHE가 공유 캐시(Redis, Memcached 등)여야 하므로,
+  settings는 CACHE_BACKEND가 공유 캐시일 때만 이 핸들러를 쓰고 그 외에는 axes 기본 DB 핸들러를 씁니다.
+"""
+
+import logging
+
+from axes.handlers.cache import AxesCacheHandler
+from axes.helpers import get_client_username, get_failure_limit
+from django.db import DatabaseError
+
+from .models import LockoutEvent
+
+logger = logging.getLogger(__name__)
+
+
+class CacheLockoutHandler(AxesCacheHandler):
+    """캐시로 실패 횟수를 세고 잠금 이벤트만 DB에 남기는 axes 핸들러"""
+
+    def user_login_failed(self, sender, credentials, request=None, **kwargs):
+        super().user_login_failed(sender, credentials, request=request, **kwargs)
+        if request is None:
+            return
+        # 잠금 중 재시도는 한도를 넘긴 값이 되므로 한도에 처음 도달한 요청만 기록
+        failures = getattr(request, 'axes_failures_since_start', None)
+        if failures is not None and failures == get_failure_limit(request, credentials):
+            self.record_lockout(request, credentials, failures)
+
+    def record_lockout(self, request, credentials, failures):
+        try:
+            LockoutEvent.objects.create(
+                username=(get_client_username(request, credentials) or '')[:255],
+                ip_address=request.axes_ip_address or None,
+                user_agent=(request.axes_user_agent or '')[:255],
+                path_info=(request.axes_path_info or '')[:255],
+                failures=failures,
+            )
+        except DatabaseError:
+            # 감사 기록 실패가 잠금 자체를 막지 않도록 로그만 남김
+            logger.exception('로그인 잠금 기록 저장 실패: %s', request.axes_ip_address)
@@ -0,0 +1,128 @@
+"""
+비밀번호 해시 벤치마크 명령어
+- 로그인 한 번에 하는 비밀번호 확인(check_password)을 해시 방식별로 반복해 초당 로그인 수를 측정합니다.
+    inline: 요청 스레드에서 바로 계산 (PASSWORD_HASHING_WORKERS=0, 기존 동작)
+    pool:   프로세스 풀(--workers개)에서 계산하고, --concurrency개 스레드가 동시에 요청
+- 코어당 = 초당 로그인 / 계산에 쓴 코어 수 (inline은 1, pool은 min(워커 수, CPU 수)), 배율은 첫 번째 방식 inline 기준
+- 요청 CPU: 요청 프로세스(이 명령어)가 로그인 하나에 쓴 CPU 시간. 풀에서는 해시 계산이 빠지고 전달 비용만 남습니다.
+- 해시 설정은 현재 settings를 그대로 씁니다. (PBKDF2 반복 횟수는 Django 기본값, Argon2 비용은 ARGON2_* 환경 변수)
+- 사용법: python manage.py benchmark_hashing [--hashers pbkdf2 argon2] [--iterations 50] [--workers 4] [--json result.json]
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.hashing import PasswordHashingService
+
+PASSWORD = 'bench-password-1234'
+ALGORITHMS = {'pbkdf2': 'pbkdf2_sha256', 'argon2': 'argon2'}
+
+
+def available_cores():
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class Command(BaseCommand):
+    help = '비밀번호 해시 방식(PBKDF2/Argon2)과 처리 방식(요청 스레드/프로세스 풀)별 초당 로그인 수를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hashers', nargs='+', choices=ALGORITHMS, default=list(ALGORITHMS))
+        parser.add_argument('--iterations', type=int, default=50, help='측정별 로그인(비밀번호 확인) 수')
+        parser.add_argument('--workers', type=int, default=available_cores(), help='풀 프로세스 수 (기본값: CPU 수)')
+        parser.add_argument('--concurrency', type=int, help='풀에 동시에 요청하는 스레드 수 (기본값: 워커 수 x 2)')
+        parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        if workers < 1:
+            raise CommandError('--workers는 1 이상이어야 합니다.')
+        concurrency = options['concurrency'] or workers * 2
+        cores = available_cores()
+        self.stdout.write(
+            f"CPU {cores}개, 측정별 {options['iterations']}회, 풀 워커 {workers}개, 동시 요청 {concurrency}"
+        )
+
+        results = {}
+        baseline = None
+        for name in options['hashers']:
+            algorithm = ALGORITHMS[name]
+            try:
+                hasher = get_hasher(algorithm)
+                encoded = make_password(PASSWORD, hasher=algorithm)
+            except ValueError as e:
+                self.stderr.write(self.style.WARNING(f'{name}: 건너뜀 ({e})'))
+                continue
+            self.stdout.write(f'{name}: {self.describe(hasher)}')
+
+            inline = PasswordHashingService(workers=0)
+            pool = PasswordHashingService(workers=workers, queue_size=concurrency, queue_timeout=60)
+            try:
+                # 풀 프로세스 시작(spawn, Django 초기화)은 측정에서 제외
+                self.measure(pool, encoded, algorithm, workers * 2, concurrency)
+                results[name] = {
+                    'inline': self.measure(inline, encoded, algorithm, options['iterations'], 1, cores=1),
+                    'pool': self.measure(
+                        pool, encoded, algorithm, options['iterations'], concurrency, cores=min(workers, cores)
+                    ),
+                }
+            finally:
+                pool.shutdown()
+            if baseline is None:
+                baseline = results[name]['inline']['per_core']
+            for mode, result in results[name].items():
+                self.report(name, mode, result, baseline)
+
+        if options['json']:
+            with open(options['json'], 'w', encoding='utf-8') as f:
+                json.dump({
+                    'cores': cores,
+                    'workers': workers,
+                    'concurrency': concurrency,
+                    'iterations': options['iterations'],
+                    'results': results,
+                }, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과 저장: {options['json']}")
+
+    def describe(self, hasher):
+        params = [f'{key}={getattr(hasher, key)}' for key in ('iterations', 'time_cost', 'memory_cost', 'parallelism')
+                  if hasattr(hasher, key)]
+        return f"{type(hasher).__name__} ({', '.join(params)})"
+
+    def measure(self, service, encoded, algorithm, iterations, concurrency, cores=1):
+        def login(_):
+            is_correct, _ = service.check_password(PASSWORD, encoded, preferred=algorithm)
+            if not is_correct:
+                raise CommandError('비밀번호 확인 결과가 올바르지 않습니다.')
+
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        if concurrency == 1:
+            for i in range(iterations):
+                login(i)
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(login, range(iterations)))
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+
+        rate = iterations / elapsed if elapsed else 0.0
+        return {
+            'logins_per_sec': round(rate, 1),
+            'per_core': round(rate / cores, 1),
+            'cores': cores,
+            'request_cpu_ms': round(cpu / iterations * 1000, 2) if iterations else 0.0,
+        }
+
+    def report(self, name, mode, result, baseline):
+        ratio = result['per_core'] / baseline if baseline else 0.0
+        self.stdout.write(
+            f"  {mode:<7} {result['logins_per_sec']:>8.1f} 로그인/s  코어당 {result['per_core']:>7.1f} "
+            f"({ratio:>4.2f}x, 코어 {result['cores']})  요청 CPU {result['request_cpu_ms']:>7.2f}ms/로그인"
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.16 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+
+def fill_profile_image_hash(apps, schema_editor):
+    """기존 프로필 이미지의 해시 계산 (파일이 없으면 건너뜀)"""
+    from apps.core.storage import hash_path
+
+    User = apps.get_model('accounts', 'User')
+    for user in User.objects.exclude(profile_image='').exclude(profile_image__isnull=True).iterator():
+        try:
+            user.profile_image_hash = hash_path(user.profile_image.path)
+        except FileNotFoundError:
+            continue
+        user.save(update_fields=['profile_image_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, verbose_name='프로필 이미지 해시'),
+        ),
+        migrations.RunPython(fill_profile_image_hash, migrations.RunPython.noop),
+    ]
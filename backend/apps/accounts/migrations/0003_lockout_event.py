@@ -0,0 +1,30 @@
+# Generated by Django 4.2.16 on 2026-10-18 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_profile_image_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LockoutEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('username', models.CharField(blank=True, max_length=255, verbose_name='사용자명')),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True, verbose_name='IP 주소')),
+                ('user_agent', models.CharField(blank=True, max_length=255, verbose_name='User-Agent')),
+                ('path_info', models.CharField(blank=True, max_length=255, verbose_name='경로')),
+                ('failures', models.PositiveIntegerField(verbose_name='실패 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='잠금 시각')),
+            ],
+            options={
+                'verbose_name': '로그인 잠금 기록',
+                'verbose_name_plural': '로그인 잠금 기록들',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -7,12 +7,17 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+from apps.core.storage import hash_file
+
+from .hashing import password_hasher
+
 
 class User(AbstractUser):
     """
     커스텀 사용자 모델
     - AbstractUser를 상속받아 기본 인증 기능 사용
     - 추가 필드: 프로필 이미지, 전화번호, 소속 등
+    - 비밀번호 해시는 프로세스 풀에서 계산 (hashing.py)
     """
     email = models.EmailField('이메일', unique=True)
     phone = models.CharField('전화번호', max_length=20, blank=True)
@@ -23,6 +28,8 @@ class User(AbstractUser):
         blank=True,
         null=True
     )
+    # 프로필 이미지 SHA-256 (썸네일 파일 이름에 사용)
+    profile_image_hash = models.CharField('프로필 이미지 해시', max_length=64, blank=True, editable=False)
     created_at = models.DateTimeField('생성일', auto_now_add=True)
     updated_at = models.DateTimeField('수정일', auto_now=True)
 
@@ -36,3 +43,54 @@ class User(AbstractUser):
 
     def __str__(self):
         return self.email
+
+    def save(self, *args, **kwargs):
+        # 새 이미지가 올라온 경우에만 해시 계산 (썸네일 생성 시그널이 profile_image_changed를 확인)
+        self.profile_image_changed = bool(self.profile_image) and not self.profile_image._committed
+        if not self.profile_image:
+            self.profile_image_hash = ''
+        elif self.profile_image_changed:
+            self.profile_image_hash = hash_file(self.profile_image)
+        super().save(*args, **kwargs)
+
+    # ----- 비밀번호 (AbstractBaseUser와 같은 동작, 해시 계산만 password_hasher로) -----
+
+    def set_password(self, raw_password):
+        self.password = password_hasher.make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        is_correct, upgraded = password_hasher.check_password(raw_password, self.password)
+        if upgraded:
+            # 해시 방식/설정 변경에 따른 재해시는 비밀번호 변경이 아님 (_password를 두지 않음)
+            self.password = upgraded
+            self.save(update_fields=['password'])
+        return is_correct
+
+    async def acheck_password(self, raw_password):
+        is_correct, upgraded = await password_hasher.acheck_password(raw_password, self.password)
+        if upgraded:
+            self.password = upgraded
+            await self.asave(update_fields=['password'])
+        return is_correct
+
+
+class LockoutEvent(models.Model):
+    """
+    로그인 잠금 기록 (감사용)
+    - 로그인 실패 횟수는 캐시에서만 세고(lockout.py), 잠금이 걸린 순간만 DB에 남깁니다.
+    """
+    username = models.CharField('사용자명', max_length=255, blank=True)
+    ip_address = models.GenericIPAddressField('IP 주소', null=True, blank=True)
+    user_agent = models.CharField('User-Agent', max_length=255, blank=True)
+    path_info = models.CharField('경로', max_length=255, blank=True)
+    failures = models.PositiveIntegerField('실패 횟수')
+    created_at = models.DateTimeField('잠금 시각', auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = '로그인 잠금 기록'
+        verbose_name_plural = '로그인 잠금 기록들'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.username or '-'} ({self.ip_address}) {self.created_at:%Y-%m-%d %H:%M}"
@@ -5,9 +5,12 @@
 """
 
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 
+from apps.core.thumbnails import thumbnail_urls
+
 User = get_user_model()
 
 
@@ -48,12 +51,26 @@ class UserSerializer(serializers.ModelSerializer):
     """
     사용자 정보 시리얼라이저
     - 사용자 정보 조회 및 수정에 사용
+    - profile_thumbnails: 프로필 이미지의 크기별 썸네일 주소 (이미지가 없으면 null)
     """
+    profile_thumbnails = serializers.SerializerMethodField()
+
     class Meta:
         model = User
-        fields = ['id', 'email', 'username', 'phone', 'organization', 'profile_image', 'created_at']
+        fields = [
+            'id', 'email', 'username', 'phone', 'organization',
+            'profile_image', 'profile_thumbnails', 'created_at'
+        ]
         read_only_fields = ['id', 'email', 'created_at']
 
+    def get_profile_thumbnails(self, obj):
+        if not obj.profile_image_hash:
+            return None
+        return thumbnail_urls(
+            self.context.get('request'), 'user-thumbnail',
+            version=obj.profile_image_hash[:12], pk=obj.pk,
+        )
+
 
 class ChangePasswordSerializer(serializers.Serializer):
     """
@@ -61,3 +78,18 @@ class ChangePasswordSerializer(serializers.Serializer):
     """
     old_password = serializers.CharField(required=True)
     new_password = serializers.CharField(required=True, validators=[validate_password])
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    로그인 토큰 발급 시리얼라이저
+    - 토큰 사용자 모드(JWT_TOKEN_USER_READS)에서 쓰는 username, is_staff 클레임 추가
+    - 갱신(refresh)으로 발급한 액세스 토큰에도 그대로 복사됩니다.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['username'] = user.username
+        token['is_staff'] = user.is_staff
+        return token
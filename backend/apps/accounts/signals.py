@@ -0,0 +1,25 @@
+"""
+Accounts 시그널 핸들러
+- 사용자가 바뀌면 인증 사용자 캐시를 무효화합니다. (authentication.py)
+"""
+
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import user_cache
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    프로필/비밀번호 변경, 관리자 수정, 삭제 시 캐시 무효화
+    - 커밋 전에 무효화하면 다른 요청이 커밋 전 값을 새 버전으로 캐시할 수 있으므로 커밋 후 실행
+    """
+    user_id = getattr(instance, api_settings.USER_ID_FIELD)
+    transaction.on_commit(partial(user_cache.invalidate, user_id))
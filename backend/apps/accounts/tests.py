@@ -0,0 +1,124 @@
+"""
+Accounts 테스트
+- JWT 인증 사용자 캐시: 공유 캐시가 아닐 때의 DB 조회, 쓰기 요청의 사용자 조회
+- 로그인 시도 제한: 공유 캐시가 아닐 때의 DB 핸들러
+- 공유 캐시 경로: CACHE_BACKEND가 공유 캐시일 때만 실행
+- 실행: DB_ENGINE=sqlite python manage.py test apps.accounts
+  공유 캐시 경로까지 확인하려면 CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+  CACHE_LOCATION=redis://127.0.0.1:6379/15 를 함께 지정
+"""
+
+import unittest
+from unittest import mock
+
+from axes.models import AccessAttempt
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .authentication import UserCache, user_cache
+from .models import LockoutEvent, User
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    """사용자 캐시가 늦은 값을 가지고 있어도 권한 변경과 저장이 틀어지지 않아야 함"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='auth@example.com', username='auth', password='pw-1234-old')
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def tearDown(self):
+        cache.clear()
+
+    def enable_cache(self):
+        """테스트 캐시(locmem)를 공유 캐시처럼 사용"""
+        patcher = mock.patch.object(UserCache, 'enabled', new_callable=mock.PropertyMock, return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_process_local_cache_not_used(self):
+        self.assertFalse(UserCache().enabled)
+        self.assertEqual(self.client.get('/api/accounts/profile/').status_code, 200)
+        # 시그널 없이(다른 워커에서) 비활성화해도 다음 요청에서 바로 반영
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.client.get('/api/accounts/profile/').status_code, 401)
+
+    def test_write_uses_fresh_user(self):
+        self.enable_cache()
+        self.assertEqual(self.client.get('/api/accounts/profile/').status_code, 200)
+        # 다른 워커에서 바뀐 비밀번호가 아직 이 프로세스 캐시에 반영되지 않은 상태
+        changed = User.objects.get(pk=self.user.pk)
+        changed.set_password('pw-1234-new')
+        User.objects.filter(pk=self.user.pk).update(password=changed.password)
+
+        response = self.client.patch('/api/accounts/profile/', {'organization': '개발팀'})
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.organization, '개발팀')
+        self.assertTrue(self.user.check_password('pw-1234-new'))
+
+
+@unittest.skipIf(settings.CACHE_IS_SHARED, 'CACHE_BACKEND가 공유 캐시로 설정됨')
+class LoginLockoutTests(APITestCase):
+    """로컬 메모리 캐시에서는 워커마다 따로 세지 않도록 DB 핸들러로 실패 횟수를 셈"""
+
+    def setUp(self):
+        User.objects.create_user(email='lock@example.com', username='lock', password='pw-1234-test')
+
+    def tearDown(self):
+        cache.clear()
+
+    def login(self, password):
+        return self.client.post('/api/token/', {'email': 'lock@example.com', 'password': password})
+
+    def test_database_handler_without_shared_cache(self):
+        self.assertEqual(settings.AXES_HANDLER, 'axes.handlers.database.AxesDatabaseHandler')
+        for _ in range(settings.AXES_FAILURE_LIMIT):
+            self.login('wrong-password')
+        self.assertEqual(AccessAttempt.objects.get().failures_since_start, settings.AXES_FAILURE_LIMIT)
+        self.assertNotEqual(self.login('pw-1234-test').status_code, 200)
+
+
+@unittest.skipUnless(settings.CACHE_IS_SHARED, 'CACHE_BACKEND가 공유 캐시가 아님')
+class SharedCacheTests(APITestCase):
+    """공유 캐시에서의 인증 사용자 캐시와 캐시 기반 로그인 시도 제한"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='shared@example.com', username='shared', password='pw-1234-test')
+        # 이전 테스트에서 같은 ID로 남은 프로세스 메모리 항목 제거
+        user_cache.invalidate(self.user.pk)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_user_cache(self):
+        self.assertTrue(user_cache.enabled)
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        before = user_cache.snapshot()
+        self.assertEqual(self.client.get('/api/accounts/profile/').status_code, 200)
+        self.assertEqual(self.client.get('/api/accounts/profile/').status_code, 200)
+        after = user_cache.snapshot()
+        self.assertEqual(after['misses'] - before['misses'], 1)
+        self.assertEqual(
+            after['local_hits'] + after['shared_hits'] - before['local_hits'] - before['shared_hits'], 1
+        )
+
+        # 저장하면 커밋 후 버전이 바뀌어 다음 요청에서 바로 반영
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.client.get('/api/accounts/profile/').status_code, 401)
+
+    def test_cache_lockout_handler(self):
+        self.assertEqual(settings.AXES_HANDLER, 'apps.accounts.lockout.CacheLockoutHandler')
+        for _ in range(settings.AXES_FAILURE_LIMIT + 1):
+            self.client.post('/api/token/', {'email': 'shared@example.com', 'password': 'wrong-password'})
+        self.assertFalse(AccessAttempt.objects.exists())
+        self.assertEqual(LockoutEvent.objects.get().failures, settings.AXES_FAILURE_LIMIT)
+        response = self.client.post('/api/token/', {'email': 'shared@example.com', 'password': 'pw-1234-test'})
+        self.assertNotEqual(response.status_code, 200)
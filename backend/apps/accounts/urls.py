@@ -8,7 +8,8 @@ from .views import (
     RegisterView,
     ProfileView,
     ChangePasswordView,
-    UserListView
+    UserListView,
+    ProfileThumbnailView
 )
 
 urlpatterns = [
@@ -16,4 +17,5 @@ urlpatterns = [
     path('profile/', ProfileView.as_view(), name='profile'),
     path('change-password/', ChangePasswordView.as_view(), name='change-password'),
     path('users/', UserListView.as_view(), name='user-list'),
+    path('users/<int:pk>/thumbnail/<str:size>/', ProfileThumbnailView.as_view(), name='user-thumbnail'),
 ]
@@ -4,10 +4,15 @@
 """
 
 from rest_framework import generics, status, permissions
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.conf import settings
 from django.contrib.auth import get_user_model
 
+from apps.core.downloads import serve_file
+from apps.core.thumbnails import ThumbnailError, thumbnails
+
 from .serializers import (
     UserRegistrationSerializer,
     UserSerializer,
@@ -67,7 +72,7 @@ class ChangePasswordView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             user.set_password(serializer.data.get('new_password'))
-            user.save()
+            user.save(update_fields=['password'])
             return Response({"message": "비밀번호가 변경되었습니다."})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -80,3 +85,27 @@ class UserListView(generics.ListAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAdminUser]
+
+
+class ProfileThumbnailView(APIView):
+    """
+    프로필 이미지 썸네일 API
+    - GET /api/accounts/users/{id}/thumbnail/{size}/  (size: THUMBNAIL_SIZES의 이름)
+    - 썸네일이 아직 없으면 이 요청에서 생성합니다.
+    """
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, pk, size):
+        user = User.objects.filter(pk=pk).only('profile_image', 'profile_image_hash').first()
+        if user is None or not user.profile_image_hash or size not in settings.THUMBNAIL_SIZES:
+            raise NotFound("썸네일을 찾을 수 없습니다.")
+        try:
+            path = thumbnails.get_or_create(user.profile_image.path, user.profile_image_hash, size)
+        except ThumbnailError:
+            raise NotFound("썸네일을 만들 수 없습니다.")
+        response = serve_file(
+            request, path, content_type='image/webp', etag=f'{user.profile_image_hash}-{size}'
+        )
+        if response is None:
+            raise NotFound("썸네일을 찾을 수 없습니다.")
+        return response
@@ -4,6 +4,7 @@ Core 관리자 페이지 설정
 """
 
 from django.contrib import admin
+from django.db import transaction
 from .models import Category, Post, Attachment, Comment
 
 
@@ -24,21 +25,55 @@ class CommentInline(admin.TabularInline):
     """댓글 인라인"""
     model = Comment
     extra = 0
+    # 답글 위치(경로)는 API에서만 정해지므로 변경 불가
+    readonly_fields = ['parent', 'depth']
 
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     """게시글 관리자"""
-    list_display = ['title', 'author', 'category', 'views', 'is_public', 'created_at']
+    list_display = [
+        'title', 'author', 'category', 'views', 'likes_count', 'comment_count',
+        'is_public', 'created_at'
+    ]
     list_filter = ['category', 'is_public', 'created_at']
     search_fields = ['title', 'content', 'author__username']
+    readonly_fields = ['likes_count', 'comment_count']
     inlines = [AttachmentInline, CommentInline]
     ordering = ['-created_at']
 
+    def save_related(self, request, form, formsets, change):
+        # 인라인 댓글/좋아요 변경 후 카운터 재계산
+        super().save_related(request, form, formsets, change)
+        Post.objects.filter(pk=form.instance.pk).recount()
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     """댓글 관리자"""
-    list_display = ['post', 'author', 'content', 'created_at']
+    list_display = ['post', 'author', 'content', 'depth', 'created_at']
     list_filter = ['created_at']
     search_fields = ['content', 'author__username']
+    readonly_fields = ['parent', 'depth']
+
+    def save_model(self, request, obj, form, change):
+        # 댓글이 다른 게시글로 옮겨질 수 있으므로 이전/현재 게시글 모두 재계산
+        post_ids = {obj.post_id}
+        if change and 'post' in form.changed_data:
+            post_ids.add(form.initial.get('post'))
+        super().save_model(request, obj, form, change)
+        Post.objects.filter(pk__in=post_ids).recount()
+
+    def delete_model(self, request, obj):
+        # 답글도 함께 삭제되므로 하위 트리 전체 수만큼 감소 (CommentViewSet.perform_destroy와 같은 방식)
+        with transaction.atomic():
+            deleted = Comment.objects.subtree(obj).count()
+            super().delete_model(request, obj)
+            Post.objects.filter(pk=obj.post_id).adjust_counts(comments=-deleted)
+
+    def delete_queryset(self, request, queryset):
+        # 선택한 댓글의 답글까지 삭제되므로 삭제 후 실제 행 수로 재계산
+        with transaction.atomic():
+            post_ids = set(queryset.values_list('post_id', flat=True))
+            super().delete_queryset(request, queryset)
+            Post.objects.filter(pk__in=post_ids).recount()
@@ -10,3 +10,6 @@ class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
     verbose_name = '핵심 기능'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,122 @@
+"""
+Core 비동기 뷰 (ASGI)
+- 읽기 요청이 많은 엔드포인트(게시글 목록/상세, 댓글 목록, 검색)의 비동기 버전입니다.
+- ASGI로 실행할 때(config/asgi.py, ASYNC_VIEWS=True) urls.py가 동기 뷰 대신 등록합니다.
+- 목록/상세 조회는 비동기 ORM(async for, aget, acount)으로 실행하므로
+  DB 응답을 기다리는 동안 이벤트 루프가 다른 요청을 처리합니다.
+- 인증/권한 확인, 필터, 검증 값 조회 등 동기 ORM 코드는 sync_to_async로 스레드에서 실행합니다.
+- 쓰기 요청(POST/PUT/PATCH/DELETE)과 그 외 액션은 기존 동기 뷰 로직을 그대로 스레드에서 실행합니다.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from rest_framework.response import Response
+
+from .views import CommentViewSet, PostViewSet, SearchView
+
+
+class AsyncViewMixin:
+    """
+    DRF 뷰 비동기 처리 믹스인
+    - 핸들러(list, retrieve, get 등)가 코루틴 함수면 비동기로, 아니면 기존 dispatch를 스레드에서 실행합니다.
+    """
+
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        # 뷰셋의 as_view는 Django의 비동기 뷰 판별을 거치지 않으므로 직접 표시
+        return markcoroutinefunction(super().as_view(*args, **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        handler = getattr(self, request.method.lower(), None)
+        if not iscoroutinefunction(handler):
+            return await sync_to_async(super().dispatch)(request, *args, **kwargs)
+
+        # APIView.dispatch와 같은 순서 (인증/권한/스로틀 확인만 스레드에서 실행)
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    # ----- 조회 -----
+
+    def list_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    async def alist_response(self, request, *args, **kwargs):
+        """ListModelMixin.list의 비동기 버전"""
+        # 필터(django-filter의 FK 값 확인, 검색 색인)는 동기 ORM을 쓸 수 있으므로 스레드에서 구성
+        queryset = await sync_to_async(self.list_queryset)()
+        page = None
+        if self.paginator is not None:
+            paginate = getattr(self.paginator, 'apaginate_queryset', None)
+            if paginate is not None:
+                page = await paginate(queryset, request, view=self)
+            else:
+                page = await sync_to_async(self.paginate_queryset)(queryset)
+
+        objects = page if page is not None else [obj async for obj in queryset]
+        serializer = await self.aserialize(objects, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
+    async def aget_object(self):
+        """GenericAPIView.get_object의 비동기 버전"""
+        queryset = await sync_to_async(self.list_queryset)()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def aserialize(self, *args, **kwargs):
+        # 뷰가 비동기 get_serializer를 제공하면 사용 (LikedPostsContextMixin)
+        aget_serializer = getattr(self, 'aget_serializer', None)
+        if aget_serializer is not None:
+            return await aget_serializer(*args, **kwargs)
+        return self.get_serializer(*args, **kwargs)
+
+
+class AsyncPostViewSet(AsyncViewMixin, PostViewSet):
+    """게시글 API (목록/상세 비동기)"""
+
+    async def list(self, request, *args, **kwargs):
+        return await self.aconditional_response(
+            request, self.acached_response, self.alist_response, *args, **kwargs
+        )
+
+    async def retrieve(self, request, *args, **kwargs):
+        return await self.aconditional_response(
+            request, self.acached_response, self.aretrieve_post, *args, **kwargs
+        )
+
+    async def aretrieve_post(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        await instance.aincrease_views()  # 조회수 증가
+        serializer = await self.aserialize(instance)
+        return Response(serializer.data)
+
+
+class AsyncCommentViewSet(AsyncViewMixin, CommentViewSet):
+    """댓글 API (목록 비동기)"""
+
+    async def list(self, request, *args, **kwargs):
+        return await self.aconditional_response(request, self.alist_response, *args, **kwargs)
+
+
+class AsyncSearchView(AsyncViewMixin, SearchView):
+    """통합 검색 API (비동기)"""
+
+    async def get(self, request, *args, **kwargs):
+        return await self.acached_response(request, self.alist_response, *args, **kwargs)
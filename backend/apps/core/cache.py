@@ -0,0 +1,254 @@
+"""
+응답 캐시
+- 비인증 사용자는 공개 게시글만 보며 모두 같은 응답을 받으므로,
+  목록/상세/검색 응답 데이터를 캐시에 저장해 쿼리와 직렬화를 건너뜁니다.
+- 캐시 키에는 버전 번호가 들어가며, 게시글/댓글/첨부파일/좋아요가 바뀌면
+  시그널 핸들러가 버전을 올려 이전 응답을 한 번에 무효화합니다.
+- 같은 키를 동시에 요청하면 한 요청만 다시 계산하고 나머지는 결과를 기다립니다. (single-flight)
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+# 프로세스 내 single-flight 잠금 (키 해시로 분산)
+LOCK_STRIPES = 64
+
+
+class ResponseCache:
+    """버전 기반 응답 캐시"""
+    version_key = 'core:response:version'
+
+    def __init__(self):
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')]
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 60)
+
+    @property
+    def lock_timeout(self):
+        return getattr(settings, 'RESPONSE_CACHE_LOCK_TIMEOUT', 10)
+
+    # ----- 버전 -----
+
+    def version(self):
+        version = self.cache.get(self.version_key)
+        if version is None:
+            self.cache.add(self.version_key, 1, timeout=None)
+            version = self.cache.get(self.version_key, 1)
+        return version
+
+    async def aversion(self):
+        version = await self.cache.aget(self.version_key)
+        if version is None:
+            await self.cache.aadd(self.version_key, 1, timeout=None)
+            version = await self.cache.aget(self.version_key, 1)
+        return version
+
+    def invalidate(self):
+        """버전을 올려 저장된 모든 응답을 무효화"""
+        try:
+            self.cache.incr(self.version_key)
+        except ValueError:
+            # 버전 키가 없으면 새로 시작 (이전 키는 버전 1이 아니었을 수 있으므로 2부터)
+            self.cache.add(self.version_key, 2, timeout=None)
+
+    # ----- 조회/계산 -----
+
+    def make_key(self, request, version=None):
+        raw = f'{request.get_host()}{request.get_full_path()}'
+        digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+        return f'core:response:{version or self.version()}:{digest}'
+
+    async def amake_key(self, request):
+        return self.make_key(request, version=await self.aversion())
+
+    def get_or_compute(self, key, compute, label):
+        """
+        캐시된 값을 반환하거나 compute()로 계산해 저장
+        - compute()가 None을 반환하면 저장하지 않음 (404 등)
+        """
+        value = self.cache.get(key)
+        if value is not None:
+            self.record(label, 'hit')
+            return value
+
+        with self._locks[hash(key) % LOCK_STRIPES]:
+            # 잠금을 기다리는 동안 다른 스레드가 계산했을 수 있음
+            value = self.cache.get(key)
+            if value is not None:
+                self.record(label, 'hit')
+                return value
+
+            # 다른 프로세스가 계산 중이면 결과를 기다림
+            lock_key = f'{key}:lock'
+            if not self.cache.add(lock_key, 1, timeout=self.lock_timeout):
+                value = self._wait(key)
+                if value is not None:
+                    self.record(label, 'hit')
+                    return value
+
+            try:
+                self.record(label, 'miss')
+                value = compute()
+                if value is not None:
+                    self.cache.set(key, value, timeout=self.timeout)
+            finally:
+                self.cache.delete(lock_key)
+        return value
+
+    async def aget_or_compute(self, key, compute, label):
+        """
+        get_or_compute의 비동기 버전 (compute는 코루틴 함수)
+        - 같은 키의 동시 계산은 캐시의 잠금 키(add)로만 막습니다.
+        """
+        value = await self.cache.aget(key)
+        if value is not None:
+            self.record(label, 'hit')
+            return value
+
+        lock_key = f'{key}:lock'
+        if not await self.cache.aadd(lock_key, 1, timeout=self.lock_timeout):
+            value = await self._await(key)
+            if value is not None:
+                self.record(label, 'hit')
+                return value
+
+        try:
+            self.record(label, 'miss')
+            value = await compute()
+            if value is not None:
+                await self.cache.aset(key, value, timeout=self.timeout)
+        finally:
+            await self.cache.adelete(lock_key)
+        return value
+
+    async def _await(self, key, interval=0.05):
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            value = await self.cache.aget(key)
+            if value is not None:
+                return value
+        return None
+
+    def _wait(self, key, interval=0.05):
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(interval)
+            value = self.cache.get(key)
+            if value is not None:
+                return value
+        return None
+
+    # ----- 통계 -----
+
+    def record(self, label, outcome):
+        with self._stats_lock:
+            self.stats[(label, outcome)] += 1
+
+    def snapshot(self):
+        """{label: {'hit': n, 'miss': n}} 형태의 적중/실패 횟수 (이 프로세스 기준)"""
+        with self._stats_lock:
+            items = list(self.stats.items())
+        result = {}
+        for (label, outcome), count in sorted(items):
+            result.setdefault(label, {'hit': 0, 'miss': 0})[outcome] = count
+        return result
+
+
+response_cache = ResponseCache()
+
+
+class AnonymousCacheMixin:
+    """
+    비인증 GET 응답 캐시 믹스인
+    - cache_actions에 해당하는 액션의 200 응답 데이터를 캐시합니다.
+    - 인증 사용자의 요청은 항상 새로 계산합니다.
+    """
+    cache_actions = ('list', 'retrieve')
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        action = getattr(self, 'action', None) or 'list'
+        if (
+            request.method != 'GET'
+            or request.user.is_authenticated
+            or action not in self.cache_actions
+        ):
+            return handler(request, *args, **kwargs)
+
+        hit = True
+
+        def compute():
+            nonlocal hit
+            hit = False
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                compute.response = response
+                return None
+            return response.data
+
+        label = f'{type(self).__name__}.{action}'
+        data = response_cache.get_or_compute(response_cache.make_key(request), compute, label)
+        if data is None:
+            return compute.response
+        if hit:
+            self.cache_hit(request, *args, **kwargs)
+        response = Response(data)
+        response['X-Cache'] = 'HIT' if hit else 'MISS'
+        return response
+
+    async def acached_response(self, request, handler, *args, **kwargs):
+        """cached_response의 비동기 버전 (handler는 코루틴 함수, async_views.py)"""
+        action = getattr(self, 'action', None) or 'list'
+        if (
+            request.method != 'GET'
+            or request.user.is_authenticated
+            or action not in self.cache_actions
+        ):
+            return await handler(request, *args, **kwargs)
+
+        hit = True
+
+        async def compute():
+            nonlocal hit
+            hit = False
+            response = await handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                compute.response = response
+                return None
+            return response.data
+
+        label = f'{type(self).__name__}.{action}'
+        key = await response_cache.amake_key(request)
+        data = await response_cache.aget_or_compute(key, compute, label)
+        if data is None:
+            return compute.response
+        if hit:
+            await sync_to_async(self.cache_hit)(request, *args, **kwargs)
+        response = Response(data)
+        response['X-Cache'] = 'HIT' if hit else 'MISS'
+        return response
+
+    def cache_hit(self, request, *args, **kwargs):
+        """캐시된 응답을 반환할 때 호출 (조회수 증가 등 부수 효과용)"""
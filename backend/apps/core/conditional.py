@@ -0,0 +1,91 @@
+"""
+조건부 GET (ETag / Last-Modified)
+- 응답 본문을 직렬화하지 않고, 수정 시각/카운터만 조회하는 가벼운 쿼리로 검증자를 만듭니다.
+- 클라이언트가 보낸 If-None-Match / If-Modified-Since가 일치하면
+  쿼리셋 조회와 직렬화 없이 바로 304 Not Modified를 반환합니다.
+"""
+
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    조건부 GET 믹스인
+    - 뷰에서 get_validators()를 구현해 (검증 값 튜플, 최종 수정 시각)을 반환합니다.
+    - None을 반환하면 조건부 처리 없이 일반 응답을 반환합니다.
+    """
+    conditional_actions = ('list', 'retrieve')
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+
+    def get_validators(self, request, *args, **kwargs):
+        return None
+
+    def not_modified(self, request, *args, **kwargs):
+        """304 응답을 반환할 때 호출 (조회수 증가 등 부수 효과용)"""
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or self.action not in self.conditional_actions:
+            return handler(request, *args, **kwargs)
+
+        validators = self.get_validators(request, *args, **kwargs)
+        if validators is None:
+            return handler(request, *args, **kwargs)
+
+        etag, timestamp, response = self.check_validators(request, validators, *args, **kwargs)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        return self.set_validator_headers(response, etag, timestamp)
+
+    async def aconditional_response(self, request, handler, *args, **kwargs):
+        """conditional_response의 비동기 버전 (handler는 코루틴 함수, async_views.py)"""
+        if request.method not in ('GET', 'HEAD') or self.action not in self.conditional_actions:
+            return await handler(request, *args, **kwargs)
+
+        def evaluate():
+            # 검증 값 조회와 304 훅(조회수 등)은 동기 ORM이므로 한 번에 스레드에서 실행
+            validators = self.get_validators(request, *args, **kwargs)
+            if validators is None:
+                return None
+            return self.check_validators(request, validators, *args, **kwargs)
+
+        result = await sync_to_async(evaluate)()
+        if result is None:
+            return await handler(request, *args, **kwargs)
+
+        etag, timestamp, response = result
+        if response is None:
+            response = await handler(request, *args, **kwargs)
+        return self.set_validator_headers(response, etag, timestamp)
+
+    def check_validators(self, request, validators, *args, **kwargs):
+        """(ETag, 수정 시각, 304 응답 또는 None)"""
+        parts, last_modified = validators
+        # 같은 데이터라도 URL(페이지, 필터)과 사용자(공개 범위, 좋아요 여부)에 따라 응답이 다름
+        source = repr((
+            type(self).__name__, self.action, request.get_full_path(),
+            request.user.pk if request.user.is_authenticated else None, parts,
+        ))
+        etag = quote_etag(hashlib.md5(source.encode('utf-8')).hexdigest())
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is not None:
+            self.not_modified(request, *args, **kwargs)
+        return etag, timestamp, response
+
+    def set_validator_headers(self, response, etag, timestamp):
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+            patch_vary_headers(response, ['Authorization', 'Cookie'])
+        return response
@@ -0,0 +1,6 @@
+"""
+DB 연결 관리
+- mysql/: 연결 풀을 지원하는 MySQL 백엔드 (ENGINE='apps.core.db.mysql')
+- pool.py: 프로세스 단위 연결 풀
+- metrics.py: 연결 생성/재사용 통계와 요청별 연결 지표
+"""
@@ -0,0 +1,92 @@
+"""
+DB 연결 지표
+- 프로세스 누적: 새 연결 수와 연결에 걸린 시간, 풀 재사용/대기/시간 초과/상태 확인 실패 횟수
+- 요청별: 요청 처리 중 DB 연결을 얻은 횟수와 시간 (DatabaseConnectionMetricsMiddleware)
+  응답에 Server-Timing: db-connect 헤더로 붙이고, 요청 수 대비 연결 비율을 누적합니다.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.backends.signals import connection_created
+
+# 현재 요청의 연결 지표 (sync_to_async로 실행되는 스레드에도 전달됨)
+_current = ContextVar('db_connection_request', default=None)
+
+
+class ConnectionMetrics:
+    """프로세스 단위 DB 연결 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters = {
+                'requests': 0,               # 미들웨어를 거친 요청 수
+                'requests_connected': 0,     # DB 연결을 새로 얻은 요청 수
+                'connections': 0,            # Django가 연결을 얻은 횟수 (풀에서 빌린 경우 포함)
+                'new_connections': 0,        # 실제로 DB에 새로 연결한 횟수
+                'pool_reuses': 0,
+                'pool_waits': 0,
+                'pool_timeouts': 0,
+                'pool_recycled': 0,
+                'health_check_failures': 0,
+            }
+            self._connect_seconds = 0.0
+
+    def incr(self, name, n=1):
+        with self._lock:
+            self._counters[name] += n
+
+    def record_connect(self, seconds, new):
+        """연결을 얻는 데 걸린 시간 기록 (mysql 백엔드에서 호출)"""
+        with self._lock:
+            self._connect_seconds += seconds
+            if new:
+                self._counters['new_connections'] += 1
+        current = _current.get()
+        if current is not None:
+            current['seconds'] += seconds
+
+    def record_request(self, connects):
+        with self._lock:
+            self._counters['requests'] += 1
+            if connects:
+                self._counters['requests_connected'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            data = dict(self._counters)
+            data['connect_seconds'] = round(self._connect_seconds, 6)
+        data['connections_per_request'] = (
+            round(data['connections'] / data['requests'], 4) if data['requests'] else 0.0
+        )
+        return data
+
+
+connection_metrics = ConnectionMetrics()
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    connection_metrics.incr('connections')
+    current = _current.get()
+    if current is not None:
+        current['connects'] += 1
+
+
+connection_created.connect(_on_connection_created, dispatch_uid='core_db_connection_metrics')
+
+
+@contextmanager
+def request_scope():
+    """요청 하나의 연결 지표를 모으는 범위 ({'connects': 횟수, 'seconds': 연결 시간})"""
+    current = {'connects': 0, 'seconds': 0.0}
+    token = _current.set(current)
+    try:
+        yield current
+    finally:
+        _current.reset(token)
+        connection_metrics.record_request(current['connects'])
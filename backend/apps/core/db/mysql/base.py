@@ -0,0 +1,51 @@
+"""
+연결 풀을 지원하는 MySQL 백엔드
+- ENGINE='apps.core.db.mysql'로 지정하면 Django 기본 MySQL 백엔드와 같게 동작하면서
+  연결에 걸린 시간을 지표(apps/core/db/metrics.py)에 기록합니다.
+- DATABASES 항목에 POOL 설정이 있으면 연결을 풀(apps/core/db/pool.py)에서 빌리고,
+  Django가 연결을 닫을 때(요청 종료, CONN_MAX_AGE 만료) 풀에 반납합니다.
+- 풀을 쓸 때는 CONN_MAX_AGE=0으로 두어 요청이 끝날 때마다 반납되게 합니다.
+"""
+
+import time
+
+from django.db.backends.mysql import base
+
+from ..metrics import connection_metrics
+from ..pool import get_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    @property
+    def pool(self):
+        options = self.settings_dict.get('POOL')
+        if not options:
+            return None
+        return get_pool(self.alias, options)
+
+    def get_new_connection(self, conn_params):
+        started = time.perf_counter()
+        created = False
+
+        def connect():
+            nonlocal created
+            created = True
+            return super(DatabaseWrapper, self).get_new_connection(conn_params)
+
+        pool = self.pool
+        connection = pool.acquire(connect) if pool is not None else connect()
+        connection_metrics.record_connect(time.perf_counter() - started, new=created)
+        return connection
+
+    def _close(self):
+        pool = self.pool
+        if pool is None or self.connection is None:
+            return super()._close()
+        if self.in_atomic_block or (self.errors_occurred and not self.is_usable()):
+            # 트랜잭션 도중 닫히거나 오류가 난 연결은 재사용하지 않음
+            with self.wrap_database_errors:
+                pool.discard(self.connection)
+            return
+        with self.wrap_database_errors:
+            pool.release(self.connection)
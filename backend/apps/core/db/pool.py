@@ -0,0 +1,187 @@
+"""
+DB 연결 풀
+- 프로세스마다 DB 별칭(alias)별로 하나씩 만들어지며, 요청이 끝나 Django가 연결을 닫으면
+  실제로 끊지 않고 풀에 돌려놓았다가 다음 요청(다른 스레드여도)에 다시 빌려줍니다.
+- SIZE: 풀에 유지하는 연결 수, MAX_OVERFLOW: 순간적으로 더 열 수 있는 연결 수 (반납 시 바로 닫음)
+- TIMEOUT: 연결이 모두 사용 중일 때 기다리는 최대 시간(초), 넘으면 OperationalError
+- RECYCLE: 이 시간(초)보다 오래된 연결은 닫고 새로 연결 (MySQL wait_timeout보다 짧게)
+- PING_AFTER: 이 시간(초) 이상 쉬던 연결은 빌려주기 전에 ping으로 상태 확인
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+from django.db import OperationalError
+
+from .metrics import connection_metrics
+
+DEFAULTS = {
+    'SIZE': 5,
+    'MAX_OVERFLOW': 10,
+    'TIMEOUT': 10.0,
+    'RECYCLE': 3600,
+    'PING_AFTER': 30,
+}
+
+
+class ConnectionPool:
+    """
+    스레드 안전한 연결 풀
+    - acquire(connect): 쉬고 있는 연결을 빌려주거나, 한도 안에서 connect()로 새로 연결
+    - release(conn): 연결을 풀에 반납 (한도를 넘은 연결은 닫음)
+    - discard(conn): 상태를 알 수 없는 연결을 닫고 한도에서 제외
+    """
+
+    def __init__(self, alias, size, max_overflow, timeout, recycle, ping_after):
+        self.alias = alias
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_after = ping_after
+        self._idle = deque()   # (연결, 반납 시각), 오른쪽이 가장 최근에 반납된 연결
+        self._created = {}     # id(연결) -> 연결 시각
+        self._in_use = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self):
+        return self.size + self.max_overflow
+
+    def acquire(self, connect):
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._idle:
+                    # 최근에 반납된 연결부터 사용 (오래 쉰 연결은 자연스럽게 RECYCLE 대상이 됨)
+                    conn, returned_at = self._idle.pop()
+                    self._in_use += 1
+                    break
+                if self._in_use + len(self._idle) < self.limit:
+                    conn = None
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    connection_metrics.incr('pool_timeouts')
+                    raise OperationalError(
+                        f"DB 연결 풀({self.alias})에서 {self.timeout}초 안에 연결을 얻지 못했습니다. "
+                        f"(최대 {self.limit}개 사용 중)"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+        if waited:
+            connection_metrics.incr('pool_waits')
+        try:
+            if conn is not None:
+                conn = self._check(conn, returned_at)
+            if conn is None:
+                conn = connect()
+                self._created[id(conn)] = time.monotonic()
+            else:
+                connection_metrics.incr('pool_reuses')
+        except BaseException:
+            self._return_slot()
+            raise
+        return conn
+
+    def _check(self, conn, returned_at):
+        """재사용할 연결 확인, 쓸 수 없으면 닫고 None 반환"""
+        now = time.monotonic()
+        if self.recycle and now - self._created.get(id(conn), now) > self.recycle:
+            connection_metrics.incr('pool_recycled')
+            self._close(conn)
+            return None
+        if now - returned_at >= self.ping_after:
+            try:
+                conn.ping()
+            except Exception:
+                connection_metrics.incr('health_check_failures')
+                self._close(conn)
+                return None
+        return conn
+
+    def release(self, conn):
+        try:
+            # 끝나지 않은 트랜잭션이 다음 사용자에게 넘어가지 않도록 정리
+            conn.rollback()
+        except Exception:
+            self.discard(conn)
+            return
+        with self._cond:
+            self._in_use -= 1
+            if len(self._idle) < self.size:
+                self._idle.append((conn, time.monotonic()))
+                conn = None
+            self._cond.notify()
+        if conn is not None:
+            self._close(conn)
+
+    def discard(self, conn):
+        self._close(conn)
+        self._return_slot()
+
+    def _return_slot(self):
+        with self._cond:
+            self._in_use -= 1
+            self._cond.notify()
+
+    def _close(self, conn):
+        self._created.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def close_all(self):
+        """쉬고 있는 연결을 모두 닫음 (사용 중인 연결은 반납 시 정리)"""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+        for conn, _ in idle:
+            self._close(conn)
+
+    def snapshot(self):
+        with self._cond:
+            return {
+                'size': self.size,
+                'max_overflow': self.max_overflow,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+_pools_pid = os.getpid()
+
+
+def get_pool(alias, options):
+    """DB 별칭의 연결 풀 (fork된 워커 프로세스에서는 부모의 연결을 쓰지 않도록 새로 만듦)"""
+    global _pools_pid
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            _pools.clear()
+            _pools_pid = os.getpid()
+        pool = _pools.get(alias)
+        if pool is None:
+            config = {**DEFAULTS, **(options or {})}
+            pool = _pools[alias] = ConnectionPool(
+                alias,
+                size=int(config['SIZE']),
+                max_overflow=int(config['MAX_OVERFLOW']),
+                timeout=float(config['TIMEOUT']),
+                recycle=float(config['RECYCLE']),
+                ping_after=float(config['PING_AFTER']),
+            )
+        return pool
+
+
+def pool_snapshot():
+    """DB 별칭별 연결 풀 상태"""
+    with _pools_lock:
+        pools = dict(_pools) if _pools_pid == os.getpid() else {}
+    return {alias: pool.snapshot() for alias, pool in pools.items()}
@@ -0,0 +1,91 @@
+"""
+읽기 복제본 라우팅
+- ReplicaRouter: 쓰기와 마이그레이션은 항상 default, 읽기는 ReplicaReadMixin을 쓴 뷰의
+  안전한 요청(GET/HEAD/OPTIONS)에서만 복제본(settings.DATABASE_REPLICAS)으로 보냅니다.
+  그 외 코드(관리자, 인증, 작업 워커, 관리 명령어)의 읽기는 default에서 실행됩니다.
+- 쓰기 직후 읽기 일관성(read-your-writes): 쓰기 요청이 성공하면 REPLICA_PIN_SECONDS 동안
+  같은 클라이언트(쿠키)와 같은 사용자(캐시)의 읽기를 default로 고정합니다. (ReplicaPinningMiddleware)
+"""
+
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+PIN_COOKIE = 'db_primary'
+PIN_CACHE_PREFIX = 'db-pin:'
+
+# 현재 요청의 읽기를 복제본으로 보낼지 여부 (sync_to_async로 실행되는 스레드에도 전달됨)
+_read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+def replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def pin_seconds():
+    return getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+
+def is_pinned(request):
+    """최근에 쓰기를 한 클라이언트/사용자인지 확인"""
+    if request.COOKIES.get(PIN_COOKIE):
+        return True
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return bool(cache.get(f'{PIN_CACHE_PREFIX}{user.pk}'))
+    return False
+
+
+def pin(request, response):
+    """쓰기 요청 후 일정 시간 동안 읽기를 default로 고정"""
+    seconds = pin_seconds()
+    if seconds <= 0:
+        return
+    response.set_cookie(PIN_COOKIE, '1', max_age=seconds, httponly=True, samesite='Lax')
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        # 쿠키를 저장하지 않는 API 클라이언트(JWT)를 위해 사용자 기준으로도 고정
+        cache.set(f'{PIN_CACHE_PREFIX}{user.pk}', 1, seconds)
+
+
+class ReplicaRouter:
+    """default + 읽기 복제본 DB 라우터"""
+
+    def db_for_read(self, model, **hints):
+        aliases = replicas()
+        if aliases and _read_from_replica.get():
+            return random.choice(aliases)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 default와 같은 데이터이므로 서로 다른 별칭에서 읽은 객체도 연결 허용
+        aliases = {'default', *replicas()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
+
+
+class ReplicaReadMixin:
+    """
+    안전한 요청의 ORM 읽기를 복제본으로 보내는 뷰 믹스인
+    - 인증/권한 확인(initial)은 default에서 실행한 뒤, 고정되지 않은 클라이언트만 복제본으로 전환
+    - 응답을 마무리할 때(finalize_response) 다시 default로 되돌림
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if replicas() and request.method in SAFE_METHODS and not is_pinned(request):
+            _read_from_replica.set(True)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        _read_from_replica.set(False)
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,193 @@
+"""
+첨부파일/썸네일 다운로드
+- 권한 확인 후 파일을 FileResponse로 스트리밍합니다.
+  gunicorn 등 wsgi.file_wrapper를 지원하는 서버는 os.sendfile로 커널에서 바로 전송합니다. (zero-copy)
+- Range 요청(이어받기, 동영상/PDF 부분 조회)과 조건부 요청(ETag, If-Modified-Since, If-Range)을 지원합니다.
+- ATTACHMENT_SENDFILE 설정 시 파일 전송을 프록시(Nginx X-Accel-Redirect, Apache X-Sendfile)에 맡기고
+  Django는 권한 확인과 헤더만 처리합니다.
+"""
+
+import io
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe, quote_etag
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+SENDFILE_HEADERS = {
+    'x-accel-redirect': 'X-Accel-Redirect',
+    'x-sendfile': 'X-Sendfile',
+}
+
+
+class FileRange:
+    """
+    파일의 일부 구간(start부터 length 바이트)만 보이는 파일 객체
+    - FileResponse가 seek/tell로 Content-Length를 구간 길이로 계산합니다.
+    - fileno()를 그대로 넘기므로 sendfile은 현재 위치부터 Content-Length만큼 전송합니다.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.start = start
+        self.length = length
+        self.position = 0
+        self.file.seek(start)
+
+    def read(self, size=-1):
+        remaining = self.length - self.position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        data = self.file.read(size)
+        self.position += len(data)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.position, io.SEEK_END: self.length}[whence]
+        self.position = max(0, min(self.length, base + offset))
+        self.file.seek(self.start + self.position)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def seekable(self):
+        return True
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    Range 헤더를 (start, end) 구간으로 변환 (end 포함)
+    - 헤더가 없거나 형식이 다르거나 여러 구간이면 None (전체 응답)
+    - 만족할 수 없는 구간이면 ValueError
+    """
+    match = RANGE_RE.match(header.replace(' ', '')) if header else None
+    if not match or match.group(0) == 'bytes=-':
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    else:
+        # bytes=-500: 마지막 500바이트
+        suffix = int(last)
+        if suffix == 0:
+            raise ValueError
+        start, end = max(size - suffix, 0), size - 1
+    if start >= size:
+        raise ValueError
+    return start, end
+
+
+def if_range_matches(request, etag, last_modified):
+    """If-Range가 없거나 현재 파일과 일치하면 True (일치하지 않으면 전체 파일을 보냄)"""
+    value = request.META.get('HTTP_IF_RANGE')
+    if not value:
+        return True
+    if value.startswith(('"', 'W/')):
+        # 부분 응답에는 강한 ETag 비교만 허용
+        return value == etag
+    return parse_http_date_safe(value) == last_modified
+
+
+def serve_attachment(request, attachment, public=True):
+    """첨부파일 다운로드 응답 (원본 파일명으로 저장되도록 Content-Disposition: attachment)"""
+    return serve_file(
+        request,
+        attachment.file.storage.path(attachment.file.name),
+        content_type=mimetypes.guess_type(attachment.original_name)[0],
+        etag=attachment.content_hash,
+        public=public,
+        filename=attachment.original_name,
+    )
+
+
+def serve_file(request, path, content_type=None, etag=None, public=True, filename=None):
+    """
+    MEDIA_ROOT 아래 파일 응답
+    - etag가 없으면 파일 크기와 수정 시각으로 만듭니다.
+    - filename이 있으면 다운로드(attachment), 없으면 브라우저에 바로 표시(inline)합니다.
+    - public=False면 공유 캐시(프록시/CDN)에 저장되지 않도록 private으로 표시합니다.
+    - 파일이 없으면 None
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    size = stat.st_size
+    last_modified = int(stat.st_mtime)
+    # 내용 해시가 있으면 강한 ETag로 사용 (같은 내용 = 같은 ETag)
+    etag = quote_etag(etag or f'{size:x}-{int(stat.st_mtime_ns):x}')
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        content_type = content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        mode = getattr(settings, 'ATTACHMENT_SENDFILE', '')
+        if mode:
+            response = _offload_response(path, content_type, mode)
+        else:
+            response = _file_response(request, path, size, content_type, etag, last_modified)
+        if filename and response.status_code != 416:
+            response['Content-Disposition'] = content_disposition_header(True, filename)
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    if public:
+        patch_cache_control(response, public=True, max_age=getattr(settings, 'ATTACHMENT_CACHE_MAX_AGE', 0))
+    else:
+        patch_cache_control(response, private=True, max_age=0)
+    return response
+
+
+def _file_response(request, path, size, content_type, etag, last_modified):
+    try:
+        byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+    if byte_range is not None and not if_range_matches(request, etag, last_modified):
+        byte_range = None
+
+    file = open(path, 'rb')
+    if byte_range is None:
+        return FileResponse(file, content_type=content_type)
+
+    start, end = byte_range
+    response = FileResponse(FileRange(file, start, end - start + 1), content_type=content_type, status=206)
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
+
+
+def _offload_response(path, content_type, mode):
+    """
+    프록시에 파일 전송을 맡기는 빈 응답
+    - x-accel-redirect: ATTACHMENT_SENDFILE_PREFIX + MEDIA_ROOT 기준 경로 (Nginx internal location)
+    - x-sendfile: 파일의 절대 경로
+    - Range/sendfile 처리는 프록시가 담당합니다.
+    """
+    header = SENDFILE_HEADERS[mode]
+    response = HttpResponse(content_type=content_type)
+    if mode == 'x-accel-redirect':
+        prefix = getattr(settings, 'ATTACHMENT_SENDFILE_PREFIX', '/protected/')
+        name = os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, '/')
+        response[header] = prefix.rstrip('/') + '/' + quote(name)
+    else:
+        response[header] = path
+    return response
@@ -0,0 +1,34 @@
+"""
+Core 필터 백엔드
+- 게시글 목록의 검색/정렬 필터를 정의합니다.
+"""
+
+from rest_framework.filters import OrderingFilter, SearchFilter
+
+from .search import search_posts
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    전문 검색 필터
+    - ?search=검색어 를 LIKE 검색 대신 검색 백엔드(search.py)로 처리합니다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = ' '.join(self.get_search_terms(request))
+        if not query:
+            return queryset
+        return search_posts(queryset, query)
+
+
+class RelevanceOrderingFilter(OrderingFilter):
+    """
+    정렬 필터
+    - 검색 중이고 ?ordering= 이 지정되지 않았다면 관련도 순서를 유지합니다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        searching = request.query_params.get(FullTextSearchFilter.search_param)
+        if searching and not request.query_params.get(self.ordering_param):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
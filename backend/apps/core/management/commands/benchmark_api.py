@@ -0,0 +1,197 @@
+"""
+REST API 벤치마크 명령어
+- Django 테스트 클라이언트로 API를 프로세스 안에서 반복 호출하고, 시나리오별
+  초당 요청 수, 지연 시간(p50/p95/p99), 요청당 쿼리 수를 출력합니다. (네트워크/서버 워커 제외)
+- 시나리오: list(게시글 목록), detail(상세), search(검색), tree(댓글 스레드 목록),
+  like(좋아요 토글), comment(댓글 작성), upload(파일 업로드)
+- 데이터는 generate_data로 먼저 만들어 두세요. 쓰기 시나리오가 만든 댓글/첨부파일은 끝나면 삭제합니다.
+- DB는 현재 설정을 그대로 사용합니다.
+    로컬(SQLite): DB_ENGINE=sqlite python manage.py migrate && DB_ENGINE=sqlite python manage.py generate_data
+                  DB_ENGINE=sqlite python manage.py benchmark_api
+    MySQL(docker compose): docker compose up -d db 후 DB_PORT=3218 python manage.py benchmark_api
+- 동시 접속 부하(서버 워커 포함)는 loadtest 명령어로 측정합니다.
+- 사용법: python manage.py benchmark_api [--iterations 200] [--scenarios list detail] [--json result.json]
+"""
+
+import json
+import random
+import statistics
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.core.models import Attachment, Comment, Post
+
+from .generate_data import BENCH_DOMAIN, WORDS, bench_users
+
+SCENARIOS = ['list', 'detail', 'search', 'tree', 'like', 'comment', 'upload']
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = 'REST API 주요 엔드포인트의 처리량, 지연 시간, 요청당 쿼리 수를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS)
+        parser.add_argument('--iterations', type=int, default=200, help='시나리오별 측정 요청 수')
+        parser.add_argument('--warmup', type=int, default=20, help='시나리오별 예열 요청 수')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--allow-cache', action='store_true', help='응답 캐시 적중을 허용 (기본: 캐시 우회)')
+        parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.options = options
+        self.user = bench_users().order_by('pk').first()
+        self.post_ids = list(
+            Post.objects.filter(is_public=True, author__email__endswith=f'@{BENCH_DOMAIN}')
+            .values_list('pk', flat=True)
+        )
+        if self.user is None or not self.post_ids:
+            raise CommandError('벤치마크 데이터가 없습니다. 먼저 generate_data를 실행하세요.')
+
+        host = next((h for h in settings.ALLOWED_HOSTS if h and h != '*' and not h.startswith('.')), 'localhost')
+        self.anonymous = APIClient(HTTP_HOST=host)
+        self.authenticated = APIClient(HTTP_HOST=host)
+        self.authenticated.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        self.created_comments = []
+        self.created_attachments = []
+
+        self.stdout.write(
+            f"DB: {connections['default'].vendor}, 게시글 {len(self.post_ids):,}건, "
+            f"시나리오별 {options['iterations']}회"
+        )
+        results = {}
+        try:
+            for name in options['scenarios']:
+                results[name] = self.run(name)
+                self.report(name, results[name])
+        finally:
+            self.cleanup()
+
+        if options['json']:
+            with open(options['json'], 'w', encoding='utf-8') as f:
+                json.dump({
+                    'vendor': connections['default'].vendor,
+                    'posts': len(self.post_ids),
+                    'iterations': options['iterations'],
+                    'results': results,
+                }, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과 저장: {options['json']}")
+
+    # ----- 측정 -----
+
+    def run(self, name):
+        request = getattr(self, f'request_{name}')
+        for _ in range(self.options['warmup']):
+            request()
+
+        latencies, queries, errors = [], [], 0
+        started = time.perf_counter()
+        for _ in range(self.options['iterations']):
+            with ExitStack() as stack:
+                # 읽기 복제본으로 간 쿼리도 함께 집계
+                contexts = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in connections]
+                request_started = time.perf_counter()
+                response = request()
+                elapsed = time.perf_counter() - request_started
+            if response.status_code >= 400:
+                errors += 1
+                continue
+            latencies.append(elapsed * 1000)
+            queries.append(sum(len(context.captured_queries) for context in contexts))
+        total = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            'requests': len(latencies),
+            'errors': errors,
+            'rps': round(len(latencies) / total, 1) if total else 0.0,
+            'p50': round(percentile(latencies, 50), 2),
+            'p95': round(percentile(latencies, 95), 2),
+            'p99': round(percentile(latencies, 99), 2),
+            'queries': round(statistics.mean(queries), 1) if queries else 0.0,
+            'max_queries': max(queries, default=0),
+        }
+
+    def report(self, name, result):
+        self.stdout.write(
+            f"{name:<8} {result['requests']:>6}건 오류 {result['errors']:>3}  {result['rps']:>8.1f} req/s  "
+            f"p50 {result['p50']:>7.2f}ms  p95 {result['p95']:>7.2f}ms  p99 {result['p99']:>7.2f}ms  "
+            f"쿼리 {result['queries']:>5.1f} (최대 {result['max_queries']})"
+        )
+
+    def url(self, path):
+        if self.options['allow_cache']:
+            return path
+        return path + ('&' if '?' in path else '?') + f'nocache={self.rng.random()}'
+
+    # ----- 시나리오 -----
+
+    def request_list(self):
+        page = self.rng.randint(1, 5)
+        return self.anonymous.get(self.url(f'/api/posts/?page={page}'))
+
+    def request_detail(self):
+        return self.anonymous.get(self.url(f'/api/posts/{self.rng.choice(self.post_ids)}/'))
+
+    def request_search(self):
+        query = '+'.join(self.rng.sample(WORDS, self.rng.choice([1, 2])))
+        return self.anonymous.get(self.url(f'/api/search/?q={query}'))
+
+    def request_tree(self):
+        return self.anonymous.get(self.url(f'/api/posts/{self.rng.choice(self.post_ids)}/comments/?mode=tree'))
+
+    def request_like(self):
+        return self.authenticated.post(f'/api/posts/{self.rng.choice(self.post_ids)}/like/')
+
+    def request_comment(self):
+        response = self.authenticated.post(
+            f'/api/posts/{self.rng.choice(self.post_ids)}/comments/',
+            {'content': ' '.join(self.rng.sample(WORDS, 5))},
+            format='json',
+        )
+        if response.status_code == 201:
+            self.created_comments.append(response.data['id'])
+        return response
+
+    def request_upload(self):
+        content = self.rng.randbytes(self.rng.randint(1024, 64 * 1024))
+        response = self.authenticated.post(
+            f'/api/posts/{self.rng.choice(self.post_ids)}/upload_file/',
+            {'file': SimpleUploadedFile('bench.pdf', content, content_type='application/pdf')},
+            format='multipart',
+        )
+        if response.status_code == 201:
+            self.created_attachments.append(response.data['id'])
+        return response
+
+    # ----- 정리 -----
+
+    def cleanup(self):
+        """쓰기 시나리오가 만든 댓글/첨부파일 삭제 (좋아요는 토글이라 그대로 둠)"""
+        if self.created_comments:
+            post_ids = set(
+                Comment.objects.filter(pk__in=self.created_comments).values_list('post_id', flat=True)
+            )
+            Comment.objects.filter(pk__in=self.created_comments).delete()
+            Post.objects.filter(pk__in=post_ids).recount()
+        for attachment in Attachment.objects.filter(pk__in=self.created_attachments):
+            attachment.delete()
+        if self.created_comments or self.created_attachments:
+            self.stdout.write(
+                f'정리: 댓글 {len(self.created_comments)}건, 첨부파일 {len(self.created_attachments)}건 삭제'
+            )
@@ -0,0 +1,111 @@
+"""
+검색 성능 벤치마크 명령어
+- 게시글 수를 늘려가며 LIKE 검색과 전문 검색 백엔드의 응답 시간을 비교합니다.
+- 벤치마크용 사용자(bench-search@example.com)로 가짜 게시글을 생성하므로 개발용 DB에서 실행하세요.
+- 사용법: python manage.py benchmark_search --sizes 10000 100000 1000000 [--cleanup]
+"""
+
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from apps.core.models import Post
+from apps.core.search import get_search_backend
+
+BENCH_EMAIL = 'bench-search@example.com'
+
+WORDS = [
+    '게시판', '공지사항', '회의록', '프로젝트', '일정', '보고서', '데이터베이스', '서버',
+    '배포', '장애', '점검', '교육', '채용', '예산', '디자인', '개발', '테스트', '문서',
+    'django', 'react', 'mysql', 'docker', 'deploy', 'release', 'backup', 'search',
+]
+
+
+def make_text(rng, length):
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+class Command(BaseCommand):
+    help = '게시글 수별(기본 1만/10만/100만) LIKE 검색과 전문 검색의 지연 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+        parser.add_argument('--queries', type=int, default=50, help='크기별 측정 검색 횟수')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--cleanup', action='store_true', help='종료 후 벤치마크 게시글 삭제')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        User = get_user_model()
+        user, _ = User.objects.get_or_create(
+            email=BENCH_EMAIL, defaults={'username': 'bench-search'}
+        )
+        backend = get_search_backend()
+        self.stdout.write(f'검색 백엔드: {type(backend).__name__}')
+
+        for size in sorted(options['sizes']):
+            self.fill(user, size, options['batch_size'], rng)
+            queries = [
+                ' '.join(rng.sample(WORDS, rng.choice([1, 2])))
+                for _ in range(options['queries'])
+            ]
+            like = self.measure(queries, lambda qs, q: qs.filter(
+                Q(title__icontains=q) | Q(content__icontains=q)
+            ))
+            fulltext = self.measure(queries, backend.search)
+            self.report(size, 'LIKE', like)
+            self.report(size, '전문 검색', fulltext)
+
+        if options['cleanup']:
+            deleted, _ = Post.objects.filter(author=user).delete()
+            user.delete()
+            self.stdout.write(f'벤치마크 데이터 {deleted}건을 삭제했습니다.')
+
+    def fill(self, user, size, batch_size, rng):
+        """벤치마크 사용자의 게시글이 size개가 되도록 bulk_create로 채움"""
+        backend = get_search_backend()
+        existing = Post.objects.filter(author=user).count()
+        started = time.perf_counter()
+        while existing < size:
+            count = min(batch_size, size - existing)
+            posts = Post.objects.bulk_create([
+                Post(
+                    title=make_text(rng, 4),
+                    content=make_text(rng, 60),
+                    author=user,
+                )
+                for _ in range(count)
+            ])
+            existing += count
+            # bulk_create는 post_save 시그널을 보내지 않으므로 직접 색인
+            if all(post.pk for post in posts):
+                for post in posts:
+                    backend.index_post(post)
+        self.stdout.write(
+            f'[{size:,}건] 데이터 준비 {time.perf_counter() - started:.1f}s'
+        )
+
+    def measure(self, queries, search):
+        """검색 한 번 = 전체 건수 COUNT + 첫 페이지(10건) 조회 (SearchView와 동일)"""
+        base = Post.objects.filter(is_public=True)
+        timings = []
+        for query in queries:
+            started = time.perf_counter()
+            queryset = search(base, query)
+            queryset.count()
+            list(queryset[:10])
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+    def report(self, size, label, timings):
+        timings = sorted(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f'[{size:,}건] {label:<6} 평균 {statistics.mean(timings):8.2f}ms  '
+            f'p50 {statistics.median(timings):8.2f}ms  p95 {p95:8.2f}ms'
+        )
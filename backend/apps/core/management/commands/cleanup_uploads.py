@@ -0,0 +1,38 @@
+"""
+중단된 분할 업로드 정리 명령어
+- 일정 시간 동안 청크가 들어오지 않은 업로드 세션과 임시 파일을 삭제합니다.
+- 사용법: python manage.py cleanup_uploads [--hours 24]
+"""
+
+import os
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.core.models import UploadSession
+from apps.core.uploads import hashers, temp_path
+
+
+class Command(BaseCommand):
+    help = '오래된 분할 업로드 세션과 임시 파일을 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=int,
+            default=24,
+            help='마지막 청크 이후 이 시간이 지난 세션을 삭제 (기본값: 24)',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['hours'])
+        removed = 0
+        for session in UploadSession.objects.filter(updated_at__lt=cutoff).iterator():
+            hashers.discard(session.pk)
+            path = temp_path(session)
+            if os.path.exists(path):
+                os.remove(path)
+            session.delete()
+            removed += 1
+        self.stdout.write(self.style.SUCCESS(f'업로드 세션 {removed}개를 정리했습니다.'))
@@ -0,0 +1,133 @@
+"""
+첨부파일 중복 제거 명령어
+- 날짜별 경로(attachments/%Y/%m/)에 저장된 기존 파일을 병렬로 해시해
+  내용 주소 경로(attachments/cas/...)로 옮기고, 같은 내용의 파일은 하나만 남깁니다.
+- 파일을 먼저 새 경로에 만들고 DB를 갱신한 뒤 이전 파일을 지우므로
+  중간에 중단되어도 참조가 끊긴 첨부파일은 생기지 않습니다.
+- 배치마다 새 경로 파일을 잠근 트랜잭션 안에서 DB를 갱신합니다. (storage.lock_blob)
+- 사용법: python manage.py dedupe_attachments [--workers 4] [--batch-size 500] [--dry-run]
+"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.core.models import Attachment
+from apps.core.storage import attachment_storage, content_addressed_name, hash_path, lock_blob
+
+
+class Command(BaseCommand):
+    help = '기존 첨부파일을 내용 주소 저장소로 옮기고 중복 파일을 제거합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='파일 해시를 계산할 스레드 수 (기본값: 4)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 처리할 첨부파일 수 (기본값: 500)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='파일과 DB를 바꾸지 않고 절약되는 용량만 계산',
+        )
+
+    def handle(self, *args, **options):
+        self.dry_run = options['dry_run']
+        self.seen = set()  # dry-run에서 이미 존재하는 것으로 볼 내용 주소 경로
+        totals = {'migrated': 0, 'duplicates': 0, 'missing': 0, 'saved': 0}
+
+        queryset = Attachment.objects.exclude(file='').order_by('pk').only(
+            'pk', 'file', 'original_name', 'file_size', 'content_hash'
+        )
+        last_pk = 0
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            while True:
+                page = list(queryset.filter(pk__gt=last_pk)[:options['batch_size']])
+                if not page:
+                    break
+                last_pk = page[-1].pk
+                batch = [
+                    attachment for attachment in page
+                    if not attachment_storage.is_content_addressed(attachment.file.name)
+                ]
+                if batch:
+                    hashes = executor.map(self.hash_attachment, batch)
+                    self.process_batch(list(zip(batch, hashes)), totals)
+
+        label = '[dry-run] ' if self.dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"{label}이동 {totals['migrated']}개, 중복 제거 {totals['duplicates']}개, "
+            f"파일 없음 {totals['missing']}개, 절약 용량 {totals['saved']:,} bytes"
+        ))
+
+    def hash_attachment(self, attachment):
+        """파일 해시 (파일이 없으면 None)"""
+        try:
+            return hash_path(attachment_storage.path(attachment.file.name))
+        except FileNotFoundError:
+            return None
+
+    def process_batch(self, results, totals):
+        updated, stale = [], set()
+        # 내용 주소 파일을 잠근 채 DB까지 갱신 (같은 파일의 정리 작업이 그 사이에 지우지 않도록)
+        with transaction.atomic():
+            for attachment, content_hash in results:
+                if content_hash is None:
+                    totals['missing'] += 1
+                    self.stderr.write(f'파일 없음: #{attachment.pk} {attachment.file.name}')
+                    continue
+
+                old_name = attachment.file.name
+                new_name = content_addressed_name(content_hash, old_name)
+                size = os.path.getsize(attachment_storage.path(old_name))
+                if not self.dry_run:
+                    lock_blob(new_name)
+                if self.exists(new_name):
+                    totals['duplicates'] += 1
+                    totals['saved'] += size
+                else:
+                    totals['migrated'] += 1
+                    self.place(old_name, new_name)
+
+                attachment.file.name = new_name
+                attachment.content_hash = content_hash
+                attachment.file_size = size
+                updated.append(attachment)
+                stale.add(old_name)
+
+            if self.dry_run or not updated:
+                return
+            Attachment.objects.bulk_update(updated, ['file', 'content_hash', 'file_size'])
+        # DB가 새 경로를 가리킨 뒤 이전 파일 삭제
+        for name in stale:
+            attachment_storage.delete(name)
+
+    def exists(self, name):
+        if self.dry_run:
+            found = name in self.seen or attachment_storage.exists(name)
+            self.seen.add(name)
+            return found
+        return attachment_storage.exists(name)
+
+    def place(self, old_name, new_name):
+        """이전 파일을 내용 주소 경로에 만듦 (가능하면 하드 링크, 아니면 복사)"""
+        if self.dry_run:
+            return
+        source, target = attachment_storage.path(old_name), attachment_storage.path(new_name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            os.link(source, target)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(source, target)
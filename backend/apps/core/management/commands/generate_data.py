@@ -0,0 +1,215 @@
+"""
+벤치마크용 테스트 데이터 생성 명령어
+- 사용자, 카테고리, 게시글, 댓글, 좋아요, 첨부파일을 bulk_create로 한 번에 생성합니다.
+- 생성한 사용자는 이메일이 @bench.example.com 으로 끝나며, --cleanup으로 관련 데이터와 함께 삭제합니다.
+- 같은 --seed면 같은 데이터가 만들어지므로 벤치마크(benchmark_api) 결과를 비교할 수 있습니다.
+- 사용법:
+    python manage.py generate_data --scale small
+    python manage.py generate_data --users 1000 --posts 100000 --comments 5 --likes 10 --attachments 2000
+    python manage.py generate_data --cleanup
+"""
+
+import hashlib
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.core.models import Attachment, Category, Comment, Post
+from apps.core.search import get_search_backend
+
+BENCH_DOMAIN = 'bench.example.com'
+BENCH_PASSWORD = 'bench-password-1234'
+BENCH_CATEGORY_PREFIX = '벤치마크 '
+
+# 규모별 기본값 (사용자, 카테고리, 게시글, 게시글당 댓글, 게시글당 좋아요, 첨부파일)
+SCALES = {
+    'small': (50, 5, 1000, 3, 5, 100),
+    'medium': (500, 10, 20000, 5, 10, 1000),
+    'large': (5000, 20, 200000, 5, 20, 10000),
+}
+
+WORDS = [
+    '게시판', '공지사항', '회의록', '프로젝트', '일정', '보고서', '데이터베이스', '서버',
+    '배포', '장애', '점검', '교육', '채용', '예산', '디자인', '개발', '테스트', '문서',
+    'django', 'react', 'mysql', 'docker', 'deploy', 'release', 'backup', 'search',
+]
+
+
+def make_text(rng, length):
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def bench_users():
+    return get_user_model().objects.filter(email__endswith=f'@{BENCH_DOMAIN}')
+
+
+class Command(BaseCommand):
+    help = '벤치마크용 사용자/카테고리/게시글/댓글/좋아요/첨부파일을 대량 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=SCALES, default='small', help='기본 규모 (기본값: small)')
+        parser.add_argument('--users', type=int, help='사용자 수')
+        parser.add_argument('--categories', type=int, help='카테고리 수')
+        parser.add_argument('--posts', type=int, help='게시글 수')
+        parser.add_argument('--comments', type=int, help='게시글당 평균 댓글 수')
+        parser.add_argument('--likes', type=int, help='게시글당 평균 좋아요 수')
+        parser.add_argument('--attachments', type=int, help='첨부파일 수 (내용이 같은 파일 포함)')
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--cleanup', action='store_true', help='생성한 벤치마크 데이터를 삭제하고 종료')
+
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            self.cleanup()
+            return
+
+        defaults = dict(zip(
+            ('users', 'categories', 'posts', 'comments', 'likes', 'attachments'),
+            SCALES[options['scale']],
+        ))
+        counts = {key: options[key] if options[key] is not None else value for key, value in defaults.items()}
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+
+        started = time.perf_counter()
+        users = self.step('사용자', self.create_users, counts['users'])
+        categories = self.step('카테고리', self.create_categories, counts['categories'])
+        posts = self.step('게시글', self.create_posts, counts['posts'], users, categories)
+        self.step('댓글', self.create_comments, posts, users, counts['comments'])
+        self.step('좋아요', self.create_likes, posts, users, counts['likes'])
+        self.step('첨부파일', self.create_attachments, posts, counts['attachments'])
+        self.step('경로/카운터/색인', self.finish, posts)
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: {time.perf_counter() - started:.1f}s (로그인: user0@{BENCH_DOMAIN} / {BENCH_PASSWORD})'
+        ))
+
+    def step(self, label, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        created = len(result) if isinstance(result, list) else result
+        self.stdout.write(f'{label:<12} {created:>10,}건  {time.perf_counter() - started:6.1f}s')
+        return result
+
+    # ----- 생성 -----
+
+    def create_users(self, count):
+        User = get_user_model()
+        existing = bench_users().count()
+        password = make_password(BENCH_PASSWORD)  # 해시는 한 번만 계산
+        User.objects.bulk_create(
+            [
+                User(username=f'bench{i}', email=f'user{i}@{BENCH_DOMAIN}', password=password)
+                for i in range(existing, count)
+            ],
+            batch_size=self.batch_size,
+        )
+        return list(bench_users().order_by('pk').values_list('pk', flat=True)[:count])
+
+    def create_categories(self, count):
+        Category.objects.bulk_create(
+            [Category(name=f'{BENCH_CATEGORY_PREFIX}{i}') for i in range(count)],
+            ignore_conflicts=True,
+        )
+        return list(
+            Category.objects.filter(name__startswith=BENCH_CATEGORY_PREFIX)
+            .order_by('pk').values_list('pk', flat=True)[:count]
+        )
+
+    def create_posts(self, count, users, categories):
+        rng = self.rng
+        for start in range(0, count, self.batch_size):
+            Post.objects.bulk_create([
+                Post(
+                    title=make_text(rng, rng.randint(2, 6)),
+                    content=make_text(rng, rng.randint(20, 120)),
+                    author_id=rng.choice(users),
+                    category_id=rng.choice(categories) if categories and rng.random() < 0.8 else None,
+                    is_public=rng.random() < 0.9,
+                    views=rng.randint(0, 5000),
+                )
+                for _ in range(min(self.batch_size, count - start))
+            ])
+        return list(Post.objects.filter(author_id__in=users).values_list('pk', flat=True))
+
+    def create_comments(self, posts, users, per_post):
+        rng = self.rng
+        created = 0
+        batch = []
+        for post_id in posts:
+            for _ in range(rng.randint(0, per_post * 2)):
+                batch.append(Comment(post_id=post_id, author_id=rng.choice(users), content=make_text(rng, 8)))
+            if len(batch) >= self.batch_size:
+                created += len(Comment.objects.bulk_create(batch))
+                batch = []
+        created += len(Comment.objects.bulk_create(batch))
+        return created
+
+    def create_likes(self, posts, users, per_post):
+        Like = Post.likes.through
+        rng = self.rng
+        created = 0
+        batch = []
+        for post_id in posts:
+            count = min(len(users), rng.randint(0, per_post * 2))
+            batch.extend(Like(post_id=post_id, user_id=user_id) for user_id in rng.sample(users, count))
+            if len(batch) >= self.batch_size:
+                Like.objects.bulk_create(batch, ignore_conflicts=True)
+                created += len(batch)
+                batch = []
+        Like.objects.bulk_create(batch, ignore_conflicts=True)
+        return created + len(batch)
+
+    def create_attachments(self, posts, count):
+        """
+        첨부파일 생성
+        - 파일 저장(내용 해시 경로)이 필요하므로 bulk_create 대신 하나씩 저장
+        - 내용이 같은 파일이 섞이도록 블롭 수를 첨부파일 수의 1/4로 제한 (중복 제거 확인용)
+        """
+        rng = self.rng
+        blobs = [
+            hashlib.sha256(f'bench-{i}'.encode()).digest() * rng.randint(64, 4096)
+            for i in range(max(1, count // 4))
+        ]
+        for i in range(count):
+            with transaction.atomic():
+                Attachment.objects.create(
+                    post_id=rng.choice(posts),
+                    file=ContentFile(rng.choice(blobs), name=f'bench-{i}.pdf'),
+                    original_name=f'bench-{i}.pdf',
+                )
+        return count
+
+    def finish(self, posts):
+        """
+        bulk_create는 save()/시그널을 거치지 않으므로 댓글 경로, 비정규화 카운터, 검색 색인을 직접 갱신
+        """
+        updated = 0
+        backend = get_search_backend()
+        for start in range(0, len(posts), self.batch_size):
+            ids = posts[start:start + self.batch_size]
+            Comment.objects.filter(post_id__in=ids).fill_paths()
+            updated += Post.objects.filter(pk__in=ids).recount()
+            for post in Post.objects.filter(pk__in=ids).only('pk', 'title', 'content'):
+                backend.index_post(post)
+        return updated
+
+    # ----- 정리 -----
+
+    def cleanup(self):
+        started = time.perf_counter()
+        # 첨부파일은 delete()로 지워야 파일 참조 정리 작업이 예약됨
+        attachments = 0
+        for attachment in Attachment.objects.filter(post__author__in=bench_users()).iterator():
+            attachment.delete()
+            attachments += 1
+        deleted, _ = bench_users().delete()
+        categories, _ = Category.objects.filter(name__startswith=BENCH_CATEGORY_PREFIX).delete()
+        self.stdout.write(self.style.SUCCESS(
+            f'벤치마크 데이터 삭제: 첨부파일 {attachments:,}건, 사용자 관련 {deleted:,}건, '
+            f'카테고리 {categories:,}건 ({time.perf_counter() - started:.1f}s)'
+        ))
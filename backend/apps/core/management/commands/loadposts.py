@@ -0,0 +1,369 @@
+"""
+게시글/댓글/좋아요 대량 가져오기 명령어
+- JSONL 또는 CSV 파일을 한 줄씩 읽어(.gz 가능, '-'는 표준 입력) 배치 단위 bulk_create로 저장합니다.
+- 각 행은 기존 시리얼라이저(PostCreateSerializer, CommentSerializer)의 필드 규칙으로 검증하고,
+  잘못된 행은 건너뛰며 줄 번호와 사유를 출력합니다.
+- 작성자/카테고리/게시글 참조는 배치마다 한 번의 쿼리로 확인합니다.
+- 배치마다 트랜잭션 하나로 저장하므로 실패하면 그 배치만 롤백됩니다. (--skip으로 이어서 실행)
+- 종류(--kind)별 입력 형식
+    posts:    title, content, author(이메일 또는 사용자명), category(이름 또는 ID), is_public
+              JSONL에서는 comments([{author, content}]), likes([이메일 또는 사용자명]) 포함 가능
+    comments: post(게시글 ID), author, content (댓글은 모두 최상위 댓글로 저장)
+    likes:    post(게시글 ID), user
+- 사용법:
+    python manage.py loadposts posts.jsonl --batch-size 5000 --create-categories
+    python manage.py loadposts comments.csv --kind comments
+    python manage.py loadposts posts.jsonl.gz --dry-run
+"""
+
+import csv
+import gzip
+import io
+import json
+import sys
+import time
+from collections import Counter, defaultdict, deque
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router, transaction
+from django.db.models import Max, Q
+from rest_framework import serializers
+from rest_framework.fields import SkipField, empty
+
+from apps.core.cache import response_cache
+from apps.core.models import Category, Comment, Post
+from apps.core.search import get_search_backend
+from apps.core.serializers import CommentSerializer, PostCreateSerializer
+
+
+class RowError(Exception):
+    pass
+
+
+class FieldRules:
+    """시리얼라이저 필드의 검증 규칙만 행마다 실행 (관계 필드는 명령어에서 일괄 확인)"""
+
+    def __init__(self, serializer_class, names):
+        self.serializer = serializer_class()
+        self.fields = {name: self.serializer.fields[name] for name in names}
+
+    def __call__(self, row):
+        data, errors = {}, {}
+        for name, field in self.fields.items():
+            try:
+                value = field.run_validation(row.get(name, empty))
+                validate = getattr(self.serializer, f'validate_{name}', None)
+                if validate is not None:
+                    value = validate(value)
+            except SkipField:
+                continue
+            except serializers.ValidationError as exc:
+                errors[name] = exc.detail
+            else:
+                data[name] = value
+        if errors:
+            raise RowError(json.dumps(errors, ensure_ascii=False))
+        return data
+
+
+def open_input(path):
+    if path == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def read_rows(stream, fmt):
+    """(줄 번호, 행) 생성"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # 빈 칸은 값이 없는 것으로 처리 (필드 기본값/필수 검증 적용)
+            yield reader.line_num, {key: value for key, value in row.items() if value not in ('', None)}
+        return
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_no, RowError(f'JSON 형식 오류: {exc}')
+            continue
+        yield line_no, row if isinstance(row, dict) else RowError('JSON 객체가 아닙니다.')
+
+
+class Command(BaseCommand):
+    help = 'JSONL/CSV 파일에서 게시글/댓글/좋아요를 배치 단위로 대량 가져옵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='입력 파일 (.jsonl, .csv, .gz 가능, - 는 표준 입력)')
+        parser.add_argument('--kind', choices=['posts', 'comments', 'likes'], default='posts')
+        parser.add_argument('--format', choices=['jsonl', 'csv'], help='입력 형식 (기본: 확장자로 판단)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='트랜잭션 하나에 저장할 행 수')
+        parser.add_argument('--skip', type=int, default=0, help='앞에서부터 건너뛸 행 수 (실패 후 이어서 실행)')
+        parser.add_argument('--create-categories', action='store_true', help='없는 카테고리 이름은 새로 생성')
+        parser.add_argument('--max-errors', type=int, default=1000, help='잘못된 행이 이 수를 넘으면 중단')
+        parser.add_argument('--dry-run', action='store_true', help='검증만 하고 저장하지 않음')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('csv' if path.removesuffix('.gz').endswith('.csv') else 'jsonl')
+        self.options = options
+        self.kind = options['kind']
+        self.post_rules = FieldRules(PostCreateSerializer, ['title', 'content', 'is_public'])
+        self.comment_rules = FieldRules(CommentSerializer, ['content'])
+        self.users = {}       # 이메일/사용자명 -> 사용자 ID (배치마다 필요한 것만 조회)
+        self.categories = {}  # 이름/ID 문자열 -> 카테고리 ID
+        for pk, name in Category.objects.values_list('pk', 'name'):
+            self.categories[name] = self.categories[str(pk)] = pk
+        self.connection = connections[router.db_for_write(Post)]
+
+        self.totals = {'rows': 0, 'invalid': 0, 'posts': 0, 'comments': 0, 'likes': 0}
+        self.started = self.reported = time.perf_counter()
+        batch = []
+        with open_input(path) as stream:
+            for index, (line_no, row) in enumerate(read_rows(stream, fmt)):
+                if index < options['skip']:
+                    continue
+                batch.append((line_no, row))
+                if len(batch) >= options['batch_size']:
+                    self.process(batch)
+                    batch = []
+            if batch:
+                self.process(batch)
+
+        if not options['dry_run'] and any(self.totals[key] for key in ('posts', 'comments', 'likes')):
+            response_cache.invalidate()
+        elapsed = time.perf_counter() - self.started
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: {self.totals['rows']:,}행 ({self.totals['invalid']:,}행 건너뜀), "
+            f"게시글 {self.totals['posts']:,} / 댓글 {self.totals['comments']:,} / 좋아요 {self.totals['likes']:,}, "
+            f"{elapsed:.1f}s ({self.totals['rows'] / elapsed if elapsed else 0:,.0f}행/s)"
+        ))
+
+    # ----- 배치 처리 -----
+
+    def process(self, batch):
+        self.resolve_users(batch)
+        records = []
+        for line_no, row in batch:
+            try:
+                if isinstance(row, RowError):
+                    raise row
+                record = getattr(self, f'parse_{self.kind}')(row)
+                record['line'] = line_no
+                records.append(record)
+            except RowError as exc:
+                self.invalid(line_no, exc)
+        if self.kind != 'posts':
+            records = self.filter_existing_posts(records)
+
+        if not self.options['dry_run'] and records:
+            done = self.totals['rows']
+            try:
+                with transaction.atomic(using=self.connection.alias):
+                    getattr(self, f'save_{self.kind}')(records)
+            except Exception as exc:
+                raise CommandError(
+                    f'저장 실패 (이 배치는 롤백됨, --skip {done + self.options["skip"]}로 이어서 실행): {exc}'
+                )
+        self.totals['rows'] += len(batch)
+        if time.perf_counter() - self.reported >= 2:
+            self.progress()
+
+    def invalid(self, line_no, exc):
+        self.totals['invalid'] += 1
+        self.stderr.write(f'{line_no}행: {exc}')
+        if self.totals['invalid'] > self.options['max_errors']:
+            raise CommandError(f"잘못된 행이 {self.options['max_errors']}개를 넘어 중단합니다.")
+
+    def progress(self):
+        self.reported = time.perf_counter()
+        elapsed = self.reported - self.started
+        self.stdout.write(
+            f"{self.totals['rows']:>12,}행  게시글 {self.totals['posts']:,}  댓글 {self.totals['comments']:,}  "
+            f"좋아요 {self.totals['likes']:,}  {self.totals['rows'] / elapsed if elapsed else 0:,.0f}행/s"
+        )
+
+    # ----- 참조 확인 -----
+
+    def resolve_users(self, batch):
+        """배치에 나온 작성자/좋아요 사용자를 한 번에 조회"""
+        keys = set()
+        for _, row in batch:
+            if isinstance(row, RowError):
+                continue
+            for key in (row.get('author'), row.get('user')):
+                if key:
+                    keys.add(str(key))
+            for comment in row.get('comments') or []:
+                if isinstance(comment, dict) and comment.get('author'):
+                    keys.add(str(comment['author']))
+            for like in row.get('likes') or []:
+                keys.add(str(like))
+        keys -= self.users.keys()
+        if not keys:
+            return
+        User = get_user_model()
+        for pk, email, username in User.objects.filter(
+            Q(email__in=keys) | Q(username__in=keys)
+        ).values_list('pk', 'email', 'username'):
+            self.users[email] = self.users[username] = pk
+        # 없는 사용자도 기록해 다음 배치에서 다시 조회하지 않음
+        for key in keys - self.users.keys():
+            self.users[key] = None
+
+    def user_id(self, key, label):
+        user_id = self.users.get(str(key)) if key else None
+        if user_id is None:
+            raise RowError(f'{label} 사용자를 찾을 수 없습니다: {key!r}')
+        return user_id
+
+    def category_id(self, value):
+        if value in (None, ''):
+            return None
+        value = str(value)
+        if value in self.categories:
+            return self.categories[value]
+        if not self.options['create_categories'] or value.isdigit():
+            raise RowError(f'카테고리를 찾을 수 없습니다: {value!r}')
+        if self.options['dry_run']:
+            return None
+        category, _ = Category.objects.get_or_create(name=value)
+        self.categories[value] = self.categories[str(category.pk)] = category.pk
+        return category.pk
+
+    def filter_existing_posts(self, records):
+        """댓글/좋아요 행 중 게시글이 없는 행 제외 (배치당 쿼리 한 번)"""
+        post_ids = {record['post_id'] for record in records}
+        existing = set(Post.objects.filter(pk__in=post_ids).values_list('pk', flat=True))
+        kept = []
+        for record in records:
+            if record['post_id'] in existing:
+                kept.append(record)
+            else:
+                self.invalid(record['line'], RowError(f"게시글을 찾을 수 없습니다: {record['post_id']}"))
+        return kept
+
+    # ----- 행 해석 -----
+
+    def parse_posts(self, row):
+        data = self.post_rules(row)
+        post = Post(
+            author_id=self.user_id(row.get('author'), '작성자'),
+            category_id=self.category_id(row.get('category')),
+            **data,
+        )
+        comments = []
+        for comment in row.get('comments') or []:
+            if not isinstance(comment, dict):
+                raise RowError('comments 항목은 {author, content} 객체여야 합니다.')
+            comments.append(Comment(
+                author_id=self.user_id(comment.get('author'), '댓글 작성자'),
+                **self.comment_rules(comment),
+            ))
+        likes = {self.user_id(user, '좋아요') for user in row.get('likes') or []}
+        # 함께 가져오는 댓글/좋아요로 비정규화 카운터를 미리 채움
+        post.comment_count = len(comments)
+        post.likes_count = len(likes)
+        return {'post': post, 'comments': comments, 'likes': likes}
+
+    def parse_comments(self, row):
+        return {
+            'post_id': self.post_id(row.get('post')),
+            'author_id': self.user_id(row.get('author'), '작성자'),
+            **self.comment_rules(row),
+        }
+
+    def parse_likes(self, row):
+        return {
+            'post_id': self.post_id(row.get('post')),
+            'user_id': self.user_id(row.get('user'), '좋아요'),
+        }
+
+    def post_id(self, value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise RowError(f'게시글 ID가 올바르지 않습니다: {value!r}')
+
+    # ----- 저장 -----
+
+    def save_posts(self, records):
+        posts = [record['post'] for record in records]
+        self.bulk_insert(posts)
+        Like = Post.likes.through
+        comments, likes = [], []
+        for record in records:
+            post = record['post']
+            for comment in record['comments']:
+                comment.post_id = post.pk
+                comments.append(comment)
+            likes.extend(Like(post_id=post.pk, user_id=user_id) for user_id in record['likes'])
+        Comment.objects.bulk_create(comments, batch_size=self.options['batch_size'])
+        Comment.objects.filter(post_id__in=[post.pk for post in posts]).fill_paths()
+        Like.objects.bulk_create(likes, batch_size=self.options['batch_size'], ignore_conflicts=True)
+
+        # bulk_create는 post_save 시그널을 보내지 않으므로 검색 색인 직접 갱신
+        backend = get_search_backend()
+        for post in posts:
+            backend.index_post(post)
+        self.totals['posts'] += len(posts)
+        self.totals['comments'] += len(comments)
+        self.totals['likes'] += len(likes)
+
+    def save_comments(self, records):
+        Comment.objects.bulk_create([
+            Comment(post_id=record['post_id'], author_id=record['author_id'], content=record['content'])
+            for record in records
+        ])
+        post_ids = {record['post_id'] for record in records}
+        Comment.objects.filter(post_id__in=post_ids).fill_paths()
+        Post.objects.filter(pk__in=post_ids).recount()
+        self.totals['comments'] += len(records)
+
+    def save_likes(self, records):
+        Like = Post.likes.through
+        Like.objects.bulk_create(
+            [Like(post_id=record['post_id'], user_id=record['user_id']) for record in records],
+            ignore_conflicts=True,
+        )
+        Post.objects.filter(pk__in={record['post_id'] for record in records}).recount()
+        self.totals['likes'] += len(records)
+
+    def bulk_insert(self, posts):
+        """
+        bulk_create 후 기본 키 채우기
+        - RETURNING을 지원하는 DB(SQLite, MariaDB 등)는 bulk_create가 채운 키를 그대로 씁니다.
+        - MySQL은 여러 행 INSERT로 생성된 키를 돌려받을 수 없으므로, 저장 전 가장 큰 키보다 큰 행 중에서
+          (작성자, 작성일, 제목)이 같은 행을 다시 조회합니다. innodb_autoinc_lock_mode=2에서는 다른 세션의
+          INSERT와 키가 섞여 연속된 키를 가정할 수 없습니다.
+        - 같은 INSERT의 키는 행 순서대로 커지므로 배치 안에서 값이 겹치면 키 순서대로 나눠 주고,
+          다른 세션이 같은 값의 글을 함께 넣어 행 수가 맞지 않으면 배치를 중단합니다.
+          (댓글/좋아요가 다른 게시글에 붙지 않도록)
+        """
+        if self.connection.features.can_return_rows_from_bulk_insert:
+            Post.objects.bulk_create(posts, batch_size=len(posts))
+            return
+        last_pk = Post.objects.aggregate(last=Max('pk'))['last'] or 0
+        Post.objects.bulk_create(posts, batch_size=len(posts))
+
+        def natural_key(post):
+            return post.author_id, post.created_at, post.title
+
+        created = [post.created_at for post in posts]
+        keys = defaultdict(deque)
+        for pk, *values in Post.objects.filter(
+            pk__gt=last_pk,
+            author_id__in={post.author_id for post in posts},
+            created_at__range=(min(created), max(created)),
+        ).order_by('pk').values_list('pk', 'author_id', 'created_at', 'title'):
+            keys[tuple(values)].append(pk)
+        for key, count in Counter(map(natural_key, posts)).items():
+            if len(keys.get(key, ())) != count:
+                raise CommandError(f'저장한 게시글의 키를 확인할 수 없습니다: {key[2]!r}')
+        for post in posts:
+            post.pk = keys[natural_key(post)].popleft()
@@ -0,0 +1,192 @@
+"""
+부하 테스트 명령어 (WSGI / ASGI 비교)
+- 동시 클라이언트(스레드, keep-alive 연결)로 읽기 API를 반복 호출하고 초당 요청 수와 지연 시간(p50/p95/p99)을 출력합니다.
+- --url: 이미 실행 중인 서버를 측정
+- --compare: Gunicorn 동기 워커(config.wsgi)와 Uvicorn 워커(config.asgi)를 차례로 띄워 같은 조건으로 측정
+- 캐시 적중만 측정하지 않도록 기본값은 인증 토큰 없이 ?nocache=<난수>를 붙여 요청합니다. (--allow-cache로 끔)
+- 사용법:
+    python manage.py loadtest --url http://127.0.0.1:8000 --concurrency 50 --duration 10
+    python manage.py loadtest --compare --workers 4 --concurrency 100 --duration 15
+"""
+
+import http.client
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.models import Post
+
+SERVERS = {
+    'wsgi': ['config.wsgi:application', '--worker-class', 'gthread', '--threads', '{threads}'],
+    'asgi': ['config.asgi:application', '--worker-class', 'uvicorn.workers.UvicornWorker'],
+}
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = '읽기 API에 동시 요청을 보내 초당 요청 수와 p99 지연 시간을 측정합니다. (WSGI/ASGI 비교)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='측정할 서버 주소')
+        parser.add_argument('--compare', action='store_true', help='WSGI/ASGI 서버를 직접 띄워 비교')
+        parser.add_argument('--port', type=int, default=8765, help='--compare 시 사용할 포트')
+        parser.add_argument('--workers', type=int, default=4, help='--compare 시 서버 워커 프로세스 수')
+        parser.add_argument('--threads', type=int, default=8, help='--compare 시 WSGI 워커당 스레드 수')
+        parser.add_argument('--concurrency', type=int, default=50, help='동시 클라이언트 수')
+        parser.add_argument('--duration', type=float, default=10.0, help='측정 시간(초)')
+        parser.add_argument('--warmup', type=float, default=2.0, help='측정 전 예열 시간(초)')
+        parser.add_argument('--paths', nargs='+', help='요청할 경로 (기본: 게시글 목록/상세, 댓글 목록, 검색)')
+        parser.add_argument('--token', help='Authorization: Bearer 토큰 (인증 사용자로 측정)')
+        parser.add_argument('--allow-cache', action='store_true', help='응답 캐시 적중을 허용')
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or self.default_paths()
+        self.stdout.write('요청 경로: ' + ', '.join(paths))
+
+        if not options['compare']:
+            result = self.run_load(options['url'], paths, options)
+            self.report([('server', result)])
+            return
+
+        results = []
+        for mode in ('wsgi', 'asgi'):
+            with self.server(mode, options):
+                url = f"http://127.0.0.1:{options['port']}"
+                results.append((mode, self.run_load(url, paths, options)))
+        self.report(results)
+
+    def default_paths(self):
+        post_id = Post.objects.filter(is_public=True).order_by('-pk').values_list('pk', flat=True).first()
+        if post_id is None:
+            raise CommandError('공개 게시글이 없습니다. 먼저 테스트 데이터를 만들어 주세요.')
+        return [
+            '/api/posts/',
+            f'/api/posts/{post_id}/',
+            f'/api/posts/{post_id}/comments/',
+            '/api/search/?q=test',
+        ]
+
+    # ----- 서버 실행 -----
+
+    def server(self, mode, options):
+        command = self
+
+        class Server:
+            def __enter__(self):
+                args = [
+                    sys.executable, '-m', 'gunicorn', *[
+                        arg.format(threads=options['threads']) for arg in SERVERS[mode]
+                    ],
+                    '--workers', str(options['workers']),
+                    '--bind', f"127.0.0.1:{options['port']}",
+                    '--log-level', 'warning',
+                ]
+                env = {**os.environ, 'ASYNC_VIEWS': 'True' if mode == 'asgi' else 'False'}
+                command.stdout.write(f'[{mode}] 서버 시작: {" ".join(args[1:])}')
+                self.process = subprocess.Popen(args, cwd=settings.BASE_DIR, env=env)
+                command.wait_for_port(options['port'], self.process)
+                return self
+
+            def __exit__(self, *exc):
+                self.process.terminate()
+                self.process.wait(timeout=30)
+
+        return Server()
+
+    def wait_for_port(self, port, process, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError('서버가 시작되지 않았습니다. (gunicorn/uvicorn 설치 여부 확인)')
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+                return
+            except OSError:
+                time.sleep(0.2)
+        process.terminate()
+        raise CommandError('서버 시작 대기 시간을 초과했습니다.')
+
+    # ----- 부하 생성 -----
+
+    def run_load(self, url, paths, options):
+        parts = urlsplit(url)
+        headers = {'Accept': 'application/json'}
+        if options['token']:
+            headers['Authorization'] = f"Bearer {options['token']}"
+
+        if options['warmup'] > 0:
+            self.clients(parts, paths, headers, options, options['warmup'])
+        return self.clients(parts, paths, headers, options, options['duration'])
+
+    def clients(self, parts, paths, headers, options, duration):
+        latencies, errors = [], []
+        lock = threading.Lock()
+        deadline = time.monotonic() + duration
+
+        def client(seed):
+            rng = random.Random(seed)
+            conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            local_latencies, local_errors = [], 0
+            while time.monotonic() < deadline:
+                path = rng.choice(paths)
+                if not options['allow_cache']:
+                    path += ('&' if '?' in path else '?') + f'nocache={rng.random()}'
+                started = time.perf_counter()
+                try:
+                    conn.request('GET', path, headers=headers)
+                    response = conn.getresponse()
+                    response.read()
+                    if response.status >= 400:
+                        local_errors += 1
+                    else:
+                        local_latencies.append(time.perf_counter() - started)
+                except (OSError, http.client.HTTPException):
+                    local_errors += 1
+                    conn.close()
+                    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            conn.close()
+            with lock:
+                latencies.extend(local_latencies)
+                errors.append(local_errors)
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(options['concurrency'])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            'requests': len(latencies),
+            'errors': sum(errors),
+            'rps': len(latencies) / elapsed,
+            'p50': percentile(latencies, 50) * 1000,
+            'p95': percentile(latencies, 95) * 1000,
+            'p99': percentile(latencies, 99) * 1000,
+        }
+
+    def report(self, results):
+        self.stdout.write(
+            f"{'모드':<8}{'요청 수':>10}{'오류':>8}{'req/s':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}"
+        )
+        for mode, result in results:
+            self.stdout.write(
+                f"{mode:<8}{result['requests']:>10}{result['errors']:>8}{result['rps']:>10.1f}"
+                f"{result['p50']:>10.1f}{result['p95']:>10.1f}{result['p99']:>10.1f}"
+            )
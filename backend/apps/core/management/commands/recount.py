@@ -0,0 +1,40 @@
+"""
+게시글 카운터 재계산 명령어
+- 비정규화된 좋아요/댓글 수(likes_count, comment_count)를 실제 행 수로 다시 계산합니다.
+- 사용법: python manage.py recount [--batch-size 1000]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max, Min
+
+from apps.core.models import Post
+
+
+class Command(BaseCommand):
+    help = '게시글의 좋아요/댓글 수를 일괄 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번의 UPDATE로 처리할 게시글 ID 범위 (기본값: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        bounds = Post.objects.aggregate(low=Min('pk'), high=Max('pk'))
+        if bounds['low'] is None:
+            self.stdout.write('재계산할 게시글이 없습니다.')
+            return
+
+        updated = 0
+        # PK 범위로 나누어 UPDATE 한 번에 batch_size개씩 처리
+        for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+            with transaction.atomic():
+                updated += Post.objects.filter(
+                    pk__gte=start, pk__lt=start + batch_size
+                ).recount()
+
+        self.stdout.write(self.style.SUCCESS(f'게시글 {updated}개의 카운터를 재계산했습니다.'))
@@ -0,0 +1,126 @@
+"""
+Core 미들웨어
+- DatabaseConnectionMetricsMiddleware: 요청별 DB 연결 지표 (apps/core/db/metrics.py)
+- ReplicaPinningMiddleware: 쓰기 직후 읽기를 default DB로 고정 (apps/core/db/replicas.py)
+- ProfilingMiddleware: 뷰별 처리 시간/DB 시간/쿼리 수 집계와 cProfile 샘플링 (apps/core/profiling.py)
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.exceptions import MiddlewareNotUsed
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+from .db import replicas
+from .db.metrics import request_scope
+from .profiling import RequestProfiler, should_sample
+
+
+class DatabaseConnectionMetricsMiddleware:
+    """
+    요청 처리 중 DB 연결을 얻은 횟수와 시간을 기록
+    - 연결을 얻은 요청에는 Server-Timing: db-connect;dur=<ms>;desc="<횟수>" 헤더를 붙임
+    - 동기/비동기 모두 지원하므로 ASGI에서도 스레드 전환 없이 실행됩니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with request_scope() as current:
+            response = self.get_response(request)
+        return self.add_header(response, current)
+
+    async def __acall__(self, request):
+        with request_scope() as current:
+            response = await self.get_response(request)
+        return self.add_header(response, current)
+
+    def add_header(self, response, current):
+        if current['connects']:
+            timing = f'db-connect;dur={current["seconds"] * 1000:.2f};desc="{current["connects"]}"'
+            existing = response.get('Server-Timing')
+            response['Server-Timing'] = f'{existing}, {timing}' if existing else timing
+        return response
+
+
+class ReplicaPinningMiddleware:
+    """
+    쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 잠시 동안 같은 클라이언트의 읽기를 default로 고정
+    - 읽기 복제본이 설정되지 않았으면 미들웨어를 사용하지 않음
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not replicas.replicas():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if self.is_write(request, response):
+            replicas.pin(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self.is_write(request, response):
+            # request.user가 아직 평가되지 않은 세션 사용자일 수 있으므로 스레드에서 실행
+            await sync_to_async(replicas.pin)(request, response)
+        return response
+
+    def is_write(self, request, response):
+        return request.method not in SAFE_METHODS and response.status_code < 400
+
+
+class ProfilingMiddleware:
+    """
+    요청 처리 시간, DB 시간, 쿼리 수, 중복 쿼리를 뷰별로 집계 (PROFILING_ENABLED)
+    - 응답에 Server-Timing: app, db 헤더를 붙임
+    - cProfile 샘플링(PROFILING_SAMPLE_RATE)은 동기 요청에만 적용
+      (비동기 요청은 이벤트 루프의 다른 요청까지 함께 측정되므로 제외)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        profiler = RequestProfiler(request)
+        profiler.start(sample=should_sample())
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            profiler.stop()
+            raise
+        return profiler.finish(response)
+
+    async def __acall__(self, request):
+        profiler = RequestProfiler(request)
+        profiler.start()
+        try:
+            response = await self.get_response(request)
+        except BaseException:
+            profiler.stop()
+            raise
+        return profiler.finish(response)
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.16 on 2026-10-18 10:30
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_counters(apps, schema_editor):
+    """기존 게시글의 좋아요/댓글 수 채우기"""
+    Post = apps.get_model('core', 'Post')
+    Comment = apps.get_model('core', 'Comment')
+    Like = Post.likes.through
+    comment_counts = Comment.objects.values('post').annotate(total=Count('id'))
+    for row in comment_counts.iterator():
+        Post.objects.filter(pk=row['post']).update(comment_count=row['total'])
+    like_counts = Like.objects.values('post').annotate(total=Count('id'))
+    for row in like_counts.iterator():
+        Post.objects.filter(pk=row['post']).update(likes_count=row['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_post_likes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, verbose_name='댓글 수'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='likes_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, verbose_name='좋아요 수'),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.16 on 2026-10-18 11:00
+
+from django.db import migrations
+
+INDEX_NAME = 'core_post_title_content_ft'
+
+
+def create_fulltext_index(apps, schema_editor):
+    """MySQL에서만 제목/내용 FULLTEXT 인덱스 생성 (한국어 대응 ngram 파서)"""
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    schema_editor.execute(
+        f'ALTER TABLE core_post ADD FULLTEXT INDEX {INDEX_NAME} (title, content) WITH PARSER ngram'
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    schema_editor.execute(f'ALTER TABLE core_post DROP INDEX {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_post_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.16 on 2026-10-18 12:30
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_category_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64, verbose_name='SHA-256'),
+        ),
+        migrations.AlterField(
+            model_name='attachment',
+            name='file_size',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='파일 크기'),
+        ),
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('original_name', models.CharField(max_length=255, verbose_name='원본 파일명')),
+                ('total_size', models.PositiveBigIntegerField(verbose_name='전체 크기')),
+                ('received_size', models.PositiveBigIntegerField(default=0, verbose_name='받은 크기')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='시작일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='최근 수신일')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to='core.post', verbose_name='게시글')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL, verbose_name='업로드 사용자')),
+            ],
+            options={
+                'verbose_name': '업로드 세션',
+                'verbose_name_plural': '업로드 세션들',
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-18 13:00
+
+import apps.core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_upload_sessions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attachment',
+            name='file',
+            field=models.FileField(max_length=255, storage=apps.core.storage.ContentAddressedStorage(), upload_to=apps.core.storage.attachment_upload_to, verbose_name='파일'),
+        ),
+    ]
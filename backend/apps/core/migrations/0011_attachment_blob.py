@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-18 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_comment_tree'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttachmentBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='파일 경로')),
+                ('locked_at', models.DateTimeField(verbose_name='마지막 잠금')),
+            ],
+            options={
+                'verbose_name': '첨부파일 저장 파일',
+                'verbose_name_plural': '첨부파일 저장 파일들',
+            },
+        ),
+    ]
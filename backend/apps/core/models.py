@@ -1,10 +1,18 @@
 """
 Core 모델 정의
-- 게시글(Post), 첨부파일(Attachment) 모델을 정의합니다.
+- 게시글(Post), 첨부파일(Attachment), 댓글(Comment) 모델을 정의합니다.
 """
 
-from django.db import models
+import uuid
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, OuterRef, Prefetch, Subquery, Value, Window
+from django.db.models.functions import Cast, Coalesce, Greatest, LPad, RowNumber, Substr
 from django.conf import settings
+from django.utils import timezone
+
+from .storage import attachment_storage, attachment_upload_to, hash_file
+from .view_counter import view_counter
 
 
 class Category(models.Model):
@@ -15,6 +23,7 @@ class Category(models.Model):
     name = models.CharField('카테고리명', max_length=50, unique=True)
     description = models.TextField('설명', blank=True)
     created_at = models.DateTimeField('생성일', auto_now_add=True)
+    updated_at = models.DateTimeField('수정일', auto_now=True)
 
     class Meta:
         verbose_name = '카테고리'
@@ -25,6 +34,67 @@ class Category(models.Model):
         return self.name
 
 
+class PostQuerySet(models.QuerySet):
+    """
+    게시글 쿼리셋
+    - 목록/상세 응답에 필요한 연관 데이터를 한 번의 쿼리로 가져옵니다.
+    - 좋아요/댓글 수는 Post의 비정규화 컬럼(likes_count, comment_count)을 사용합니다.
+    """
+
+    def for_list(self):
+        """목록용: 작성자/카테고리 JOIN"""
+        return self.select_related('author', 'category')
+
+    def for_detail(self):
+        """
+        상세용: 목록용 쿼리 + 첨부파일, 처음 POST_DETAIL_COMMENTS개 댓글(작성자 포함) prefetch
+        - 댓글은 first_comments 속성에 담기며, 나머지는 댓글 API(커서 페이지네이션)로 조회합니다.
+        - 다음 댓글이 있는지 알 수 있도록 한 건 더 조회합니다.
+        """
+        return self.for_list().prefetch_related(
+            'attachments',
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related('author')
+                .order_by('created_at', 'id')[:settings.POST_DETAIL_COMMENTS + 1],
+                to_attr='first_comments',
+            ),
+        )
+
+    def adjust_counts(self, likes=0, comments=0):
+        """
+        좋아요/댓글 수를 F 표현식으로 원자적으로 증감
+        - 감소는 0 아래로 내려가지 않음 (카운터가 실제보다 작게 어긋나 있어도 IntegrityError 없이 0으로 고정)
+        - MySQL의 UNSIGNED 컬럼은 계산 중간값도 음수가 될 수 없으므로 GREATEST(count, n) - n으로 계산
+        """
+        updates = {}
+        for field, delta in (('likes_count', likes), ('comment_count', comments)):
+            if delta > 0:
+                updates[field] = F(field) + delta
+            elif delta < 0:
+                updates[field] = Greatest(F(field), -delta) - (-delta)
+        if not updates:
+            return 0
+        return self.update(**updates)
+
+    def recount(self):
+        """좋아요/댓글 수를 실제 행 수로 다시 계산 (UPDATE 한 번)"""
+        comments = (
+            Comment.objects.filter(post=OuterRef('pk'))
+            .order_by().values('post')
+            .annotate(total=Count('id')).values('total')
+        )
+        likes = (
+            Post.likes.through.objects.filter(post=OuterRef('pk'))
+            .order_by().values('post')
+            .annotate(total=Count('id')).values('total')
+        )
+        return self.update(
+            comment_count=Coalesce(Subquery(comments), 0),
+            likes_count=Coalesce(Subquery(likes), 0),
+        )
+
+
 class Post(models.Model):
     """
     게시글 모델
@@ -53,28 +123,46 @@ class Post(models.Model):
         blank=True,
         verbose_name='좋아요'
     )
+    # 비정규화 카운터 (좋아요 토글, 댓글 작성/삭제 시 F 표현식으로 갱신)
+    likes_count = models.PositiveIntegerField('좋아요 수', default=0, db_index=True)
+    comment_count = models.PositiveIntegerField('댓글 수', default=0, db_index=True)
     is_public = models.BooleanField('공개여부', default=True)
     created_at = models.DateTimeField('작성일', auto_now_add=True)
     updated_at = models.DateTimeField('수정일', auto_now=True)
 
+    objects = PostQuerySet.as_manager()
+
     class Meta:
         verbose_name = '게시글'
         verbose_name_plural = '게시글들'
         ordering = ['-created_at']
+        indexes = [
+            # 키셋 페이지네이션 (-created_at, -id): 비인증(공개글) / 인증 사용자 목록
+            models.Index(fields=['is_public', 'created_at', 'id'], name='core_post_public_created_idx'),
+            models.Index(fields=['created_at', 'id'], name='core_post_created_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
     def increase_views(self):
-        """조회수 증가"""
-        self.views += 1
-        self.save(update_fields=['views'])
+        """
+        조회수 증가
+        - DB에 바로 쓰지 않고 조회수 버퍼에 누적 (view_counter.py 참고)
+        - 응답에는 아직 반영되지 않은 조회수까지 더한 값이 보이도록 인스턴스 값만 갱신
+        """
+        self.views += view_counter.add(self.pk)
+
+    async def aincrease_views(self):
+        """increase_views의 비동기 버전"""
+        self.views += await view_counter.aadd(self.pk)
 
 
 class Attachment(models.Model):
     """
     첨부파일 모델
     - 게시글에 첨부되는 파일을 관리
+    - 파일은 내용 해시 경로에 저장되어 같은 파일은 한 번만 저장됩니다. (storage.py)
     """
     post = models.ForeignKey(
         Post,
@@ -82,9 +170,12 @@ class Attachment(models.Model):
         related_name='attachments',
         verbose_name='게시글'
     )
-    file = models.FileField('파일', upload_to='attachments/%Y/%m/')
+    file = models.FileField(
+        '파일', upload_to=attachment_upload_to, storage=attachment_storage, max_length=255
+    )
     original_name = models.CharField('원본 파일명', max_length=255)
-    file_size = models.PositiveIntegerField('파일 크기', default=0)
+    file_size = models.PositiveBigIntegerField('파일 크기', default=0)
+    content_hash = models.CharField('SHA-256', max_length=64, blank=True, db_index=True)
     uploaded_at = models.DateTimeField('업로드일', auto_now_add=True)
 
     class Meta:
@@ -95,15 +186,147 @@ class Attachment(models.Model):
         return self.original_name
 
     def save(self, *args, **kwargs):
-        if self.file:
+        # 크기를 이미 알고 있으면 (분할 업로드) 파일을 다시 확인하지 않음
+        if self.file and not self.file_size:
             self.file_size = self.file.size
-        super().save(*args, **kwargs)
+        # 새로 올라온 파일은 저장 경로를 정하기 전에 해시 계산
+        if self.file and not self.file._committed and not self.content_hash:
+            self.content_hash = hash_file(self.file)
+        # 파일 저장(기존 파일 재사용 시 잠금, storage.py)과 행 저장을 한 트랜잭션으로
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def dated_upload_path(self, filename):
+        """해시가 없는 파일의 기존 날짜별 경로 (attachments/%Y/%m/)"""
+        uploaded_at = self.uploaded_at or timezone.now()
+        return uploaded_at.strftime('attachments/%Y/%m/') + filename
+
+
+class AttachmentBlobQuerySet(models.QuerySet):
+    def lock(self, name):
+        """
+        내용 주소 파일 하나를 현재 트랜잭션이 끝날 때까지 잠금
+        - 행을 UPDATE(없으면 INSERT)해 잠그므로 SELECT ... FOR UPDATE를 무시하는 SQLite에서도 쓰기끼리 직렬화됩니다.
+        """
+        now = timezone.now()
+        if self.filter(name=name).update(locked_at=now):
+            return
+        try:
+            with transaction.atomic():
+                self.create(name=name, locked_at=now)
+        except IntegrityError:
+            # 동시에 처음 만든 요청이 있으면 그 트랜잭션이 끝난 뒤 잠금
+            self.filter(name=name).update(locked_at=now)
+
+
+class AttachmentBlob(models.Model):
+    """
+    내용 주소 파일 잠금 행
+    - 업로드가 기존 파일을 재사용하는 동안과 파일 정리 작업(tasks.release_attachment_file)이 참조를 확인하고
+      삭제하는 동안 같은 행을 잠급니다. 정리 작업은 재사용한 업로드의 첨부파일 행이 커밋된 뒤에 참조를 확인하므로,
+      새 첨부파일이 가리킬 파일을 지우지 않습니다.
+    """
+    name = models.CharField('파일 경로', max_length=255, unique=True)
+    locked_at = models.DateTimeField('마지막 잠금')
+
+    objects = AttachmentBlobQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = '첨부파일 저장 파일'
+        verbose_name_plural = '첨부파일 저장 파일들'
+
+    def __str__(self):
+        return self.name
+
+
+class UploadSession(models.Model):
+    """
+    분할 업로드 세션
+    - 청크는 MEDIA_ROOT/UPLOAD_TEMP_DIR/{id}.part 에 이어서 기록됩니다. (uploads.py)
+    - 완료되면 Attachment로 옮겨지고 세션은 삭제됩니다.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions',
+        verbose_name='게시글'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions',
+        verbose_name='업로드 사용자'
+    )
+    original_name = models.CharField('원본 파일명', max_length=255)
+    total_size = models.PositiveBigIntegerField('전체 크기')
+    received_size = models.PositiveBigIntegerField('받은 크기', default=0)
+    created_at = models.DateTimeField('시작일', auto_now_add=True)
+    updated_at = models.DateTimeField('최근 수신일', auto_now=True)
+
+    class Meta:
+        verbose_name = '업로드 세션'
+        verbose_name_plural = '업로드 세션들'
+
+    def __str__(self):
+        return f"{self.original_name} ({self.received_size}/{self.total_size})"
+
+    @property
+    def is_complete(self):
+        return self.received_size == self.total_size
+
+
+# 댓글 경로 한 단계의 길이 (0으로 채운 10자리 ID)
+COMMENT_PATH_STEP = 10
+
+
+class CommentQuerySet(models.QuerySet):
+    """
+    댓글 쿼리셋 (구체화 경로)
+    - path는 최상위 댓글부터 자신까지의 ID를 COMMENT_PATH_STEP 자리씩 이어 붙인 문자열입니다.
+      예: 0000000012 (최상위) -> 00000000120000000057 (답글)
+    - path 순으로 정렬하면 답글이 부모 바로 뒤에 이어지는 깊이 우선 순서가 되고,
+      하위 트리 전체는 (post, path) 인덱스의 범위 조회 한 번으로 가져옵니다.
+    """
+
+    def subtree(self, comment):
+        """comment와 그 아래 모든 답글"""
+        return self.filter(post_id=comment.post_id, path__gte=comment.path, path__lt=comment.path + ':')
+
+    def descendants(self, comment):
+        """comment 아래 모든 답글 (자신 제외)"""
+        return self.filter(post_id=comment.post_id, path__gt=comment.path, path__lt=comment.path + ':')
+
+    def thread_replies(self, roots, limit):
+        """
+        최상위 댓글(path 순으로 연속된 한 페이지)의 스레드별 처음 limit개 답글
+        - 범위 조회 한 번에 윈도 함수로 스레드별 순번(reply_position)과 전체 답글 수(thread_reply_count)를 계산
+        - thread는 최상위 댓글의 path
+        """
+        thread = Substr('path', 1, COMMENT_PATH_STEP)
+        return self.filter(
+            post_id=roots[0].post_id,
+            path__gt=roots[0].path,
+            path__lt=roots[-1].path + ':',
+            depth__gt=0,
+        ).annotate(
+            thread=thread,
+            reply_position=Window(RowNumber(), partition_by=[thread], order_by=F('path').asc()),
+            thread_reply_count=Window(Count('id'), partition_by=[thread]),
+        ).filter(reply_position__lte=limit).order_by('path')
+
+    def fill_paths(self):
+        """bulk_create로 만든 최상위 댓글의 경로 채우기 (UPDATE 한 번, 답글은 bulk_create로 만들지 않음)"""
+        return self.filter(path='', parent__isnull=True).update(
+            path=LPad(Cast('id', models.CharField()), COMMENT_PATH_STEP, Value('0'))
+        )
 
 
 class Comment(models.Model):
     """
     댓글 모델
-    - 게시글에 달리는 댓글
+    - 게시글에 달리는 댓글, parent가 있으면 답글
+    - 트리 조회를 위해 구체화 경로(path)와 깊이(depth)를 저장합니다. (CommentQuerySet 참고)
     """
     post = models.ForeignKey(
         Post,
@@ -117,14 +340,46 @@ class Comment(models.Model):
         related_name='comments',
         verbose_name='작성자'
     )
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='replies',
+        verbose_name='상위 댓글'
+    )
+    path = models.CharField('경로', max_length=255, blank=True, default='', editable=False)
+    depth = models.PositiveSmallIntegerField('깊이', default=0, editable=False)
     content = models.TextField('내용')
     created_at = models.DateTimeField('작성일', auto_now_add=True)
     updated_at = models.DateTimeField('수정일', auto_now=True)
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         verbose_name = '댓글'
         verbose_name_plural = '댓글들'
         ordering = ['created_at']
+        indexes = [
+            # 게시글별 댓글 키셋 페이지네이션 (created_at, id)
+            models.Index(fields=['post', 'created_at'], name='core_comment_post_created_idx'),
+            # 게시글 상세 ETag의 댓글 최종 수정 시각 (MAX를 인덱스 한 번으로 조회)
+            models.Index(fields=['post', 'updated_at'], name='core_comment_post_updated_idx'),
+            # 트리 조회: 스레드 목록, 하위 트리 범위 조회 (post, path)
+            models.Index(fields=['post', 'path'], name='core_comment_post_path_idx'),
+        ]
 
     def __str__(self):
         return f"{self.author} - {self.content[:20]}"
+
+    def save(self, *args, **kwargs):
+        if self.parent_id and not self.depth:
+            self.depth = self.parent.depth + 1
+        # INSERT와 경로 UPDATE를 한 트랜잭션으로 (경로가 빈 댓글은 하위 트리/스레드 조회에서 빠짐)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # 경로에는 자신의 ID가 들어가므로 INSERT 후에 채움
+            if not self.path:
+                prefix = self.parent.path if self.parent_id else ''
+                self.path = f'{prefix}{self.pk:0{COMMENT_PATH_STEP}d}'
+                Comment.objects.filter(pk=self.pk).update(path=self.path)
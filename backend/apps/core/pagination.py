@@ -0,0 +1,261 @@
+"""
+Core 페이지네이션
+- 기본은 페이지 번호 방식(PageNumberPagination)이며,
+  요청에 ?pagination=cursor 또는 ?cursor= 가 있으면 키셋(커서) 방식으로 동작합니다.
+- 키셋 방식은 OFFSET과 전체 COUNT(*) 없이 (정렬 컬럼, id) 조건으로 다음 페이지를 찾으므로
+  몇 번째 페이지든 조회 시간이 일정합니다.
+- 댓글은 ?mode=tree로 스레드(최상위 댓글 + 처음 답글) 목록을 받을 수 있습니다.
+"""
+
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션
+    - ordering: (정렬 컬럼, 'id') 두 개로 구성, '-' 접두사는 내림차순
+    - 커서에는 마지막(또는 첫) 행의 정렬 값과 방향이 base64로 인코딩됩니다.
+    """
+    ordering = ('-created_at', '-id')
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    invalid_cursor_message = '잘못된 커서입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset의 비동기 버전 (ASGI 비동기 뷰용, async_views.py)"""
+        return self.set_page([obj async for obj in self.page_queryset(queryset, request)])
+
+    def page_queryset(self, queryset, request):
+        """현재 페이지 조회 쿼리셋 (다음 페이지 존재 여부 확인을 위해 한 건 더 조회)"""
+        self.request = request
+        self.base_url = remove_query_param(request.build_absolute_uri(), 'page')
+        self.model = queryset.model
+
+        self.reverse, self.position = self.decode_cursor(request)
+        ordering = [self._flip(field) for field in self.ordering] if self.reverse else list(self.ordering)
+        queryset = queryset.order_by(*ordering)
+        if self.position is not None:
+            queryset = queryset.filter(self._after(ordering, self.position))
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, results):
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if self.reverse:
+            results.reverse()
+            self.has_next, self.has_previous = self.position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.position is not None
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(reverse=False, obj=self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(reverse=True, obj=self.page[0])
+
+    # ----- 커서 인코딩 -----
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return False, None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            if len(payload['p']) != len(self.ordering):
+                raise ValueError
+            position = [
+                self.model._meta.get_field(self._name(field)).to_python(value)
+                for field, value in zip(self.ordering, payload['p'])
+            ]
+            return bool(payload.get('r')), position
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, reverse, obj):
+        values = []
+        for field in self.ordering:
+            value = getattr(obj, self._name(field))
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        payload = json.dumps({'r': int(reverse), 'p': values}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def _link(self, reverse, obj):
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self.encode_cursor(reverse, obj)
+        )
+
+    # ----- 조건식 -----
+
+    @staticmethod
+    def _name(field):
+        return field.lstrip('-')
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else '-' + field
+
+    def _after(self, ordering, position):
+        """(f1, f2) 정렬에서 position 다음 행 조건: f1 > v1 OR (f1 = v1 AND f2 > v2)"""
+        (first, second), (first_value, second_value) = ordering, position
+        first_lookup = '__lt' if first.startswith('-') else '__gt'
+        second_lookup = '__lt' if second.startswith('-') else '__gt'
+        return (
+            Q(**{self._name(first) + first_lookup: first_value})
+            | Q(**{self._name(first): first_value, self._name(second) + second_lookup: second_value})
+        )
+
+
+class SwitchablePagination(PageNumberPagination):
+    """
+    페이지 번호/키셋 전환 페이지네이션
+    - 기본: {"count", "next", "previous", "results"} (페이지 번호 방식)
+    - ?pagination=cursor 또는 ?cursor=...: {"next", "previous", "results"} (키셋 방식, COUNT 없음)
+    """
+    keyset_class = KeysetPagination
+    mode_query_param = 'pagination'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.get_keyset(request)
+        if self.keyset is not None:
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        paginate_queryset의 비동기 버전 (ASGI 비동기 뷰용, async_views.py)
+        - COUNT와 페이지 조회를 비동기 ORM으로 실행합니다.
+        """
+        self.keyset = self.get_keyset(request)
+        if self.keyset is not None:
+            return await self.keyset.apaginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        self.page.object_list = [obj async for obj in self.page.object_list]
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return list(self.page)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_keyset(self, request):
+        """요청이 키셋 방식이면 키셋 페이지네이션 객체, 아니면 None"""
+        return self.keyset_class() if self.use_keyset(request) else None
+
+    def use_keyset(self, request):
+        params = request.query_params
+        return (
+            params.get(self.mode_query_param) == 'cursor'
+            or self.keyset_class.cursor_query_param in params
+        )
+
+
+class PostKeysetPagination(KeysetPagination):
+    """게시글: 최신순 (-created_at, -id)"""
+    ordering = ('-created_at', '-id')
+
+
+class CommentKeysetPagination(KeysetPagination):
+    """댓글: 작성순 (created_at, id)"""
+    ordering = ('created_at', 'id')
+
+
+class CommentTreeKeysetPagination(KeysetPagination):
+    """댓글 트리: 경로순 (path, id), 답글이 부모 바로 뒤에 오는 깊이 우선 순서 (models.CommentQuerySet)"""
+    ordering = ('path', 'id')
+
+
+class CommentThreadPagination(CommentTreeKeysetPagination):
+    """
+    댓글 스레드 목록 (?mode=tree)
+    - 최상위 댓글을 경로순 키셋으로 나누고, 페이지에 든 스레드들의 처음 COMMENT_THREAD_REPLIES개 답글을
+      범위 쿼리 한 번으로 가져와 각 최상위 댓글의 thread_replies, thread_reply_count에 붙입니다.
+    - 댓글이 수만 개인 게시글도 페이지당 쿼리 두 번(최상위 댓글, 답글)으로 일정합니다.
+    """
+
+    def page_queryset(self, queryset, request):
+        self.replies_queryset = queryset
+        return super().page_queryset(queryset.filter(depth=0), request)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        roots = super().paginate_queryset(queryset, request, view)
+        if roots:
+            self.attach_replies(roots, list(self.thread_replies(roots)))
+        return roots
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        roots = await super().apaginate_queryset(queryset, request, view)
+        if roots:
+            self.attach_replies(roots, [reply async for reply in self.thread_replies(roots)])
+        return roots
+
+    def thread_replies(self, roots):
+        return self.replies_queryset.thread_replies(roots, settings.COMMENT_THREAD_REPLIES)
+
+    @staticmethod
+    def attach_replies(roots, replies):
+        threads = {}
+        for reply in replies:
+            threads.setdefault(reply.thread, []).append(reply)
+        for root in roots:
+            root.thread_replies = threads.get(root.path, [])
+            root.thread_reply_count = root.thread_replies[0].thread_reply_count if root.thread_replies else 0
+
+
+class PostPagination(SwitchablePagination):
+    keyset_class = PostKeysetPagination
+
+
+class CommentPagination(SwitchablePagination):
+    """댓글: 페이지 번호/키셋 전환, ?mode=tree면 스레드 목록 (CommentThreadPagination)"""
+    keyset_class = CommentKeysetPagination
+    tree_class = CommentThreadPagination
+    tree_query_param = 'mode'
+
+    def get_keyset(self, request):
+        if self.use_tree(request):
+            return self.tree_class()
+        return super().get_keyset(request)
+
+    @classmethod
+    def use_tree(cls, request):
+        return request.query_params.get(cls.tree_query_param) == 'tree'
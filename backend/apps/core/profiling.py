@@ -0,0 +1,295 @@
+"""
+요청 프로파일링
+- 요청마다 처리 시간, DB 시간, 쿼리 수, 중복 쿼리 수를 재고 뷰(URL 이름)별 히스토그램으로 모읍니다.
+  (프로세스 메모리 기준, /api/metrics/에서 Prometheus 텍스트 형식으로 노출)
+- 쿼리 시간은 모든 DB 연결에 설치한 execute_wrapper로 재므로 복제본/연결 풀/비동기 뷰의 스레드에서도 집계됩니다.
+- 중복 쿼리: 같은 SQL과 같은 파라미터가 한 요청에서 두 번 이상 실행된 경우 (PROFILING_DUPLICATE_WARNING 이상이면 로그)
+- PROFILING_SAMPLE_RATE 비율의 동기 요청은 cProfile로 프로파일링해 PROFILING_DIR에 .prof 파일로 저장합니다.
+"""
+
+import bisect
+import cProfile
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# 현재 요청의 프로파일 (sync_to_async로 실행되는 스레드에도 전달됨)
+_current = ContextVar('request_profile', default=None)
+
+
+class RequestProfile:
+    """요청 하나의 DB 사용량"""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.seen = Counter()
+        self._lock = threading.Lock()
+
+    def add_query(self, sql, params, seconds):
+        with self._lock:
+            self.queries += 1
+            self.db_seconds += seconds
+            self.seen[(sql, repr(params))] += 1
+
+    @property
+    def duplicates(self):
+        """같은 쿼리가 반복 실행된 횟수 (첫 실행 제외)"""
+        return sum(count - 1 for count in self.seen.values() if count > 1)
+
+    def top_duplicate(self):
+        (sql, _), count = self.seen.most_common(1)[0]
+        return sql, count
+
+
+def record_query(execute, sql, params, many, context):
+    """DB 연결의 execute_wrapper: 현재 요청 프로파일에 쿼리 시간 기록"""
+    profile = _current.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.add_query(sql, params, time.perf_counter() - started)
+
+
+def instrument(connection):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    instrument(connection)
+
+
+connection_created.connect(_on_connection_created, dispatch_uid='core_profiling_instrument')
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus 형식)"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip((*self.buckets, float('inf')), self.counts):
+            total += count
+            yield bound, total
+
+
+class EndpointStats:
+    def __init__(self):
+        self.duration = Histogram(LATENCY_BUCKETS)
+        self.db_duration = Histogram(LATENCY_BUCKETS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.duplicates = 0
+        self.errors = 0
+
+
+class ProfilingStats:
+    """뷰별 요청 통계 (프로세스 메모리)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, view, method, status, seconds, profile):
+        with self._lock:
+            stats = self._endpoints.get((view, method))
+            if stats is None:
+                stats = self._endpoints[(view, method)] = EndpointStats()
+            stats.duration.observe(seconds)
+            stats.db_duration.observe(profile.db_seconds)
+            stats.queries.observe(profile.queries)
+            stats.duplicates += profile.duplicates
+            if status >= 500:
+                stats.errors += 1
+
+    def items(self):
+        with self._lock:
+            return sorted(self._endpoints.items())
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+profiling_stats = ProfilingStats()
+
+
+class RequestProfiler:
+    """요청 하나를 측정하는 범위 (미들웨어에서 사용)"""
+
+    def __init__(self, request):
+        self.request = request
+        self.profile = RequestProfile()
+        self.profiler = None
+
+    def start(self, sample=False):
+        # 시그널 연결 전에 만들어진 연결에도 설치 (현재 스레드)
+        for connection in connections.all(initialized_only=True):
+            instrument(connection)
+        self.token = _current.set(self.profile)
+        if sample:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self.started = time.perf_counter()
+
+    def stop(self):
+        elapsed = time.perf_counter() - self.started
+        if self.profiler is not None:
+            self.profiler.disable()
+        _current.reset(self.token)
+        return elapsed
+
+    def finish(self, response):
+        elapsed = self.stop()
+
+        view = self.view_name()
+        profile = self.profile
+        profiling_stats.record(view, self.request.method, response.status_code, elapsed, profile)
+        response['Server-Timing'] = ', '.join(filter(None, [
+            response.get('Server-Timing'),
+            f'app;dur={elapsed * 1000:.2f}',
+            f'db;dur={profile.db_seconds * 1000:.2f};desc="{profile.queries}"',
+        ]))
+
+        threshold = getattr(settings, 'PROFILING_DUPLICATE_WARNING', 5)
+        if threshold and profile.duplicates >= threshold:
+            sql, count = profile.top_duplicate()
+            logger.warning(
+                '중복 쿼리 %d개: %s %s (가장 많이 반복된 쿼리 %d회: %s)',
+                profile.duplicates, self.request.method, self.request.path, count, sql[:300],
+            )
+        if self.profiler is not None:
+            self.save_profile(view, elapsed)
+        return response
+
+    def view_name(self):
+        match = getattr(self.request, 'resolver_match', None)
+        if match is None:
+            return 'unmatched'
+        return match.view_name or match._func_path
+
+    def save_profile(self, view, elapsed):
+        directory = settings.PROFILING_DIR
+        os.makedirs(directory, exist_ok=True)
+        filename = f'{time.strftime("%Y%m%d-%H%M%S")}-{view.replace(":", "_")}-{int(elapsed * 1000)}ms-{os.getpid()}.prof'
+        path = os.path.join(directory, filename)
+        self.profiler.dump_stats(path)
+        logger.info('cProfile 저장: %s %s -> %s', self.request.method, self.request.path, path)
+
+
+def should_sample():
+    rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+    return rate > 0 and random.random() < rate
+
+
+# ----- Prometheus 텍스트 형식 -----
+
+def _labels(**labels):
+    if not labels:
+        return ''
+
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{key}="{escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _bound(value):
+    return '+Inf' if value == float('inf') else repr(float(value))
+
+
+def _histogram(lines, name, help_text, series):
+    lines.append(f'# HELP {name} {help_text}')
+    lines.append(f'# TYPE {name} histogram')
+    for labels, histogram in series:
+        total = 0
+        for bound, total in histogram.cumulative():
+            lines.append(f'{name}_bucket{_labels(**labels, le=_bound(bound))} {total}')
+        lines.append(f'{name}_sum{_labels(**labels)} {histogram.sum:.6f}')
+        lines.append(f'{name}_count{_labels(**labels)} {total}')
+
+
+def _metric(lines, name, kind, help_text, series):
+    lines.append(f'# HELP {name} {help_text}')
+    lines.append(f'# TYPE {name} {kind}')
+    for labels, value in series:
+        lines.append(f'{name}{_labels(**labels)} {value}')
+
+
+def render_metrics():
+    """요청/캐시/인증 사용자 캐시/비밀번호 해시/DB 연결 지표를 Prometheus 텍스트 형식으로 반환"""
+    from apps.accounts.authentication import user_cache
+    from apps.accounts.hashing import password_hasher
+
+    from .cache import response_cache
+    from .db.metrics import connection_metrics
+    from .db.pool import pool_snapshot
+
+    endpoints = [({'view': view, 'method': method}, stats) for (view, method), stats in profiling_stats.items()]
+    lines = []
+    _histogram(lines, 'app_request_duration_seconds', '요청 처리 시간(초)',
+               [(labels, stats.duration) for labels, stats in endpoints])
+    _histogram(lines, 'app_request_db_seconds', '요청당 DB 쿼리 시간(초)',
+               [(labels, stats.db_duration) for labels, stats in endpoints])
+    _histogram(lines, 'app_request_queries', '요청당 DB 쿼리 수',
+               [(labels, stats.queries) for labels, stats in endpoints])
+    _metric(lines, 'app_request_duplicate_queries_total', 'counter', '같은 요청에서 반복 실행된 쿼리 수',
+            [(labels, stats.duplicates) for labels, stats in endpoints])
+    _metric(lines, 'app_request_errors_total', 'counter', '5xx 응답 수',
+            [(labels, stats.errors) for labels, stats in endpoints])
+
+    _metric(lines, 'app_response_cache_total', 'counter', '응답 캐시 적중/실패 수', [
+        ({'view': view, 'result': outcome}, count)
+        for view, outcomes in response_cache.snapshot().items()
+        for outcome, count in outcomes.items()
+    ])
+
+    users = user_cache.snapshot()
+    _metric(lines, 'app_auth_user_cache_total', 'counter', 'JWT 인증 사용자 캐시 조회 결과 수', [
+        ({'result': name}, users[name]) for name in ('local_hits', 'shared_hits', 'misses')
+    ])
+
+    hashing = password_hasher.snapshot()
+    _metric(lines, 'app_password_hashing_total', 'counter', '비밀번호 해시 계산 수 (처리 방식별)', [
+        ({'result': name}, hashing[name]) for name in ('pooled', 'inline', 'rejected', 'fallbacks')
+    ])
+    _metric(lines, 'app_password_hashing_in_flight', 'gauge', '계산 중이거나 대기 중인 비밀번호 해시 수',
+            [({}, hashing['in_flight'])])
+
+    db = connection_metrics.snapshot()
+    _metric(lines, 'app_db_connection_events_total', 'counter', 'DB 연결 이벤트 수', [
+        ({'event': name}, db[name])
+        for name in ('connections', 'new_connections', 'pool_reuses', 'pool_waits',
+                     'pool_timeouts', 'pool_recycled', 'health_check_failures')
+    ])
+    _metric(lines, 'app_db_connect_seconds_total', 'counter', 'DB 연결에 걸린 시간(초)',
+            [({}, db['connect_seconds'])])
+    _metric(lines, 'app_db_pool_connections', 'gauge', '연결 풀의 연결 수', [
+        ({'alias': alias, 'state': state}, pool[state])
+        for alias, pool in pool_snapshot().items()
+        for state in ('in_use', 'idle')
+    ])
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,226 @@
+"""
+게시글 전문 검색
+- 제목/내용 검색을 LIKE '%검색어%' 전체 스캔 대신 전문 검색 인덱스로 처리합니다.
+- MySQL: FULLTEXT 인덱스(ngram 파서, 한국어 대응) + MATCH ... AGAINST
+- 그 외(SQLite 등): 제목/내용 부분 일치(LIKE) 검색
+- 순수 Python 역색인(inverted index)은 프로세스마다 따로 만들고 갱신하므로 명시적으로 지정할 때만 사용합니다.
+- 사용할 백엔드는 SEARCH_BACKEND 설정으로 지정합니다. ('auto', 'mysql', 'like', 'inverted')
+"""
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+# MySQL ngram_token_size 기본값과 동일하게 2글자 단위로 자름
+NGRAM_SIZE = 2
+
+# 제목에 등장한 검색어는 내용보다 높은 가중치
+TITLE_WEIGHT = 2
+
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize_words(text):
+    """검색어를 단어 목록으로 분리 (ngram 크기보다 짧은 단어는 제외)"""
+    return [word for word in WORD_RE.findall(text.lower()) if len(word) >= NGRAM_SIZE]
+
+
+def ngrams(text):
+    """텍스트를 ngram 토큰 목록으로 변환"""
+    tokens = []
+    for word in tokenize_words(text):
+        tokens.extend(word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1))
+    return tokens
+
+
+class BaseSearchBackend:
+    """검색 백엔드 기본 클래스"""
+
+    def search(self, queryset, query):
+        """
+        queryset에서 query와 일치하는 게시글을 관련도(search_rank) 순으로 반환
+        - 인덱싱할 수 있는 단어가 없으면 제목/내용 부분 일치 검색으로 대체
+        """
+        if not tokenize_words(query):
+            return queryset.filter(Q(title__icontains=query) | Q(content__icontains=query))
+        return self.match(queryset, query)
+
+    def match(self, queryset, query):
+        raise NotImplementedError
+
+    def index_post(self, post):
+        """게시글 저장 시 호출 (인덱스 갱신)"""
+
+    def remove_post(self, post_id):
+        """게시글 삭제 시 호출 (인덱스에서 제거)"""
+
+
+class LikeSearchBackend(BaseSearchBackend):
+    """
+    부분 일치(LIKE) 검색 백엔드
+    - 모든 단어가 제목 또는 내용에 포함된 글을 찾고, 제목에 모두 포함된 글을 앞에 둡니다. (같으면 최신순)
+    - 인덱스를 쓰지 않으므로 게시글이 많은 MySQL에서는 FULLTEXT 백엔드를 사용하세요.
+    """
+
+    def match(self, queryset, query):
+        words = tokenize_words(query)
+        condition, in_title = Q(), Q()
+        for word in words:
+            condition &= Q(title__icontains=word) | Q(content__icontains=word)
+            in_title &= Q(title__icontains=word)
+        rank = Case(When(in_title, then=Value(1.0)), default=Value(0.0), output_field=FloatField())
+        return queryset.filter(condition).annotate(search_rank=rank).order_by('-search_rank', '-created_at')
+
+
+class MySQLFulltextBackend(BaseSearchBackend):
+    """
+    MySQL FULLTEXT 검색 백엔드
+    - 인덱스는 마이그레이션(0004)에서 생성되며 MySQL이 자동으로 갱신합니다.
+    - BOOLEAN MODE에서 각 단어를 +"단어" 구문으로 묶어 모든 단어를 포함하는 글만 찾습니다.
+    """
+
+    def match(self, queryset, query):
+        table = queryset.model._meta.db_table
+        against = ' '.join('+"%s"' % word for word in tokenize_words(query))
+        rank = RawSQL(
+            f'MATCH({table}.title, {table}.content) AGAINST (%s IN BOOLEAN MODE)',
+            [against],
+            output_field=FloatField(),
+        )
+        return queryset.annotate(search_rank=rank).filter(search_rank__gt=0).order_by(
+            '-search_rank', '-created_at'
+        )
+
+
+class InvertedIndexBackend(BaseSearchBackend):
+    """
+    순수 Python 역색인 검색 백엔드
+    - 첫 검색 시 전체 게시글로 색인을 만들고, 이후에는 저장/삭제 시그널로 증분 갱신합니다.
+    - 모든 검색어 ngram을 포함하는 글만 찾고 TF-IDF 점수로 정렬합니다.
+    - 색인은 프로세스 메모리에 있으므로 테스트/개발 환경용입니다. (SEARCH_BACKEND='inverted'일 때만 사용)
+      여러 워커에서는 다른 워커의 저장/삭제가 반영되지 않고, 워커마다 전체 게시글을 읽어 색인을 만듭니다.
+    """
+
+    def __init__(self):
+        self._postings = defaultdict(dict)  # ngram -> {post_id: 가중 빈도}
+        self._documents = {}                # post_id -> 색인된 ngram 목록
+        self._built = False
+        self._lock = threading.RLock()
+
+    def _build(self):
+        from .models import Post
+
+        with self._lock:
+            if self._built:
+                return
+            for post in Post.objects.only('id', 'title', 'content').iterator(chunk_size=2000):
+                self._add(post)
+            self._built = True
+
+    def _add(self, post):
+        counts = Counter(ngrams(post.content))
+        for token in ngrams(post.title):
+            counts[token] += TITLE_WEIGHT
+        for token, count in counts.items():
+            self._postings[token][post.pk] = count
+        self._documents[post.pk] = list(counts)
+
+    def _remove(self, post_id):
+        for token in self._documents.pop(post_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(post_id, None)
+                if not postings:
+                    del self._postings[token]
+
+    def index_post(self, post):
+        with self._lock:
+            if not self._built:
+                return
+            self._remove(post.pk)
+            self._add(post)
+
+    def remove_post(self, post_id):
+        with self._lock:
+            if self._built:
+                self._remove(post_id)
+
+    def scores(self, query):
+        """검색어와 일치하는 {post_id: 점수}"""
+        self._build()
+        tokens = set(ngrams(query))
+        with self._lock:
+            postings = [self._postings.get(token, {}) for token in tokens]
+            if not postings or not all(postings):
+                return {}
+            total = len(self._documents)
+            candidates = set.intersection(*(set(p) for p in postings))
+            scores = dict.fromkeys(candidates, 0.0)
+            for p in postings:
+                idf = math.log(1 + total / len(p))
+                for post_id in candidates:
+                    scores[post_id] += p[post_id] * idf
+        return scores
+
+    def match(self, queryset, query):
+        """
+        점수 상위 SEARCH_MAX_CANDIDATES개 안에서 일치하는 글을 반환하고,
+        그중 SEARCH_MAX_RESULTS개만 관련도 순으로 앞에 둠 (나머지는 최신순)
+        - SQL의 IN 목록은 후보 수로 제한합니다.
+        - 후보가 SEARCH_MAX_RESULTS보다 많으면 queryset의 필터(카테고리, 작성자, 공개 여부)를 먼저 적용한 글 중에서
+          상위 글을 고릅니다. (전체에서 고르면 필터 후 남는 글이 줄어듦)
+        """
+        scores = self.scores(query)
+        if not scores:
+            return queryset.none()
+        post_ids = heapq.nlargest(
+            getattr(settings, 'SEARCH_MAX_CANDIDATES', 2000), scores, key=scores.__getitem__
+        )
+        limit = getattr(settings, 'SEARCH_MAX_RESULTS', 200)
+        if len(post_ids) > limit:
+            post_ids = list(queryset.filter(pk__in=post_ids).values_list('pk', flat=True))
+        top = sorted(post_ids, key=scores.__getitem__, reverse=True)[:limit]
+        rank = Case(
+            *[When(pk=post_id, then=Value(scores[post_id])) for post_id in top],
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=post_ids).annotate(
+            search_rank=rank
+        ).order_by('-search_rank', '-created_at')
+
+
+BACKENDS = {
+    'mysql': MySQLFulltextBackend,
+    'like': LikeSearchBackend,
+    'inverted': InvertedIndexBackend,
+}
+
+_backends = {}
+_backend_lock = threading.Lock()
+
+
+def get_search_backend():
+    """설정에 맞는 검색 백엔드 (종류마다 프로세스당 하나)"""
+    name = getattr(settings, 'SEARCH_BACKEND', 'auto')
+    if name == 'auto':
+        name = 'mysql' if connection.vendor == 'mysql' else 'like'
+    backend = _backends.get(name)
+    if backend is None:
+        with _backend_lock:
+            backend = _backends.get(name)
+            if backend is None:
+                backend = _backends[name] = BACKENDS[name]()
+    return backend
+
+
+def search_posts(queryset, query):
+    """게시글 검색 (관련도 순)"""
+    return get_search_backend().search(queryset, query)
@@ -3,8 +3,14 @@ Core 시리얼라이저
 - 게시글, 첨부파일, 댓글 등의 직렬화/역직렬화를 담당합니다.
 """
 
+from django.conf import settings
+from django.urls import reverse
 from rest_framework import serializers
-from .models import Category, Post, Attachment, Comment
+
+from .models import Category, Post, Attachment, Comment, UploadSession
+from .pagination import CommentKeysetPagination, CommentTreeKeysetPagination
+from .thumbnails import is_image, thumbnail_urls
+from .uploads import file_extension
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -15,61 +21,218 @@ class CategorySerializer(serializers.ModelSerializer):
 
 
 class AttachmentSerializer(serializers.ModelSerializer):
-    """첨부파일 시리얼라이저"""
+    """
+    첨부파일 시리얼라이저
+    - download_url: 권한 확인과 Range 요청을 지원하는 다운로드 API 주소
+    - thumbnails: 이미지 파일의 크기별 썸네일 주소 (이미지가 아니면 null)
+    """
+    download_url = serializers.SerializerMethodField()
+    thumbnails = serializers.SerializerMethodField()
+
     class Meta:
         model = Attachment
-        fields = ['id', 'file', 'original_name', 'file_size', 'uploaded_at']
-        read_only_fields = ['file_size', 'uploaded_at']
+        fields = [
+            'id', 'file', 'download_url', 'thumbnails', 'original_name',
+            'file_size', 'content_hash', 'uploaded_at'
+        ]
+        read_only_fields = ['file_size', 'content_hash', 'uploaded_at']
+
+    def get_download_url(self, obj):
+        url = reverse('post-download-file', kwargs={'pk': obj.post_id, 'file_id': obj.pk})
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+    def get_thumbnails(self, obj):
+        if not obj.content_hash or not is_image(obj.original_name):
+            return None
+        return thumbnail_urls(
+            self.context.get('request'), 'post-thumbnail-file', pk=obj.post_id, file_id=obj.pk
+        )
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    분할 업로드 세션 시리얼라이저
+    - 시작 시 file_name, file_size를 받고, 진행 상황(received_size)을 반환합니다.
+    """
+    file_name = serializers.CharField(source='original_name', max_length=255)
+    file_size = serializers.IntegerField(source='total_size', min_value=1)
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = ['id', 'file_name', 'file_size', 'received_size', 'chunk_size', 'created_at']
+        read_only_fields = ['id', 'received_size', 'created_at']
+
+    def get_chunk_size(self, obj):
+        return settings.UPLOAD_CHUNK_SIZE
+
+    def validate_file_name(self, value):
+        ext = file_extension(value)
+        if ext not in settings.ALLOWED_FILE_EXTENSIONS:
+            raise serializers.ValidationError(
+                f"허용되지 않는 파일 형식입니다. 허용: {settings.ALLOWED_FILE_EXTENSIONS}"
+            )
+        return value
+
+    def validate_file_size(self, value):
+        if value > settings.ATTACHMENT_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"파일 크기가 너무 큽니다. (최대 {settings.ATTACHMENT_MAX_SIZE // (1024 * 1024)}MB)"
+            )
+        return value
 
 
 class CommentSerializer(serializers.ModelSerializer):
-    """댓글 시리얼라이저"""
+    """
+    댓글 시리얼라이저
+    - parent를 보내면 같은 게시글 댓글의 답글로 작성 (최대 깊이 COMMENT_MAX_DEPTH, 작성 후 변경 불가)
+    """
     author_name = serializers.CharField(source='author.username', read_only=True)
 
     class Meta:
         model = Comment
-        fields = ['id', 'content', 'author', 'author_name', 'created_at', 'updated_at']
-        read_only_fields = ['author', 'created_at', 'updated_at']
+        fields = ['id', 'content', 'author', 'author_name', 'parent', 'depth', 'created_at', 'updated_at']
+        read_only_fields = ['author', 'depth', 'created_at', 'updated_at']
+
+    def validate_parent(self, value):
+        if self.instance is not None:
+            if value != self.instance.parent:
+                raise serializers.ValidationError('답글 위치는 바꿀 수 없습니다.')
+            return value
+        if value is None:
+            return value
+        view = self.context.get('view')
+        post_pk = view.kwargs.get('post_pk') if view else None
+        if str(value.post_id) != str(post_pk):
+            raise serializers.ValidationError('같은 게시글의 댓글에만 답글을 달 수 있습니다.')
+        if value.depth + 1 > settings.COMMENT_MAX_DEPTH:
+            raise serializers.ValidationError(f'답글은 {settings.COMMENT_MAX_DEPTH}단계까지만 달 수 있습니다.')
+        return value
+
+
+class CommentThreadSerializer(CommentSerializer):
+    """
+    댓글 스레드 시리얼라이저 (?mode=tree)
+    - replies: 처음 COMMENT_THREAD_REPLIES개 답글 (경로순, depth로 들여쓰기)
+    - reply_count: 스레드의 전체 답글 수, replies_next: 나머지 답글 주소 (replies 액션, 커서)
+    """
+    replies = serializers.SerializerMethodField()
+    reply_count = serializers.SerializerMethodField()
+    replies_next = serializers.SerializerMethodField()
+
+    class Meta(CommentSerializer.Meta):
+        fields = CommentSerializer.Meta.fields + ['replies', 'reply_count', 'replies_next']
+
+    def get_replies(self, obj):
+        return CommentSerializer(getattr(obj, 'thread_replies', []), many=True, context=self.context).data
+
+    def get_reply_count(self, obj):
+        return getattr(obj, 'thread_reply_count', 0)
+
+    def get_replies_next(self, obj):
+        replies = getattr(obj, 'thread_replies', [])
+        if not replies or self.get_reply_count(obj) <= len(replies):
+            return None
+        pagination = CommentTreeKeysetPagination()
+        url = '{}?{}={}'.format(
+            reverse('post-comments-replies', kwargs={'post_pk': obj.post_id, 'pk': obj.pk}),
+            pagination.cursor_query_param,
+            pagination.encode_cursor(False, replies[-1]),
+        )
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+class LikedStatusMixin:
+    """
+    좋아요 여부(is_liked) 필드 믹스인
+    - 뷰가 context['liked_post_ids']에 페이지 전체의 좋아요 게시글 ID를 한 번에 넣어주면
+      게시글마다 쿼리하지 않고 집합에서 확인합니다.
+    """
+
+    def get_is_liked(self, obj):
+        liked_post_ids = self.context.get('liked_post_ids')
+        if liked_post_ids is not None:
+            return obj.pk in liked_post_ids
+        request = self.context.get('request')
+        if request and request.user.is_authenticated:
+            return obj.likes.filter(id=request.user.id).exists()
+        return False
 
 
-class PostListSerializer(serializers.ModelSerializer):
-    """게시글 목록용 시리얼라이저"""
+class PostListSerializer(LikedStatusMixin, serializers.ModelSerializer):
+    """
+    게시글 목록용 시리얼라이저
+    - comment_count, likes_count는 Post의 비정규화 컬럼 값을 사용합니다.
+    """
     author_name = serializers.CharField(source='author.username', read_only=True)
     category_name = serializers.CharField(source='category.name', read_only=True)
-    comment_count = serializers.IntegerField(source='comments.count', read_only=True)
-    likes_count = serializers.IntegerField(source='likes.count', read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
+    likes_count = serializers.IntegerField(read_only=True)
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = [
             'id', 'title', 'author', 'author_name', 'category',
-            'category_name', 'views', 'comment_count', 'likes_count', 'created_at'
+            'category_name', 'views', 'comment_count', 'likes_count', 'is_liked', 'created_at'
         ]
 
 
-class PostDetailSerializer(serializers.ModelSerializer):
-    """게시글 상세용 시리얼라이저"""
+class PostDetailSerializer(LikedStatusMixin, serializers.ModelSerializer):
+    """
+    게시글 상세용 시리얼라이저
+    - likes_count, comment_count는 Post의 비정규화 컬럼 값을 사용합니다.
+    - comments에는 처음 POST_DETAIL_COMMENTS개 댓글만 담고(작성순), 더 있으면
+      comments_next에 댓글 API의 다음 페이지 주소(커서)를 넣습니다.
+      댓글이 아무리 많아도 상세 응답의 크기와 조회 시간은 일정합니다.
+    """
     author_name = serializers.CharField(source='author.username', read_only=True)
     category_name = serializers.CharField(source='category.name', read_only=True)
     attachments = AttachmentSerializer(many=True, read_only=True)
-    comments = CommentSerializer(many=True, read_only=True)
-    likes_count = serializers.IntegerField(source='likes.count', read_only=True)
+    comments = serializers.SerializerMethodField()
+    comment_count = serializers.IntegerField(read_only=True)
+    comments_next = serializers.SerializerMethodField()
+    likes_count = serializers.IntegerField(read_only=True)
     is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = [
             'id', 'title', 'content', 'author', 'author_name',
-            'category', 'category_name', 'views', 'is_public',
-            'likes_count', 'is_liked', 'attachments', 'comments', 'created_at', 'updated_at'
+            'category', 'category_name', 'views', 'is_public', 'likes_count', 'is_liked',
+            'attachments', 'comments', 'comment_count', 'comments_next', 'created_at', 'updated_at'
         ]
         read_only_fields = ['author', 'views', 'created_at', 'updated_at']
 
-    def get_is_liked(self, obj):
+    def first_comments(self, obj):
+        # PostQuerySet.for_detail()의 prefetch 결과 (없으면 직접 조회), 다음 댓글 확인용으로 한 건 더 포함
+        comments = getattr(obj, 'first_comments', None)
+        if comments is None:
+            comments = obj.first_comments = list(
+                obj.comments.select_related('author')
+                .order_by('created_at', 'id')[:settings.POST_DETAIL_COMMENTS + 1]
+            )
+        return comments
+
+    def get_comments(self, obj):
+        comments = self.first_comments(obj)[:settings.POST_DETAIL_COMMENTS]
+        return CommentSerializer(comments, many=True, context=self.context).data
+
+    def get_comments_next(self, obj):
+        comments = self.first_comments(obj)
+        if len(comments) <= settings.POST_DETAIL_COMMENTS:
+            return None
+        last = comments[settings.POST_DETAIL_COMMENTS - 1]
+        pagination = CommentKeysetPagination()
+        url = '{}?{}={}'.format(
+            reverse('post-comments-list', kwargs={'post_pk': obj.pk}),
+            pagination.cursor_query_param,
+            pagination.encode_cursor(False, last),
+        )
         request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.likes.filter(id=request.user.id).exists()
-        return False
+        return request.build_absolute_uri(url) if request else url
 
 
 class PostCreateSerializer(serializers.ModelSerializer):
@@ -0,0 +1,66 @@
+"""
+Core 시그널 핸들러
+- 모델 변경 시 함께 갱신해야 하는 부가 데이터(검색 색인, 응답 캐시 등)를 처리합니다.
+"""
+
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from . import tasks
+from .cache import response_cache
+from .models import Attachment, Category, Comment, Post
+from .search import get_search_backend
+from .thumbnails import is_image
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    """게시글 저장 시 검색 색인 갱신"""
+    get_search_backend().index_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    """게시글 삭제 시 검색 색인에서 제거"""
+    get_search_backend().remove_post(instance.pk)
+
+
+@receiver(post_delete, sender=Attachment)
+def release_attachment_file(sender, instance, **kwargs):
+    """
+    첨부파일 삭제 시 파일 정리 작업 예약
+    - 같은 트랜잭션에서 큐에 들어가므로 롤백되면 파일도 그대로 남습니다.
+    """
+    if instance.file.name:
+        tasks.release_attachment_file.delay(instance.file.name, instance.content_hash)
+
+
+@receiver(post_save, sender=Attachment)
+def schedule_attachment_thumbnails(sender, instance, created, **kwargs):
+    """이미지 첨부파일 업로드 시 썸네일 생성 작업 예약"""
+    if not created or not instance.content_hash or not is_image(instance.original_name):
+        return
+    tasks.generate_thumbnails.delay(instance.file.path, instance.content_hash)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def schedule_profile_thumbnails(sender, instance, **kwargs):
+    """새 프로필 이미지가 저장되면 썸네일 생성 작업 예약 (User.save 참고)"""
+    if not getattr(instance, 'profile_image_changed', False) or not instance.profile_image_hash:
+        return
+    tasks.generate_thumbnails.delay(instance.profile_image.path, instance.profile_image_hash)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Attachment)
+@receiver(post_delete, sender=Attachment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(m2m_changed, sender=Post.likes.through)
+def invalidate_response_cache(sender, **kwargs):
+    """게시글 관련 데이터 변경 시 캐시된 응답 무효화"""
+    response_cache.invalidate()
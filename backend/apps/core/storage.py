@@ -0,0 +1,101 @@
+"""
+첨부파일 저장소 (내용 주소 방식)
+- 파일을 SHA-256 해시로 만든 경로(attachments/cas/ab/cd/abcd...ext)에 저장합니다.
+- 같은 내용의 파일은 한 번만 저장되고, 여러 첨부파일 행이 같은 파일을 참조합니다.
+- 파일 삭제는 마지막 참조가 사라질 때만 수행됩니다. (tasks.release_attachment_file)
+- 내용 주소 파일의 저장/재사용과 삭제는 AttachmentBlob 행 잠금으로 직렬화합니다. (lock_blob)
+"""
+
+import hashlib
+import os
+import re
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+CAS_PREFIX = 'attachments/cas'
+CAS_NAME_RE = re.compile(r'^attachments/cas/[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(\.\w+)?$')
+
+# 해시 계산 시 읽는 블록 크기
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def content_addressed_name(content_hash, filename):
+    """해시를 두 단계 디렉터리로 나눈 저장 경로 (디렉터리당 파일 수 분산)"""
+    ext = os.path.splitext(filename)[1].lower()
+    return f'{CAS_PREFIX}/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}{ext}'
+
+
+def hash_file(file):
+    """파일 객체의 SHA-256 (블록 단위로 읽음)"""
+    hasher = hashlib.sha256()
+    for chunk in file.chunks(HASH_BLOCK_SIZE):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def hash_path(path):
+    """디스크 파일의 SHA-256"""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as fp:
+        for block in iter(lambda: fp.read(HASH_BLOCK_SIZE), b''):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def lock_blob(name):
+    """
+    내용 주소 파일 잠금 (현재 트랜잭션이 끝날 때까지 유지)
+    - 파일을 재사용하는 쪽은 첨부파일 행을 저장하는 트랜잭션 안에서 호출해야 합니다. (Attachment.save)
+    """
+    from .models import AttachmentBlob
+
+    AttachmentBlob.objects.lock(name)
+
+
+def attachment_upload_to(instance, filename):
+    """
+    Attachment.file 저장 경로
+    - 해시가 있으면 내용 주소 경로, 없으면 기존 날짜별 경로
+    """
+    if instance.content_hash:
+        return content_addressed_name(instance.content_hash, filename)
+    return instance.dated_upload_path(filename)
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    내용 주소 파일 저장소
+    - 내용 주소 경로에 이미 파일이 있으면 다시 쓰지 않고 기존 파일을 재사용합니다.
+    - 저장 전에 파일을 잠가(lock_blob) 정리 작업이 확인과 삭제 사이에 재사용된 파일을 지우지 않게 합니다.
+    """
+
+    def is_content_addressed(self, name):
+        return bool(CAS_NAME_RE.match(name.replace('\\', '/')))
+
+    def get_available_name(self, name, max_length=None):
+        # 같은 경로 = 같은 내용이므로 이름을 바꾸지 않음
+        if self.is_content_addressed(name):
+            return name
+        return super().get_available_name(name, max_length)
+
+    def _save(self, name, content):
+        if not self.is_content_addressed(name):
+            return super()._save(name, content)
+        lock_blob(name)
+        if self.exists(name):
+            # 중복 파일: 받은 임시 파일만 정리하고 기존 파일 사용
+            if hasattr(content, 'temporary_file_path'):
+                try:
+                    os.remove(content.temporary_file_path())
+                except FileNotFoundError:
+                    pass
+            return name
+        # 임시 이름으로 저장 후 원자적으로 rename (동시에 같은 파일이 올라와도 안전)
+        temp_name = super()._save(f'{name}.tmp', content)
+        os.replace(self.path(temp_name), self.path(name))
+        return name
+
+
+attachment_storage = ContentAddressedStorage()
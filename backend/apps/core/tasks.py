@@ -0,0 +1,39 @@
+"""
+Core 비동기 작업
+- 요청 처리와 분리해 작업 큐(apps.tasks)에서 실행하는 부가 작업입니다.
+- 시그널 핸들러(signals.py)가 .delay()로 큐에 넣습니다.
+"""
+
+from django.db import transaction
+
+from apps.tasks.registry import task
+
+from .models import Attachment, AttachmentBlob
+from .storage import attachment_storage, lock_blob
+from .thumbnails import thumbnails
+
+
+@task(max_attempts=5)
+def release_attachment_file(name, content_hash):
+    """
+    삭제된 첨부파일의 실제 파일 정리
+    - 같은 파일을 참조하는 다른 첨부파일이 없을 때만 삭제합니다. (참조 카운트)
+    - 내용 주소 파일은 잠근 뒤 확인하므로, 같은 파일을 재사용하는 업로드가 진행 중이면 커밋될 때까지 기다렸다가
+      새 첨부파일 행까지 보고 판단합니다. (storage.lock_blob)
+    """
+    content_addressed = attachment_storage.is_content_addressed(name)
+    with transaction.atomic():
+        if content_addressed:
+            lock_blob(name)
+        if not Attachment.objects.filter(file=name).exists():
+            attachment_storage.delete(name)
+            if content_addressed:
+                AttachmentBlob.objects.filter(name=name).delete()
+    if content_hash and not Attachment.objects.filter(content_hash=content_hash).exists():
+        thumbnails.discard(content_hash)
+
+
+@task()
+def generate_thumbnails(source_path, content_hash):
+    """이미지 업로드 후 모든 크기의 썸네일 미리 생성"""
+    thumbnails.generate_all(source_path, content_hash)
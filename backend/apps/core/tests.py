@@ -0,0 +1,619 @@
+"""
+Core 테스트
+- 게시글 목록/상세/검색 API의 요청당 쿼리 수 (N+1 회귀 방지)
+- 검색 결과 수 제한과 목록 필터
+- 키셋(커서) 페이지네이션
+- 댓글 삭제(답글 포함) 후 댓글 수
+- 좋아요 토글
+- 내용 주소 첨부파일의 참조 정리
+- 분할(청크) 업로드의 오프셋 확인과 이어받기
+- 첨부파일 다운로드의 Range/조건부 요청
+- 대량 가져오기(loadposts)의 게시글 키 확인
+- 읽기 복제본 라우팅과 쓰기 직후 고정
+- 실행: DB_ENGINE=sqlite python manage.py test apps.core
+  복제본 별칭까지 확인하려면 DB_REPLICAS=replica.sqlite3 을 함께 지정 (테스트에서는 default를 미러링)
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from django.conf import settings
+from django.contrib import admin
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connections
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from apps.accounts.models import User
+
+from . import tasks
+from .admin import CommentAdmin
+from .db.replicas import ReplicaRouter, _read_from_replica
+from .models import Attachment, AttachmentBlob, Category, Comment, CommentQuerySet, Post, UploadSession
+from .search import LikeSearchBackend, get_search_backend
+from .storage import attachment_storage
+from .uploads import temp_path, write_chunk
+from .view_counter import view_counter
+
+
+@override_settings(DATABASE_REPLICAS=[])
+class PostQueryCountTests(APITestCase):
+    """
+    게시글 조회 API 쿼리 수
+    - 게시글이 한 페이지(10개)보다 많아도 쿼리 수가 게시글 수와 무관해야 합니다.
+    - 비인증 요청은 응답 캐시를 비운 뒤 측정합니다. (캐시 적중이면 쿼리가 없음)
+    - 목록/상세의 첫 쿼리는 조건부 GET 검증 값(ETag/Last-Modified) 계산입니다.
+    - 복제본이 설정되어 있어도 모든 쿼리를 default에서 셉니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='writer@example.com', username='writer', password='pw-1234-test')
+        reader = User.objects.create_user(email='reader@example.com', username='reader', password='pw-1234-test')
+        category = Category.objects.create(name='공지')
+        for i in range(15):
+            post = Post.objects.create(
+                title=f'검색 제목 {i}', content='게시글 내용', author=cls.user, category=category
+            )
+            Comment.objects.create(post=post, author=reader, content='댓글')
+            post.likes.add(reader)
+            Post.objects.filter(pk=post.pk).recount()
+        cls.post = post
+
+    def tearDown(self):
+        # 버퍼에 남은 조회수는 테스트 트랜잭션 안에서 반영 (테스트 DB가 삭제된 뒤 플러셔가 쓰지 않도록)
+        view_counter.flush()
+        cache.clear()
+
+    def assert_queries(self, url, expected, authenticated=False):
+        if authenticated:
+            self.client.force_authenticate(self.user)
+        self.client.get(url)  # 검색 색인 생성 등 첫 요청 비용 제외
+        cache.clear()
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_list_anonymous(self):
+        # 검증 값 + 개수 + 목록(작성자/카테고리 JOIN)
+        response = self.assert_queries('/api/posts/', 3)
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_list_authenticated(self):
+        # + 페이지 전체의 좋아요 여부 한 번
+        response = self.assert_queries('/api/posts/', 4, authenticated=True)
+        self.assertTrue(all(post['is_liked'] is False for post in response.data['results']))
+
+    def test_detail_anonymous(self):
+        # 검증 값 + 게시글 + 첨부파일 + 처음 댓글들 (조회수는 버퍼에만 기록)
+        response = self.assert_queries(f'/api/posts/{self.post.pk}/', 4)
+        self.assertEqual(len(response.data['comments']), 1)
+
+    def test_detail_authenticated(self):
+        self.assert_queries(f'/api/posts/{self.post.pk}/', 5, authenticated=True)
+
+    def test_search_anonymous(self):
+        # 개수 + 목록 (역색인 검색은 메모리에서 처리)
+        response = self.assert_queries('/api/search/?q=검색', 2)
+        self.assertEqual(response.data['count'], 15)
+
+    def test_search_authenticated(self):
+        self.assert_queries('/api/search/?q=검색', 3, authenticated=True)
+
+
+@override_settings(DATABASE_REPLICAS=[])
+class SearchTestCase(APITestCase):
+    """
+    검색 백엔드 공통 테스트 (자유 게시판 5개는 제목과 내용, 공지 4개는 내용에만 검색어가 있음)
+    - 목록 필터(카테고리)를 적용한 뒤에도 일치하는 글이 빠지지 않아야 함
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(email='search@example.com', username='search', password='pw-1234-test')
+        cls.notice = Category.objects.create(name='공지')
+        cls.free = Category.objects.create(name='자유')
+        for i in range(5):
+            Post.objects.create(title=f'릴리스 {i}', content='릴리스 안내', author=author, category=cls.free)
+        for i in range(4):
+            Post.objects.create(title=f'공지 {i}', content='릴리스 일정', author=author, category=cls.notice)
+
+    def tearDown(self):
+        cache.clear()
+
+    def search(self, query):
+        response = self.client.get(f'/api/search/?q={query}')
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_filter_applied_before_ranking(self):
+        response = self.client.get(f'/api/posts/?search=릴리스&category={self.notice.pk}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 4)
+        self.assertEqual({post['category_name'] for post in response.data['results']}, {'공지'})
+
+
+@override_settings(SEARCH_BACKEND='inverted', SEARCH_MAX_RESULTS=3)
+class InvertedIndexSearchTests(SearchTestCase):
+    """역색인 백엔드: 관련도 상위 결과 수(SEARCH_MAX_RESULTS)보다 많이 일치해도 결과 수는 줄지 않음"""
+
+    def test_count_not_capped(self):
+        data = self.search('릴리스')
+        self.assertEqual(data['count'], 9)
+        # 관련도 상위 3개(제목 일치)가 먼저
+        self.assertTrue(all(post['title'].startswith('릴리스') for post in data['results'][:3]))
+
+    @override_settings(SEARCH_MAX_CANDIDATES=6)
+    def test_candidates_capped(self):
+        self.assertEqual(self.search('릴리스')['count'], 6)
+
+
+@override_settings(SEARCH_BACKEND='auto')
+class LikeSearchTests(SearchTestCase):
+    """MySQL이 아닌 DB의 기본(auto) 백엔드는 부분 일치 검색"""
+
+    def test_auto_backend(self):
+        self.assertIsInstance(get_search_backend(), LikeSearchBackend)
+
+    def test_title_matches_first(self):
+        data = self.search('릴리스')
+        self.assertEqual(data['count'], 9)
+        self.assertTrue(all(post['title'].startswith('릴리스') for post in data['results'][:5]))
+
+    def test_all_words_required(self):
+        self.assertEqual(self.search('릴리스 일정')['count'], 4)
+
+
+@override_settings(DATABASE_REPLICAS=[])
+class KeysetPaginationTests(APITestCase):
+    """
+    키셋 페이지네이션: 23개(페이지 10개씩)를 앞뒤로 넘겨도 빠지거나 겹치는 글이 없어야 함
+    - 작성일이 같은 글이 페이지 경계에 걸치도록 절반은 같은 시각으로 맞춤 (id로 순서 결정)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(email='page@example.com', username='page', password='pw-1234-test')
+        posts = [Post.objects.create(title=f'글 {i}', content='내용', author=author) for i in range(23)]
+        Post.objects.filter(pk__in=[post.pk for post in posts[5:17]]).update(created_at=posts[5].created_at)
+        cls.expected = list(Post.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+
+    def tearDown(self):
+        cache.clear()
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def ids(self, data):
+        return [post['id'] for post in data['results']]
+
+    def test_forward_and_back(self):
+        pages = [self.get('/api/posts/?pagination=cursor')]
+        self.assertIsNone(pages[0]['previous'])
+        while pages[-1]['next']:
+            pages.append(self.get(pages[-1]['next']))
+        self.assertEqual([len(page['results']) for page in pages], [10, 10, 3])
+        self.assertEqual([pk for page in pages for pk in self.ids(page)], self.expected)
+        self.assertNotIn('count', pages[0])
+
+        # 마지막(일부만 찬) 페이지에서 이전 페이지로
+        previous = self.get(pages[-1]['previous'])
+        self.assertEqual(self.ids(previous), self.ids(pages[1]))
+        self.assertEqual(self.ids(self.get(previous['previous'])), self.ids(pages[0]))
+        self.assertEqual(self.ids(self.get(previous['next'])), self.ids(pages[-1]))
+
+    def test_page_number_last_page(self):
+        data = self.get('/api/posts/?page=3')
+        self.assertEqual((data['count'], len(data['results']), data['next']), (23, 3, None))
+        self.assertEqual(self.ids(data), self.expected[20:])
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get('/api/posts/?cursor=invalid').status_code, 404)
+        self.assertEqual(self.client.get('/api/posts/?page=4').status_code, 404)
+
+
+class CommentCountTests(APITestCase):
+    """댓글을 삭제하면 함께 삭제되는 답글까지 게시글 댓글 수에서 빠져야 함"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='count@example.com', username='count', password='pw-1234-test')
+        self.post = Post.objects.create(title='댓글 수', content='내용', author=self.user)
+        self.root = Comment.objects.create(post=self.post, author=self.user, content='댓글')
+        reply = Comment.objects.create(post=self.post, author=self.user, content='답글', parent=self.root)
+        Comment.objects.create(post=self.post, author=self.user, content='답글의 답글', parent=reply)
+        Comment.objects.create(post=self.post, author=self.user, content='다른 댓글')
+        Post.objects.filter(pk=self.post.pk).recount()
+        self.admin = CommentAdmin(Comment, admin.site)
+
+    def assert_comment_count(self, expected):
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, expected)
+        self.assertEqual(Comment.objects.filter(post=self.post).count(), expected)
+
+    def test_api_delete_subtree(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.delete(f'/api/posts/{self.post.pk}/comments/{self.root.pk}/')
+        self.assertEqual(response.status_code, 204)
+        self.assert_comment_count(1)
+
+    def test_admin_delete_model(self):
+        self.admin.delete_model(None, self.root)
+        self.assert_comment_count(1)
+
+    def test_decrement_clamped_at_zero(self):
+        # 카운터가 실제보다 작게 어긋난 상태에서 하위 트리 삭제
+        Post.objects.filter(pk=self.post.pk).update(comment_count=1)
+        self.admin.delete_model(None, self.root)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 0)
+
+    def test_insert_rolled_back_without_path(self):
+        # 경로 UPDATE가 실패하면 경로가 빈 댓글이 남지 않아야 함
+        with mock.patch.object(CommentQuerySet, 'update', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                Comment.objects.create(post=self.post, author=self.user, content='실패', parent=self.root)
+        self.assertFalse(Comment.objects.filter(content='실패').exists())
+        self.assertFalse(Comment.objects.filter(path='').exists())
+
+    def test_admin_delete_queryset(self):
+        self.admin.delete_queryset(None, Comment.objects.filter(pk=self.root.pk))
+        self.assert_comment_count(1)
+
+
+class LikeToggleTests(APITestCase):
+    """좋아요 토글은 좋아요 행과 likes_count를 함께 바꿈"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='like@example.com', username='like', password='pw-1234-test')
+        self.other = User.objects.create_user(email='like2@example.com', username='like2', password='pw-1234-test')
+        self.post = Post.objects.create(title='좋아요', content='내용', author=self.user)
+        self.url = f'/api/posts/{self.post.pk}/like/'
+
+    def tearDown(self):
+        cache.clear()
+
+    def toggle(self, user):
+        self.client.force_authenticate(user)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def assert_likes(self, expected):
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, expected)
+        self.assertEqual(self.post.likes.count(), expected)
+
+    def test_toggle(self):
+        self.assertEqual(self.toggle(self.user), {'liked': True, 'likes_count': 1})
+        self.assertEqual(self.toggle(self.other), {'liked': True, 'likes_count': 2})
+        self.assert_likes(2)
+        self.assertEqual(self.toggle(self.user), {'liked': False, 'likes_count': 1})
+        self.assertEqual(self.toggle(self.user), {'liked': True, 'likes_count': 2})
+        self.assert_likes(2)
+
+    def test_unlike_with_drifted_count(self):
+        self.toggle(self.user)
+        Post.objects.filter(pk=self.post.pk).update(likes_count=0)
+        self.assertEqual(self.toggle(self.user), {'liked': False, 'likes_count': 0})
+
+    def test_requires_authentication(self):
+        self.assertEqual(self.client.post(self.url).status_code, 401)
+        self.assert_likes(0)
+
+    def test_missing_post(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.post('/api/posts/999999/like/').status_code, 404)
+
+
+class AttachmentReleaseTests(APITestCase):
+    """같은 내용의 첨부파일이 남아 있으면 파일을 지우지 않고, 마지막 참조가 사라지면 파일과 잠금 행을 정리"""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+        author = User.objects.create_user(email='files@example.com', username='files', password='pw-1234-test')
+        self.post = Post.objects.create(title='첨부', content='파일', author=author)
+
+    def attach(self):
+        return Attachment.objects.create(
+            post=self.post, file=ContentFile(b'same content', name='report.pdf'), original_name='report.pdf'
+        )
+
+    def release(self, attachment):
+        attachment.delete()
+        tasks.release_attachment_file(attachment.file.name, attachment.content_hash)
+
+    def test_shared_file_kept_until_last_reference(self):
+        first, second = self.attach(), self.attach()
+        name = first.file.name
+        self.assertEqual(second.file.name, name)
+        self.assertTrue(AttachmentBlob.objects.filter(name=name).exists())
+
+        self.release(first)
+        self.assertTrue(attachment_storage.exists(name))
+
+        self.release(second)
+        self.assertFalse(attachment_storage.exists(name))
+        self.assertFalse(AttachmentBlob.objects.filter(name=name).exists())
+
+
+@override_settings(DATABASE_REPLICAS=[])
+class ChunkedUploadTests(APITestCase):
+    """청크는 받은 크기(received_size) 위치에서만 이어서 받고, 모두 받으면 첨부파일로 등록"""
+    content = b'%PDF-1.4 ' + b'0123456789' * 5
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+        self.user = User.objects.create_user(email='upload@example.com', username='upload', password='pw-1234-test')
+        self.post = Post.objects.create(title='업로드', content='청크', author=self.user)
+        self.client.force_authenticate(self.user)
+
+    def url(self, upload_id=None):
+        return f'/api/posts/{self.post.pk}/uploads/' + (f'{upload_id}/' if upload_id else '')
+
+    def start(self):
+        response = self.client.post(self.url(), {'file_name': 'report.pdf', 'file_size': len(self.content)})
+        self.assertEqual(response.status_code, 201)
+        return response.data['id']
+
+    def send(self, upload_id, offset, data):
+        return self.client.put(
+            self.url(upload_id), data, content_type='application/octet-stream', HTTP_UPLOAD_OFFSET=str(offset)
+        )
+
+    def received_size(self, upload_id):
+        return self.client.get(self.url(upload_id)).data['received_size']
+
+    def complete(self, upload_id):
+        return self.client.post(self.url(upload_id) + 'complete/')
+
+    def assert_completed(self, upload_id):
+        response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 201)
+        attachment = Attachment.objects.get(pk=response.data['id'])
+        self.assertEqual(attachment.content_hash, hashlib.sha256(self.content).hexdigest())
+        with attachment.file.open('rb') as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertFalse(UploadSession.objects.filter(pk=upload_id).exists())
+
+    def test_chunks_in_order(self):
+        upload_id = self.start()
+        self.assertEqual(self.send(upload_id, 0, self.content[:20]).data['received_size'], 20)
+        self.assertEqual(self.complete(upload_id).status_code, 400)
+        # 마지막 청크는 앞의 청크보다 작아도 됨
+        self.assertEqual(self.send(upload_id, 20, self.content[20:]).data['received_size'], len(self.content))
+        self.assert_completed(upload_id)
+
+    def test_out_of_order_chunk(self):
+        upload_id = self.start()
+        response = self.send(upload_id, 20, self.content[20:])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['received_size'], 0)
+
+        self.send(upload_id, 0, self.content[:20])
+        # 이미 받은 청크를 다시 보내도 덮어쓰지 않음
+        self.assertEqual(self.send(upload_id, 0, self.content[:20]).status_code, 409)
+        self.assertEqual(self.received_size(upload_id), 20)
+
+    def test_invalid_chunk(self):
+        upload_id = self.start()
+        self.assertEqual(self.send(upload_id, 0, b'not a pdf').status_code, 400)
+        self.assertEqual(self.send(upload_id, 0, self.content + b'extra').status_code, 400)
+        missing_offset = self.client.put(self.url(upload_id), self.content, content_type='application/octet-stream')
+        self.assertEqual(missing_offset.status_code, 400)
+        self.assertEqual(self.received_size(upload_id), 0)
+
+    def test_resume_after_interrupted_chunk(self):
+        upload_id = self.start()
+        session = UploadSession.objects.get(pk=upload_id)
+        # 40바이트 청크가 30바이트에서 끊긴 경우: 받은 만큼만 남음
+        written = write_chunk(session, io.BytesIO(self.content[:30]), 0, 40)
+        self.assertEqual(written, 30)
+        self.assertEqual(os.path.getsize(temp_path(session)), 30)
+        session.received_size = written
+        session.save(update_fields=['received_size', 'updated_at'])
+
+        offset = self.received_size(upload_id)
+        self.assertEqual(self.send(upload_id, offset, self.content[offset:]).status_code, 200)
+        self.assert_completed(upload_id)
+
+
+@override_settings(DATABASE_REPLICAS=[])
+class DownloadRangeTests(APITestCase):
+    """Range 요청은 요청한 구간만 206으로, 만족할 수 없는 구간은 416으로 응답"""
+    content = b'%PDF-1.4 ' + b'0123456789' * 5
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root, ATTACHMENT_SENDFILE=''))
+        author = User.objects.create_user(email='download@example.com', username='download', password='pw-1234-test')
+        post = Post.objects.create(title='다운로드', content='파일', author=author, is_public=True)
+        attachment = Attachment.objects.create(
+            post=post, file=ContentFile(self.content, name='report.pdf'), original_name='report.pdf'
+        )
+        self.url = f'/api/posts/{post.pk}/download_file/{attachment.pk}/'
+
+    def download(self, **headers):
+        response = self.client.get(self.url, **headers)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        response.close()
+        return response, body
+
+    def test_full_download(self):
+        response, body = self.download()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, self.content)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('attachment', response['Content-Disposition'])
+
+    def test_byte_range(self):
+        response, body = self.download(HTTP_RANGE='bytes=0-3')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, b'%PDF')
+        self.assertEqual(response['Content-Range'], f'bytes 0-3/{len(self.content)}')
+        self.assertEqual(response['Content-Length'], '4')
+
+        # 파일 크기를 넘는 끝 위치는 마지막 바이트까지로 줄임
+        response, body = self.download(HTTP_RANGE=f'bytes=9-{len(self.content) * 2}')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, self.content[9:])
+
+    def test_suffix_range(self):
+        response, body = self.download(HTTP_RANGE='bytes=-5')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, self.content[-5:])
+        size = len(self.content)
+        self.assertEqual(response['Content-Range'], f'bytes {size - 5}-{size - 1}/{size}')
+
+        # 파일보다 긴 접미 구간은 파일 전체
+        response, body = self.download(HTTP_RANGE=f'bytes=-{size * 2}')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, self.content)
+
+    def test_unsatisfiable_range(self):
+        for header in (f'bytes={len(self.content)}-', 'bytes=-0'):
+            with self.subTest(header=header):
+                response, _ = self.download(HTTP_RANGE=header)
+                self.assertEqual(response.status_code, 416)
+                self.assertEqual(response['Content-Range'], f'bytes */{len(self.content)}')
+                self.assertFalse(response.has_header('Content-Disposition'))
+
+    def test_conditional_requests(self):
+        response, _ = self.download()
+        etag = response['ETag']
+        self.assertEqual(self.download(HTTP_IF_NONE_MATCH=etag)[0].status_code, 304)
+
+        # If-Range가 현재 파일과 다르면 구간 대신 전체 파일
+        response, body = self.download(HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, self.content)
+        self.assertEqual(self.download(HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE=etag)[0].status_code, 206)
+
+
+@unittest.skipUnless(settings.DATABASE_REPLICAS, 'DB_REPLICAS가 설정되지 않음')
+class ReplicaRoutingTests(APITransactionTestCase):
+    """
+    default + 복제본(TEST.MIRROR) 두 별칭에서의 라우팅
+    - 쓰기는 항상 default, 읽기는 ReplicaReadMixin 뷰의 GET에서만 복제본
+    - 쓰기 요청이 성공하면 같은 클라이언트의 다음 읽기는 default에서 실행
+    - 복제본 연결은 default의 커밋된 데이터만 보므로 트랜잭션으로 감싸지 않는 테스트를 씁니다.
+    """
+    databases = {'default', *settings.DATABASE_REPLICAS}
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='replica@example.com', username='replica', password='pw-1234-test')
+        self.post = Post.objects.create(title='복제본', content='읽기', author=self.user)
+        self.replica = settings.DATABASE_REPLICAS[0]
+        self.router = ReplicaRouter()
+
+    def tearDown(self):
+        view_counter.flush()
+        cache.clear()
+
+    def test_replica_mirrors_default(self):
+        self.assertEqual(settings.DATABASES[self.replica]['TEST']['MIRROR'], 'default')
+
+    def test_router(self):
+        self.assertEqual(self.router.db_for_read(Post), 'default')
+        token = _read_from_replica.set(True)
+        try:
+            self.assertIn(self.router.db_for_read(Post), settings.DATABASE_REPLICAS)
+            self.assertEqual(self.router.db_for_write(Post), 'default')
+        finally:
+            _read_from_replica.reset(token)
+        self.assertFalse(self.router.allow_migrate(self.replica, 'core'))
+
+    def get_replica_queries(self, url):
+        with CaptureQueriesContext(connections[self.replica]) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_pinned_to_default_after_write(self):
+        self.client.force_authenticate(self.user)
+        url = f'/api/posts/{self.post.pk}/'
+        self.assertGreater(self.get_replica_queries(url), 0)
+
+        response = self.client.post(f'/api/posts/{self.post.pk}/comments/', {'content': '댓글'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(_read_from_replica.get(), False)
+
+        # 쿠키와 사용자 기준 고정 모두 default로 읽음
+        self.assertEqual(self.get_replica_queries(url), 0)
+        self.client.cookies.clear()
+        self.assertEqual(self.get_replica_queries(url), 0)
+
+
+class LoadPostsTests(APITestCase):
+    """
+    RETURNING이 없는 DB(MySQL)에서 bulk_create로 저장한 게시글의 키를 다시 찾는 경로
+    - 저장 전부터 있던 같은 (작성자, 작성일, 제목)의 글은 무시하고, 함께 저장된 다른 세션의 글이 섞이면 중단
+    """
+
+    def setUp(self):
+        self.author = User.objects.create_user(email='load@example.com', username='load', password='pw-1234-test')
+        self.now = timezone.now()
+        for patcher in (
+            mock.patch.object(
+                type(connections['default'].features), 'can_return_rows_from_bulk_insert',
+                new_callable=mock.PropertyMock, return_value=False,
+            ),
+            mock.patch('django.utils.timezone.now', return_value=self.now),  # 모든 행의 작성일이 같도록
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def load(self, rows):
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False, encoding='utf-8') as f:
+            f.write('\n'.join(json.dumps(row, ensure_ascii=False) for row in rows))
+        self.addCleanup(os.remove, f.name)
+        call_command('loadposts', f.name, stdout=io.StringIO(), stderr=io.StringIO())
+
+    def rows(self):
+        return [
+            {'title': '같은 제목', 'content': f'본문 {i}', 'author': 'load', 'comments': [
+                {'author': 'load', 'content': f'댓글 {i}'}
+            ]}
+            for i in range(3)
+        ]
+
+    def test_comments_attached_to_inserted_posts(self):
+        existing = Post.objects.create(title='같은 제목', content='기존 글', author=self.author)
+        self.load(self.rows())
+        self.assertFalse(Comment.objects.filter(post=existing).exists())
+        for comment in Comment.objects.select_related('post'):
+            self.assertEqual(comment.content.split()[-1], comment.post.content.split()[-1])
+        self.assertEqual(Comment.objects.count(), 3)
+
+    def test_concurrent_duplicate_aborts_batch(self):
+        bulk_create = Post.objects.bulk_create
+
+        def with_concurrent_insert(posts, **kwargs):
+            result = bulk_create(posts, **kwargs)
+            Post.objects.create(title='같은 제목', content='다른 세션', author=self.author)
+            return result
+
+        with mock.patch.object(Post.objects, 'bulk_create', side_effect=with_concurrent_insert):
+            with self.assertRaises(CommandError):
+                self.load(self.rows())
+        self.assertFalse(Comment.objects.exists())
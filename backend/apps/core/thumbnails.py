@@ -0,0 +1,114 @@
+"""
+썸네일(미리보기 이미지)
+- 이미지 첨부파일과 프로필 이미지를 여러 크기의 WebP로 줄여 MEDIA_ROOT/thumbnails 아래에 저장합니다.
+- 파일 경로는 원본 SHA-256 + 크기로 정해지므로 같은 이미지는 한 번만 만들어집니다.
+- 업로드가 커밋되면 작업 큐에서 미리 만들고(tasks.generate_thumbnails), 요청 시점에 없으면 그 자리에서 만듭니다. (lazy)
+"""
+
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.urls import reverse
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+
+class ThumbnailError(Exception):
+    """원본 이미지를 읽을 수 없는 경우"""
+
+
+def is_image(name):
+    return os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+
+
+def thumbnail_sizes():
+    """{'sm': 128, 'md': 480} 형태의 크기 이름 -> 최대 변 길이(px)"""
+    return settings.THUMBNAIL_SIZES
+
+
+def thumbnail_path(content_hash, size_name):
+    return os.path.join(
+        settings.MEDIA_ROOT, settings.THUMBNAIL_DIR,
+        content_hash[:2], f'{content_hash}_{size_name}.webp',
+    )
+
+
+def thumbnail_urls(request, viewname, version=None, **kwargs):
+    """
+    {크기 이름: 썸네일 URL} (request가 있으면 절대 URL)
+    - version: 원본이 바뀌면 URL도 바뀌도록 붙이는 값 (브라우저/프록시 캐시 무효화)
+    """
+    urls = {}
+    for size_name in thumbnail_sizes():
+        url = reverse(viewname, kwargs={**kwargs, 'size': size_name})
+        if version:
+            url = f'{url}?v={version}'
+        urls[size_name] = request.build_absolute_uri(url) if request else url
+    return urls
+
+
+def render(source_path, targets):
+    """
+    원본을 각 크기 안에 들어가도록 줄여 WebP로 저장
+    - targets: [(저장 경로, 최대 변 길이)], 원본은 한 번만 디코딩하고 큰 크기부터 차례로 줄입니다.
+    - 임시 파일에 쓴 뒤 rename하므로 읽는 쪽에서 덜 쓰인 파일을 보지 않습니다.
+    """
+    targets = sorted(targets, key=lambda target: target[1], reverse=True)
+    try:
+        with Image.open(source_path) as source:
+            # JPEG는 디코딩 단계에서 미리 축소 (큰 사진의 메모리/시간 절약)
+            largest = targets[0][1]
+            source.draft('RGB', (largest, largest))
+            image = ImageOps.exif_transpose(source)
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if 'transparency' in image.info or 'A' in image.mode else 'RGB')
+
+            for target_path, max_size in targets:
+                image.thumbnail((max_size, max_size), Image.LANCZOS, reducing_gap=3.0)
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                temp_path = f'{target_path}.{threading.get_ident()}.tmp'
+                image.save(temp_path, 'WEBP', quality=settings.THUMBNAIL_QUALITY, method=4)
+                os.replace(temp_path, target_path)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as exc:
+        raise ThumbnailError(str(exc)) from exc
+
+
+class ThumbnailStore:
+    """원본 해시별 썸네일 파일 관리"""
+
+    def generate_all(self, source_path, content_hash):
+        """없는 크기의 썸네일을 모두 생성"""
+        targets = [
+            (thumbnail_path(content_hash, size_name), max_size)
+            for size_name, max_size in thumbnail_sizes().items()
+        ]
+        targets = [target for target in targets if not os.path.exists(target[0])]
+        if not targets:
+            return
+        try:
+            render(source_path, targets)
+        except ThumbnailError as exc:
+            logger.warning('썸네일 생성 실패 %s: %s', source_path, exc)
+
+    def get_or_create(self, source_path, content_hash, size_name):
+        """썸네일 경로 반환 (없으면 지금 생성, 실패하면 ThumbnailError)"""
+        target_path = thumbnail_path(content_hash, size_name)
+        if not os.path.exists(target_path):
+            render(source_path, [(target_path, thumbnail_sizes()[size_name])])
+        return target_path
+
+    def discard(self, content_hash):
+        """원본이 삭제되면 썸네일도 삭제"""
+        for size_name in thumbnail_sizes():
+            try:
+                os.remove(thumbnail_path(content_hash, size_name))
+            except FileNotFoundError:
+                pass
+
+
+thumbnails = ThumbnailStore()
@@ -0,0 +1,183 @@
+"""
+분할(청크) 업로드
+- 파일을 여러 요청으로 나누어 받아 MEDIA_ROOT 아래 임시 파일에 바로 기록합니다.
+- 요청 본문을 메모리에 올리지 않고 고정 크기 블록 단위로 읽으므로
+  파일 크기와 상관없이 워커 메모리 사용량이 일정합니다.
+- 흐름: 시작(init) -> 청크 전송(PUT, 이어받기 가능) -> 완료(complete)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.files import File
+
+# 요청 본문을 읽는 블록 크기
+BLOCK_SIZE = 64 * 1024
+
+# 확장자별 파일 시그니처(매직 바이트)
+FILE_SIGNATURES = {
+    '.pdf': (b'%PDF',),
+    '.png': (b'\x89PNG\r\n\x1a\n',),
+    '.jpg': (b'\xff\xd8\xff',),
+    '.jpeg': (b'\xff\xd8\xff',),
+    '.gif': (b'GIF87a', b'GIF89a'),
+    # OOXML(docx/xlsx/pptx)은 ZIP, 이전 Office 형식은 OLE2 복합 문서
+    '.docx': (b'PK\x03\x04',),
+    '.xlsx': (b'PK\x03\x04',),
+    '.pptx': (b'PK\x03\x04',),
+    '.doc': (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1',),
+    '.xls': (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1',),
+    '.ppt': (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1',),
+}
+
+SIGNATURE_LENGTH = max(len(sig) for sigs in FILE_SIGNATURES.values() for sig in sigs)
+
+
+class UploadError(Exception):
+    """업로드 요청이 잘못된 경우 (메시지는 그대로 응답에 사용)"""
+
+
+def file_extension(name):
+    return os.path.splitext(name)[1].lower()
+
+
+def matches_signature(ext, head):
+    """파일 앞부분이 확장자에 맞는 시그니처로 시작하는지 확인"""
+    signatures = FILE_SIGNATURES.get(ext)
+    if signatures is None:
+        return True
+    return any(head.startswith(signature) for signature in signatures)
+
+
+def temp_path(session):
+    """업로드 중인 파일의 임시 경로"""
+    return os.path.join(settings.MEDIA_ROOT, settings.UPLOAD_TEMP_DIR, f'{session.pk}.part')
+
+
+class _HasherCache:
+    """
+    세션별 진행 중인 SHA-256 상태
+    - 청크가 같은 프로세스에 순서대로 도착하면 받으면서 해시를 계산합니다.
+    - 다른 워커로 나뉘어 도착한 경우 완료 시 파일을 블록 단위로 다시 읽어 계산합니다.
+    """
+    max_entries = 1000
+
+    def __init__(self):
+        self._entries = OrderedDict()  # session_id -> (해시된 바이트 수, hasher)
+        self._lock = threading.Lock()
+
+    def take(self, session_id, offset):
+        """offset까지 해시된 hasher를 꺼냄 (없거나 위치가 다르면 None)"""
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+        if offset == 0:
+            return hashlib.sha256()
+        if entry is not None and entry[0] == offset:
+            return entry[1]
+        return None
+
+    def put(self, session_id, offset, hasher):
+        with self._lock:
+            self._entries[session_id] = (offset, hasher)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, session_id):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+
+hashers = _HasherCache()
+
+
+def write_chunk(session, stream, offset, length):
+    """
+    요청 본문(stream)에서 length 바이트를 읽어 임시 파일의 offset 위치에 기록
+    - 첫 청크(offset 0)는 매직 바이트로 파일 형식을 검증합니다.
+    - 반환값: 기록한 바이트 수
+    """
+    if offset != session.received_size:
+        raise UploadError(f'잘못된 오프셋입니다. 현재까지 받은 크기: {session.received_size}')
+    if length <= 0:
+        raise UploadError('청크가 비어 있습니다.')
+    if length > settings.UPLOAD_CHUNK_MAX_SIZE:
+        raise UploadError(f'청크 크기가 너무 큽니다. (최대 {settings.UPLOAD_CHUNK_MAX_SIZE} bytes)')
+    if offset + length > session.total_size:
+        raise UploadError('선언한 파일 크기를 초과했습니다.')
+
+    hasher = hashers.take(session.pk, offset)
+    written = 0
+    with open(temp_path(session), 'r+b') as fp:
+        fp.seek(offset)
+        if offset == 0:
+            # 파일 앞부분을 먼저 읽어 형식 검증 후 기록
+            head = _read_exact(stream, min(SIGNATURE_LENGTH, length))
+            if not matches_signature(file_extension(session.original_name), head):
+                raise UploadError('파일 내용이 확장자와 일치하지 않습니다.')
+            fp.write(head)
+            hasher.update(head)
+            written = len(head)
+        while written < length:
+            block = stream.read(min(BLOCK_SIZE, length - written))
+            if not block:
+                break
+            fp.write(block)
+            if hasher is not None:
+                hasher.update(block)
+            written += len(block)
+        # 중간에 끊긴 경우 받은 만큼만 남김 (이어받기)
+        fp.truncate(offset + written)
+
+    if hasher is not None:
+        hashers.put(session.pk, offset + written, hasher)
+    return written
+
+
+def _read_exact(stream, size):
+    data = b''
+    while len(data) < size:
+        block = stream.read(size - len(data))
+        if not block:
+            break
+        data += block
+    return data
+
+
+def file_digest(session):
+    """완료된 업로드의 SHA-256 (가능하면 청크를 받으며 계산한 값을 사용)"""
+    hasher = hashers.take(session.pk, session.total_size)
+    if hasher is None:
+        hasher = hashlib.sha256()
+        with open(temp_path(session), 'rb') as fp:
+            for block in iter(lambda: fp.read(BLOCK_SIZE), b''):
+                hasher.update(block)
+    return hasher.hexdigest()
+
+
+class ChunkedUploadFile(File):
+    """
+    완성된 임시 파일
+    - temporary_file_path()를 제공하므로 FileSystemStorage가 복사 대신 이동(rename)으로 저장합니다.
+    """
+
+    def __init__(self, path, name, size):
+        super().__init__(None, name)
+        self.path = path
+        self.size = size
+
+    def temporary_file_path(self):
+        return self.path
+
+    def open(self, mode='rb'):
+        self.file = open(self.path, mode)
+        return self
+
+    def chunks(self, chunk_size=None):
+        self.open()
+        try:
+            yield from super().chunks(chunk_size)
+        finally:
+            self.close()
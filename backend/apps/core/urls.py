@@ -3,10 +3,19 @@ Core 앱 URL 설정
 - 게시글, 카테고리, 검색 관련 API 엔드포인트를 정의합니다.
 """
 
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from rest_framework_nested import routers
-from .views import CategoryViewSet, PostViewSet, CommentViewSet, SearchView
+from .views import CategoryViewSet, PostViewSet, CommentViewSet, SearchView, CacheStatsView, DatabaseStatsView, MetricsView
+
+# ASGI로 실행하면 읽기 위주 엔드포인트를 비동기 뷰로 교체 (async_views.py)
+if settings.ASYNC_VIEWS:
+    from .async_views import (
+        AsyncCommentViewSet as CommentViewSet,
+        AsyncPostViewSet as PostViewSet,
+        AsyncSearchView as SearchView,
+    )
 
 # 기본 라우터
 router = DefaultRouter()
@@ -21,4 +30,7 @@ urlpatterns = [
     path('', include(router.urls)),
     path('', include(posts_router.urls)),
     path('search/', SearchView.as_view(), name='search'),
+    path('cache-stats/', CacheStatsView.as_view(), name='cache-stats'),
+    path('db-stats/', DatabaseStatsView.as_view(), name='db-stats'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
 ]
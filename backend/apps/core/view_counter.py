@@ -0,0 +1,125 @@
+"""
+조회수 버퍼
+- 상세 조회마다 DB에 UPDATE 하지 않고, 프로세스 메모리에 조회수를 모아두었다가
+  주기적으로 F('views') + n 형태의 일괄 UPDATE로 반영합니다.
+- 인기 게시글의 행 잠금 경합과 동시 요청 시 조회수 유실을 막습니다.
+"""
+
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    조회수 누적 버퍼
+    - add(): 요청 경로에서 호출, 메모리 카운터만 증가 (DB 접근 없음)
+    - flush(): 누적된 조회수를 증가량별로 묶어 일괄 UPDATE
+    - 백그라운드 스레드가 VIEW_COUNT_FLUSH_INTERVAL 초마다 flush() 실행
+    """
+
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def interval(self):
+        return getattr(settings, 'VIEW_COUNT_FLUSH_INTERVAL', 5)
+
+    def add(self, post_id, n=1):
+        """
+        조회수 n 증가를 버퍼에 기록
+        - 반환값: 이 프로세스에서 아직 DB에 반영되지 않은 해당 게시글의 조회수
+        """
+        if self.interval <= 0:
+            # 버퍼링 비활성화: 즉시 원자적 UPDATE
+            self._apply({post_id: n})
+            return n
+        with self._lock:
+            self._counts[post_id] += n
+            pending = self._counts[post_id]
+        self._ensure_flusher()
+        return pending
+
+    async def aadd(self, post_id, n=1):
+        """add의 비동기 버전 (버퍼링 비활성화 시에만 DB를 스레드에서 갱신)"""
+        if self.interval <= 0:
+            await sync_to_async(self._apply)({post_id: n})
+            return n
+        return self.add(post_id, n)
+
+    def pending(self, post_id):
+        """아직 DB에 반영되지 않은 조회수"""
+        with self._lock:
+            return self._counts.get(post_id, 0)
+
+    def flush(self):
+        """버퍼의 조회수를 DB에 반영하고 반영한 총 조회수를 반환"""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        if not counts:
+            return 0
+        try:
+            self._apply(counts)
+        except DatabaseError:
+            # 반영 실패 시 다음 주기에 다시 시도하도록 버퍼로 되돌림
+            with self._lock:
+                self._counts.update(counts)
+            raise
+        return sum(counts.values())
+
+    def _apply(self, counts):
+        from .models import Post
+
+        # 같은 증가량끼리 묶어 UPDATE 횟수를 줄임
+        grouped = defaultdict(list)
+        for post_id, n in counts.items():
+            grouped[n].append(post_id)
+        with transaction.atomic():
+            for n, post_ids in grouped.items():
+                Post.objects.filter(pk__in=post_ids).update(views=F('views') + n)
+
+    def _ensure_flusher(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='view-count-flusher', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('조회수 반영 실패')
+            finally:
+                close_old_connections()
+
+    def stop(self):
+        """플러셔 스레드를 멈추고 남은 조회수를 반영"""
+        self._stop.set()
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('조회수 반영 실패')
+
+
+view_counter = ViewCountBuffer()
+
+# 프로세스 종료 시 남은 조회수 반영
+atexit.register(view_counter.stop)
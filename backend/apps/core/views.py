@@ -5,26 +5,44 @@ Core 뷰 (API 엔드포인트)
 
 from rest_framework import viewsets, generics, status, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
 from django.conf import settings
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, transaction
+from django.http import HttpResponse
 import os
 
-from .models import Category, Post, Attachment, Comment
+from .cache import AnonymousCacheMixin, response_cache
+from .conditional import ConditionalGetMixin
+from .db.metrics import connection_metrics
+from .db.pool import pool_snapshot
+from .db.replicas import ReplicaReadMixin
+from .downloads import serve_attachment, serve_file
+from .filters import FullTextSearchFilter, RelevanceOrderingFilter
+from .models import Category, Post, Attachment, Comment, UploadSession
+from .pagination import CommentPagination, CommentTreeKeysetPagination, PostPagination
+from .profiling import render_metrics
+from .search import search_posts
+from .view_counter import view_counter
 from .serializers import (
     CategorySerializer,
     PostListSerializer,
     PostDetailSerializer,
     PostCreateSerializer,
     AttachmentSerializer,
-    CommentSerializer
+    CommentSerializer,
+    CommentThreadSerializer,
+    UploadSessionSerializer
 )
+from .thumbnails import ThumbnailError, is_image, thumbnails
+from .uploads import ChunkedUploadFile, UploadError, file_digest, hashers, temp_path, write_chunk
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ReplicaReadMixin, ConditionalGetMixin, AnonymousCacheMixin, viewsets.ModelViewSet):
     """
     카테고리 API
     - GET /api/categories/ : 목록 조회
@@ -35,14 +53,64 @@ class CategoryViewSet(viewsets.ModelViewSet):
     """
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    token_user_reads = True
 
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             return [permissions.IsAdminUser()]
         return [permissions.AllowAny()]
 
+    def get_validators(self, request, *args, **kwargs):
+        # ETag/Last-Modified: 카테고리 수 + 최종 수정 시각
+        queryset = self.get_queryset()
+        if self.action == 'retrieve':
+            try:
+                queryset = queryset.filter(pk=kwargs.get('pk'))
+            except (TypeError, ValueError):
+                return None
+        stats = queryset.aggregate(modified=models.Max('updated_at'), total=models.Count('id'))
+        return (stats['total'], stats['modified']), stats['modified']
 
-class PostViewSet(viewsets.ModelViewSet):
+
+class LikedPostsContextMixin:
+    """
+    목록/상세 직렬화 전에 요청 사용자의 좋아요 게시글 ID를 한 번의 쿼리로 조회해
+    serializer context['liked_post_ids']로 전달합니다. (LikedStatusMixin 참고)
+    """
+    liked_context_actions = ('list', 'retrieve')
+
+    def get_serializer(self, *args, **kwargs):
+        action = getattr(self, 'action', None) or 'list'
+        if args and action in self.liked_context_actions:
+            kwargs.setdefault('context', self.get_serializer_context())
+            kwargs['context']['liked_post_ids'] = self.get_liked_post_ids(args[0])
+        return super().get_serializer(*args, **kwargs)
+
+    def get_liked_post_ids(self, posts):
+        queryset = self.liked_post_ids_queryset(posts)
+        return set(queryset) if queryset is not None else set()
+
+    async def aget_serializer(self, *args, **kwargs):
+        """get_serializer의 비동기 버전 (좋아요 ID를 비동기 ORM으로 조회, async_views.py)"""
+        kwargs.setdefault('context', self.get_serializer_context())
+        queryset = self.liked_post_ids_queryset(args[0])
+        kwargs['context']['liked_post_ids'] = (
+            {post_id async for post_id in queryset} if queryset is not None else set()
+        )
+        return super().get_serializer(*args, **kwargs)
+
+    def liked_post_ids_queryset(self, posts):
+        user = self.request.user
+        if not user.is_authenticated:
+            return None
+        if isinstance(posts, Post):
+            posts = [posts]
+        return Post.likes.through.objects.filter(
+            user_id=user.pk, post_id__in=[post.pk for post in posts]
+        ).values_list('post_id', flat=True)
+
+
+class PostViewSet(ReplicaReadMixin, LikedPostsContextMixin, ConditionalGetMixin, AnonymousCacheMixin, viewsets.ModelViewSet):
     """
     게시글 API
     - GET /api/posts/ : 목록 조회 (검색, 필터링 지원)
@@ -50,12 +118,18 @@ class PostViewSet(viewsets.ModelViewSet):
     - GET /api/posts/{id}/ : 상세 조회
     - PUT/PATCH /api/posts/{id}/ : 수정
     - DELETE /api/posts/{id}/ : 삭제
+    - 목록은 ?pagination=cursor 로 키셋(커서) 페이지네이션 사용 가능 (최신순 고정)
+    - 비인증 목록/상세 응답은 캐시됨 (cache.py)
+    - 목록/상세는 ETag/Last-Modified 조건부 GET 지원 (conditional.py)
+    - GET 요청의 조회는 읽기 복제본에서 실행 (db/replicas.py)
     """
     queryset = Post.objects.all()
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = PostPagination
+    token_user_reads = True
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, RelevanceOrderingFilter]
     filterset_fields = ['category', 'author', 'is_public']
-    search_fields = ['title', 'content']  # 검색 기능
-    ordering_fields = ['created_at', 'views', 'title']
+    search_fields = ['title', 'content']  # 검색 기능 (전문 검색 인덱스, search.py)
+    ordering_fields = ['created_at', 'views', 'title', 'likes_count', 'comment_count']
     ordering = ['-created_at']
 
     def get_serializer_class(self):
@@ -68,45 +142,161 @@ class PostViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             return [permissions.IsAuthenticated()]
-        return [permissions.AllowAny()]
+        if self.action in ['list', 'retrieve']:
+            return [permissions.AllowAny()]
+        # 추가 액션은 @action(permission_classes=...) 또는 기본 권한(인증 필요)을 따름
+        return super().get_permissions()
 
-    def get_queryset(self):
+    def get_visible_posts(self):
         queryset = Post.objects.all()
         # 비인증 사용자는 공개 게시글만 볼 수 있음
         if not self.request.user.is_authenticated:
             queryset = queryset.filter(is_public=True)
         return queryset
 
+    def get_queryset(self):
+        queryset = self.get_visible_posts()
+        # 목록/상세는 연관 데이터와 카운트를 한 번에 조회 (N+1 방지)
+        if self.action == 'list':
+            queryset = queryset.for_list()
+        elif self.action == 'retrieve':
+            queryset = queryset.for_detail()
+        return queryset
+
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
 
     def retrieve(self, request, *args, **kwargs):
+        # 조건부 GET(304) -> 응답 캐시 -> 실제 조회 순서로 처리
+        return self.conditional_response(
+            request, self.cached_response, self.retrieve_post, *args, **kwargs
+        )
+
+    def retrieve_post(self, request, *args, **kwargs):
         instance = self.get_object()
         instance.increase_views()  # 조회수 증가
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
+    def cache_hit(self, request, *args, **kwargs):
+        # 캐시된 상세 응답이나 304 응답도 조회수는 증가
+        if self.action == 'retrieve':
+            view_counter.add(int(kwargs[self.lookup_url_kwarg or self.lookup_field]))
+
+    not_modified = cache_hit
+
+    def get_validators(self, request, *args, **kwargs):
+        """
+        ETag/Last-Modified 검증 값 (본문 직렬화 없이 집계 쿼리 한 번)
+        - 조회수는 매 요청 바뀌므로 포함하지 않음
+        """
+        if self.action == 'list':
+            if request.query_params.get(FullTextSearchFilter.search_param):
+                return None  # 검색은 검증 값 계산 비용이 커서 제외
+            stats = self.filter_queryset(self.get_visible_posts()).aggregate(
+                modified=models.Max('updated_at'),
+                total=models.Count('id'),
+                likes=models.Sum('likes_count'),
+                comments=models.Sum('comment_count'),
+            )
+            return tuple(stats.values()), stats['modified']
+
+        try:
+            queryset = self.get_visible_posts().filter(
+                pk=kwargs[self.lookup_url_kwarg or self.lookup_field]
+            ).annotate(
+                # 댓글/첨부파일을 함께 JOIN하면 (댓글 수 × 첨부파일 수) 행을 집계하므로 댓글은 서브쿼리로 계산
+                comments_modified=models.Subquery(
+                    Comment.objects.filter(post=models.OuterRef('pk'))
+                    .order_by('-updated_at').values('updated_at')[:1]
+                ),
+                attachments_modified=models.Max('attachments__uploaded_at'),
+                attachment_count=models.Count('attachments', distinct=True),
+            )
+        except (TypeError, ValueError):
+            return None
+        fields = [
+            'updated_at', 'likes_count', 'comment_count',
+            'comments_modified', 'attachments_modified', 'attachment_count',
+        ]
+        if request.user.is_authenticated:
+            # 좋아요 여부(is_liked)도 응답에 포함되므로 검증 값에 반영
+            queryset = queryset.annotate(liked=models.Exists(
+                Post.likes.through.objects.filter(
+                    post=models.OuterRef('pk'), user_id=request.user.pk
+                )
+            ))
+            fields.append('liked')
+        post = queryset.values(*fields).first()
+        if post is None:
+            return None  # 404는 일반 경로에서 처리
+        modified = max(filter(None, [
+            post['updated_at'], post['comments_modified'], post['attachments_modified']
+        ]))
+        return tuple(post.values()), modified
+
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def like(self, request, pk=None):
         """
         좋아요 토글 API
         - POST /api/posts/{id}/like/
+        - 좋아요 목록 전체를 불러오지 않고 (post, user) 인덱스로 삭제/추가만 수행
+        - 게시글 행을 먼저 잠가 같은 게시글의 토글을 차례로 처리 (동시에 두 번 눌러도 행과 카운터가 어긋나지 않음)
         """
         post = self.get_object()
-        user = request.user
+        Like = Post.likes.through
 
-        if user in post.likes.all():
-            post.likes.remove(user)
-            liked = False
-        else:
-            post.likes.add(user)
-            liked = True
+        with transaction.atomic():
+            # 좋아요 행이 없을 때 DELETE가 잡는 갭 락에서 두 요청의 INSERT가 서로 기다리는 교착(MySQL 1213)을 막기 위해
+            # 어차피 카운터 갱신으로 잠글 게시글 행을 처음에 잠금
+            if not Post.objects.select_for_update().filter(pk=post.pk).exists():
+                raise NotFound('게시글을 찾을 수 없습니다.')
+            # 이미 좋아요 상태면 삭제된 행이 있으므로 취소, 없으면 추가
+            deleted, _ = Like.objects.filter(post_id=post.pk, user_id=request.user.pk).delete()
+            if deleted:
+                liked, delta = False, -deleted
+            else:
+                try:
+                    with transaction.atomic():
+                        Like.objects.create(post_id=post.pk, user_id=request.user.pk)
+                    liked, delta = True, 1
+                except IntegrityError:
+                    # 동시 요청이 먼저 추가함 (unique 제약) -> 이미 좋아요 상태
+                    liked, delta = True, 0
+            if delta:
+                Post.objects.filter(pk=post.pk).adjust_counts(likes=delta)
+            likes_count = Post.objects.filter(pk=post.pk).values_list('likes_count', flat=True).get()
 
+        # through 모델을 직접 다루므로 m2m_changed 시그널이 없음 -> 캐시 직접 무효화
+        response_cache.invalidate()
         return Response({
             'liked': liked,
-            'likes_count': post.likes.count()
+            'likes_count': likes_count
         })
 
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def liked(self, request):
+        """
+        좋아요 여부 일괄 조회 API
+        - GET /api/posts/liked/?ids=1,2,3
+        - 응답: {"1": true, "2": false, "3": false}
+        """
+        try:
+            ids = [int(value) for value in request.query_params.get('ids', '').split(',') if value]
+        except ValueError:
+            return Response({"error": "ids는 쉼표로 구분된 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > settings.LIKED_STATUS_MAX_IDS:
+            return Response(
+                {"error": f"한 번에 최대 {settings.LIKED_STATUS_MAX_IDS}개까지 조회할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        liked_ids = set(
+            Post.likes.through.objects.filter(user_id=request.user.pk, post_id__in=ids)
+            .values_list('post_id', flat=True)
+        )
+        return Response({str(post_id): post_id in liked_ids for post_id in ids})
+
     @action(detail=True, methods=['post'], parser_classes=[MultiPartParser, FormParser])
     def upload_file(self, request, pk=None):
         """
@@ -141,6 +331,178 @@ class PostViewSet(viewsets.ModelViewSet):
         )
         return Response(AttachmentSerializer(attachment).data, status=status.HTTP_201_CREATED)
 
+    # ----- 분할(청크) 업로드 -----
+
+    def get_upload_session(self, post, upload_id, lock=False):
+        queryset = UploadSession.objects.filter(post=post, user_id=self.request.user.pk)
+        if lock:
+            queryset = queryset.select_for_update()
+        try:
+            return queryset.get(pk=upload_id)
+        except (UploadSession.DoesNotExist, ValidationError):
+            raise NotFound("업로드 세션을 찾을 수 없습니다.")
+
+    @action(detail=True, methods=['post'], url_path='uploads')
+    def start_upload(self, request, pk=None):
+        """
+        분할 업로드 시작 API
+        - POST /api/posts/{id}/uploads/  {"file_name": "a.pdf", "file_size": 123456}
+        - 응답의 id로 청크를 전송합니다.
+        """
+        post = self.get_object()
+        if post.author_id != request.user.pk:
+            return Response({"error": "업로드 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = UploadSessionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        session = serializer.save(post=post, user=request.user)
+
+        # 빈 임시 파일 생성 (청크는 이 파일에 이어서 기록)
+        path = temp_path(session)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, 'wb').close()
+        return Response(UploadSessionSerializer(session).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get', 'put', 'delete'],
+            url_path='uploads/(?P<upload_id>[0-9a-f-]+)')
+    def upload_chunk(self, request, pk=None, upload_id=None):
+        """
+        분할 업로드 청크 API
+        - GET /api/posts/{id}/uploads/{upload_id}/ : 진행 상황 (이어받을 오프셋 = received_size)
+        - PUT /api/posts/{id}/uploads/{upload_id}/ : 청크 전송
+          (본문: 바이너리, 헤더 Upload-Offset: 청크 시작 위치)
+        - DELETE /api/posts/{id}/uploads/{upload_id}/ : 업로드 취소
+        """
+        post = self.get_object()
+
+        if request.method == 'GET':
+            session = self.get_upload_session(post, upload_id)
+            return Response(UploadSessionSerializer(session).data)
+
+        if request.method == 'DELETE':
+            session = self.get_upload_session(post, upload_id)
+            hashers.discard(session.pk)
+            if os.path.exists(temp_path(session)):
+                os.remove(temp_path(session))
+            session.delete()
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        try:
+            offset = int(request.headers.get('Upload-Offset', ''))
+            length = int(request.headers.get('Content-Length') or 0)
+        except ValueError:
+            return Response({"error": "Upload-Offset 헤더가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 같은 세션의 청크가 동시에 기록되지 않도록 세션 행을 잠금
+        with transaction.atomic():
+            session = self.get_upload_session(post, upload_id, lock=True)
+            try:
+                written = write_chunk(session, request.stream, offset, length)
+            except UploadError as exc:
+                return Response(
+                    {"error": str(exc), "received_size": session.received_size},
+                    status=status.HTTP_409_CONFLICT if offset != session.received_size
+                    else status.HTTP_400_BAD_REQUEST
+                )
+            session.received_size = offset + written
+            session.save(update_fields=['received_size', 'updated_at'])
+        return Response(UploadSessionSerializer(session).data)
+
+    @action(detail=True, methods=['post'],
+            url_path='uploads/(?P<upload_id>[0-9a-f-]+)/complete')
+    def complete_upload(self, request, pk=None, upload_id=None):
+        """
+        분할 업로드 완료 API
+        - POST /api/posts/{id}/uploads/{upload_id}/complete/
+        - 모든 청크를 받았으면 첨부파일로 등록 (임시 파일은 복사 없이 이동)
+        """
+        post = self.get_object()
+        with transaction.atomic():
+            session = self.get_upload_session(post, upload_id, lock=True)
+            if not session.is_complete:
+                return Response(
+                    {"error": "아직 모든 청크를 받지 못했습니다.", "received_size": session.received_size},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            content_hash = file_digest(session)
+            attachment = Attachment(
+                post=post,
+                original_name=session.original_name,
+                file_size=session.total_size,
+                content_hash=content_hash,
+            )
+            attachment.file.save(
+                session.original_name,
+                ChunkedUploadFile(temp_path(session), session.original_name, session.total_size),
+                save=False,
+            )
+            attachment.save()
+            session.delete()
+        return Response(AttachmentSerializer(attachment).data, status=status.HTTP_201_CREATED)
+
+    def get_downloadable_attachment(self, pk, file_id):
+        """
+        다운로드 가능한 첨부파일 (한 번의 쿼리)
+        - 공개 게시글은 누구나, 비공개 게시글은 작성자(와 관리자)만
+        """
+        user = self.request.user
+        visible = models.Q(post__is_public=True)
+        if user.is_authenticated:
+            visible |= models.Q(post__author_id=user.pk)
+            if user.is_staff:
+                visible = models.Q()
+        try:
+            return (
+                Attachment.objects.select_related('post')
+                .only('id', 'file', 'original_name', 'content_hash', 'post__is_public')
+                .get(visible, pk=file_id, post_id=pk)
+            )
+        except (Attachment.DoesNotExist, ValueError):
+            raise NotFound("파일을 찾을 수 없습니다.")
+
+    @action(detail=True, methods=['get'], url_path='download_file/(?P<file_id>[^/.]+)',
+            permission_classes=[permissions.AllowAny])
+    def download_file(self, request, pk=None, file_id=None):
+        """
+        파일 다운로드 API
+        - GET /api/posts/{id}/download_file/{file_id}/
+        - 공개 게시글은 누구나, 비공개 게시글은 작성자(와 관리자)만 다운로드 가능
+        - Range, ETag/If-None-Match, If-Modified-Since, If-Range 지원 (downloads.py)
+        """
+        attachment = self.get_downloadable_attachment(pk, file_id)
+        response = serve_attachment(request, attachment, public=attachment.post.is_public)
+        if response is None:
+            raise NotFound("파일을 찾을 수 없습니다.")
+        return response
+
+    @action(detail=True, methods=['get'], url_path='thumbnail_file/(?P<file_id>[^/.]+)/(?P<size>[a-z]+)',
+            permission_classes=[permissions.AllowAny])
+    def thumbnail_file(self, request, pk=None, file_id=None, size=None):
+        """
+        이미지 첨부파일 썸네일 API
+        - GET /api/posts/{id}/thumbnail_file/{file_id}/{size}/  (size: THUMBNAIL_SIZES의 이름)
+        - 썸네일이 아직 없으면 이 요청에서 생성합니다.
+        """
+        attachment = self.get_downloadable_attachment(pk, file_id)
+        if (
+            size not in settings.THUMBNAIL_SIZES
+            or not attachment.content_hash
+            or not is_image(attachment.original_name)
+        ):
+            raise NotFound("썸네일을 찾을 수 없습니다.")
+        try:
+            path = thumbnails.get_or_create(attachment.file.path, attachment.content_hash, size)
+        except ThumbnailError:
+            raise NotFound("썸네일을 만들 수 없습니다.")
+        response = serve_file(
+            request, path, content_type='image/webp',
+            etag=f'{attachment.content_hash}-{size}', public=attachment.post.is_public,
+        )
+        if response is None:
+            raise NotFound("썸네일을 찾을 수 없습니다.")
+        return response
+
     @action(detail=True, methods=['delete'], url_path='delete_file/(?P<file_id>[^/.]+)',
             permission_classes=[permissions.IsAuthenticated])
     def delete_file(self, request, pk=None, file_id=None):
@@ -156,45 +518,140 @@ class PostViewSet(viewsets.ModelViewSet):
 
         try:
             attachment = Attachment.objects.get(id=file_id, post=post)
-            attachment.file.delete()  # 실제 파일 삭제
-            attachment.delete()  # DB 레코드 삭제
+            # 실제 파일은 마지막 참조가 사라질 때 작업 큐에서 삭제 (tasks.release_attachment_file)
+            attachment.delete()
             return Response({"message": "파일이 삭제되었습니다."}, status=status.HTTP_200_OK)
         except Attachment.DoesNotExist:
             return Response({"error": "파일을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(ReplicaReadMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     댓글 API
-    - GET /api/posts/{post_id}/comments/ : 해당 게시글의 댓글 목록
-    - POST /api/posts/{post_id}/comments/ : 댓글 작성
+    - GET /api/posts/{post_id}/comments/ : 해당 게시글의 댓글 목록 (작성순)
+    - GET /api/posts/{post_id}/comments/?mode=tree : 스레드 목록 (최상위 댓글 + 처음 답글, 커서)
+    - GET /api/posts/{post_id}/comments/{id}/replies/ : 댓글 아래 모든 답글 (경로순, 커서)
+    - POST /api/posts/{post_id}/comments/ : 댓글 작성 (parent를 보내면 답글)
+    - 목록은 ?pagination=cursor 로 키셋(커서) 페이지네이션 사용 가능
+    - 목록/상세는 ETag/Last-Modified 조건부 GET 지원 (conditional.py)
+    - GET 요청의 조회는 읽기 복제본에서 실행 (db/replicas.py)
     """
     serializer_class = CommentSerializer
+    pagination_class = CommentPagination
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    token_user_reads = True
 
     def get_queryset(self):
         post_id = self.kwargs.get('post_pk')
-        return Comment.objects.filter(post_id=post_id)
+        return Comment.objects.filter(post_id=post_id).select_related('author')
+
+    def get_serializer_class(self):
+        if self.action == 'list' and CommentPagination.use_tree(self.request):
+            return CommentThreadSerializer
+        return CommentSerializer
+
+    @action(detail=True, methods=['get'])
+    def replies(self, request, *args, **kwargs):
+        """
+        하위 트리 API
+        - GET /api/posts/{post_id}/comments/{id}/replies/
+        - 댓글 아래 모든 답글을 경로순(깊이 우선)으로, (post, path) 인덱스 범위 조회와 커서로 나눠 반환
+        """
+        comment = self.get_object()
+        paginator = CommentTreeKeysetPagination()
+        page = paginator.paginate_queryset(self.get_queryset().descendants(comment), request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    def get_validators(self, request, *args, **kwargs):
+        # ETag/Last-Modified: 댓글 수 + 최종 수정 시각
+        try:
+            queryset = Comment.objects.filter(post_id=self.kwargs.get('post_pk'))
+            if self.action == 'retrieve':
+                queryset = queryset.filter(pk=kwargs.get('pk'))
+        except (TypeError, ValueError):
+            return None
+        stats = queryset.aggregate(modified=models.Max('updated_at'), total=models.Count('id'))
+        return (stats['total'], stats['modified']), stats['modified']
 
     def perform_create(self, serializer):
         post_id = self.kwargs.get('post_pk')
-        serializer.save(author=self.request.user, post_id=post_id)
+        with transaction.atomic():
+            serializer.save(author=self.request.user, post_id=post_id)
+            Post.objects.filter(pk=post_id).adjust_counts(comments=1)
+
+    def perform_destroy(self, instance):
+        # 답글도 함께 삭제되므로 하위 트리 전체 수만큼 감소
+        with transaction.atomic():
+            deleted = Comment.objects.subtree(instance).count()
+            instance.delete()
+            Post.objects.filter(pk=instance.post_id).adjust_counts(comments=-deleted)
 
 
-class SearchView(generics.ListAPIView):
+class SearchView(ReplicaReadMixin, LikedPostsContextMixin, AnonymousCacheMixin, generics.ListAPIView):
     """
     통합 검색 API
     - GET /api/search/?q=검색어
-    - 제목과 내용에서 검색
+    - 제목과 내용에서 검색 (전문 검색 인덱스, 관련도 순)
+    - ?pagination=cursor 사용 시 키셋 페이지네이션 (최신순)
     """
     serializer_class = PostListSerializer
+    pagination_class = PostPagination
     permission_classes = [permissions.AllowAny]
+    token_user_reads = True
 
     def get_queryset(self):
         query = self.request.query_params.get('q', '')
         if query:
-            return Post.objects.filter(
-                is_public=True,
-                title__icontains=query
-            )
+            return search_posts(Post.objects.filter(is_public=True), query).for_list()
         return Post.objects.none()
+
+
+class CacheStatsView(APIView):
+    """
+    응답 캐시 통계 API (관리자용)
+    - GET /api/cache-stats/
+    - 뷰별 캐시 적중(hit)/실패(miss) 횟수 (현재 프로세스 기준)
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            'version': response_cache.version(),
+            'views': response_cache.snapshot(),
+        })
+
+
+class DatabaseStatsView(APIView):
+    """
+    DB 연결 통계 API (관리자용)
+    - GET /api/db-stats/
+    - 연결 생성/재사용 횟수, 요청당 연결 수, 연결 풀 상태 (현재 프로세스 기준)
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            'databases': {
+                alias: {
+                    'conn_max_age': settings_dict['CONN_MAX_AGE'],
+                    'conn_health_checks': settings_dict['CONN_HEALTH_CHECKS'],
+                    'pool': bool(settings_dict.get('POOL')),
+                }
+                for alias, settings_dict in settings.DATABASES.items()
+            },
+            'connections': connection_metrics.snapshot(),
+            'pools': pool_snapshot(),
+        })
+
+
+class MetricsView(APIView):
+    """
+    요청/캐시/DB 지표 API (관리자용, Prometheus 텍스트 형식)
+    - GET /api/metrics/
+    - 뷰별 처리 시간/DB 시간/쿼리 수 히스토그램, 중복 쿼리 수, 응답 캐시 적중, DB 연결/풀 상태 (현재 프로세스 기준)
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1 @@
+# Tasks app - 비동기 작업 큐 (요청 처리 밖에서 실행할 부가 작업)
@@ -0,0 +1,26 @@
+"""
+Tasks 관리자 페이지 설정
+- 대기/실패 작업을 확인하고 실패한 작업을 다시 실행할 수 있습니다.
+"""
+
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    """작업 관리자"""
+    list_display = ['id', 'name', 'status', 'attempts', 'max_attempts', 'run_at', 'locked_by', 'finished_at']
+    list_filter = ['status', 'name']
+    search_fields = ['name', 'last_error']
+    readonly_fields = ['attempts', 'locked_by', 'locked_at', 'last_error', 'created_at', 'finished_at']
+    actions = ['retry']
+
+    @admin.action(description='선택한 작업 다시 실행')
+    def retry(self, request, queryset):
+        updated = queryset.exclude(status=Task.RUNNING).update(
+            status=Task.PENDING, attempts=0, run_at=timezone.now(), locked_by='', finished_at=None
+        )
+        self.message_user(request, f'작업 {updated}개를 다시 대기 상태로 돌렸습니다.')
@@ -0,0 +1,17 @@
+"""
+Tasks 앱 설정
+- DB 테이블 기반 작업 큐를 제공하는 앱입니다.
+- 각 앱의 tasks.py 모듈을 자동으로 불러와 @task 함수를 등록합니다.
+"""
+
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TasksConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.tasks'
+    verbose_name = '비동기 작업'
+
+    def ready(self):
+        autodiscover_modules('tasks')
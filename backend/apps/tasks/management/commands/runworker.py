@@ -0,0 +1,59 @@
+"""
+작업 워커 실행 명령어
+- 큐에 쌓인 작업을 가져와 실행합니다. 여러 프로세스를 동시에 실행해도 됩니다.
+- SIGTERM/SIGINT를 받으면 실행 중인 작업을 마치고 종료합니다.
+- 사용법: python manage.py runworker [--batch-size 10] [--interval 1] [--once]
+"""
+
+import signal
+
+from django.core.management.base import BaseCommand
+
+from apps.tasks.worker import Worker
+
+
+class Command(BaseCommand):
+    help = '작업 큐 워커를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10,
+            help='한 번에 가져올 작업 수 (기본값: 10)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='작업이 없을 때 다시 확인하기까지 대기 시간(초) (기본값: 1)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기 중인 작업을 모두 실행한 뒤 종료',
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(batch_size=options['batch_size'])
+
+        if options['once']:
+            total = 0
+            while True:
+                done = worker.run_once()
+                if not done:
+                    break
+                total += done
+            self.stdout.write(self.style.SUCCESS(f'작업 {total}개를 실행했습니다.'))
+            return
+
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        self.stdout.write(f'워커 시작: {worker.name} (Ctrl+C로 종료)')
+        worker.run(interval=options['interval'], should_stop=lambda: stopping)
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.16 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, verbose_name='작업 이름')),
+                ('args', models.JSONField(default=list, verbose_name='위치 인자')),
+                ('kwargs', models.JSONField(default=dict, verbose_name='키워드 인자')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.PositiveIntegerField(default=3, verbose_name='최대 시도 횟수')),
+                ('run_at', models.DateTimeField(verbose_name='실행 예정 시각')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='실행 워커')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='실행 시작 시각')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료 시각')),
+            ],
+            options={
+                'verbose_name': '작업',
+                'verbose_name_plural': '작업들',
+                'indexes': [models.Index(fields=['status', 'run_at', 'id'], name='tasks_task_status_run_at_idx')],
+            },
+        ),
+    ]
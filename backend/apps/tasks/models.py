@@ -0,0 +1,48 @@
+"""
+Tasks 모델 정의
+- 작업 큐 테이블(Task)을 정의합니다.
+"""
+
+from django.db import models
+
+
+class Task(models.Model):
+    """
+    큐에 들어간 작업
+    - 요청 처리 중 enqueue되면 같은 트랜잭션에서 저장되므로, 데이터 변경이 커밋될 때만 작업도 보입니다.
+    - 워커는 SELECT ... FOR UPDATE SKIP LOCKED로 서로 다른 작업을 가져갑니다. (worker.py)
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, '대기'),
+        (RUNNING, '실행 중'),
+        (DONE, '완료'),
+        (FAILED, '실패'),
+    ]
+
+    name = models.CharField('작업 이름', max_length=200)
+    args = models.JSONField('위치 인자', default=list)
+    kwargs = models.JSONField('키워드 인자', default=dict)
+    status = models.CharField('상태', max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField('시도 횟수', default=0)
+    max_attempts = models.PositiveIntegerField('최대 시도 횟수', default=3)
+    run_at = models.DateTimeField('실행 예정 시각')
+    locked_by = models.CharField('실행 워커', max_length=100, blank=True)
+    locked_at = models.DateTimeField('실행 시작 시각', null=True, blank=True)
+    last_error = models.TextField('마지막 오류', blank=True)
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+    finished_at = models.DateTimeField('종료 시각', null=True, blank=True)
+
+    class Meta:
+        verbose_name = '작업'
+        verbose_name_plural = '작업들'
+        indexes = [
+            # 워커의 "실행할 작업" 조회: status = pending AND run_at <= now ORDER BY run_at, id
+            models.Index(fields=['status', 'run_at', 'id'], name='tasks_task_status_run_at_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.name} #{self.pk} ({self.status})'
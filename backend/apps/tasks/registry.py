@@ -0,0 +1,87 @@
+"""
+작업 등록과 실행 요청
+- 함수에 @task를 붙이면 이름으로 등록되고 .delay(...)로 큐에 넣을 수 있습니다.
+
+    from apps.tasks.registry import task
+
+    @task(max_attempts=5)
+    def send_notification(user_id):
+        ...
+
+    send_notification.delay(user.pk)
+
+- 인자는 JSON으로 저장되므로 모델 인스턴스 대신 PK 같은 기본 값을 넘겨야 합니다.
+- TASKS_EAGER가 True면 큐에 넣지 않고 트랜잭션 커밋 직후 같은 프로세스에서 바로 실행합니다. (개발/테스트용)
+"""
+
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+_registry = {}
+
+
+class TaskFunction:
+    """@task로 등록된 함수"""
+
+    def __init__(self, func, name, max_attempts, retry_delay):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return f'<task {self.name}>'
+
+    def delay(self, *args, **kwargs):
+        return self.enqueue(args, kwargs)
+
+    def enqueue(self, args=(), kwargs=None, countdown=0):
+        """
+        작업을 큐에 넣음 (countdown초 뒤부터 실행)
+        - 현재 트랜잭션 안에서 저장되므로 롤백되면 작업도 사라집니다.
+        """
+        args, kwargs = list(args), dict(kwargs or {})
+        # 워커에서 실패하지 않도록 넣을 때 직렬화 가능 여부를 확인
+        json.dumps([args, kwargs])
+
+        if getattr(settings, 'TASKS_EAGER', False):
+            transaction.on_commit(lambda: self.func(*args, **kwargs))
+            return None
+
+        from .models import Task
+        return Task.objects.create(
+            name=self.name,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=self.max_attempts,
+            run_at=timezone.now() + timedelta(seconds=countdown),
+        )
+
+
+def task(name=None, max_attempts=3, retry_delay=10):
+    """
+    작업 등록 데코레이터
+    - name: 큐에 저장되는 이름 (기본: 모듈 경로 + 함수 이름)
+    - max_attempts: 실패 시 재시도를 포함한 최대 실행 횟수
+    - retry_delay: 첫 재시도 대기 시간(초), 이후 두 배씩 증가
+    """
+    def decorator(func):
+        task_function = TaskFunction(
+            func, name or f'{func.__module__}.{func.__qualname__}', max_attempts, retry_delay
+        )
+        _registry[task_function.name] = task_function
+        return task_function
+    return decorator
+
+
+def get_task(name):
+    """등록된 작업 (없으면 KeyError)"""
+    return _registry[name]
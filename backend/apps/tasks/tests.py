@@ -0,0 +1,104 @@
+"""
+Tasks 테스트
+- 워커의 작업 가져오기(claim), 실패 재시도, 중단된 작업 복구(maintain)
+- 실행: DB_ENGINE=sqlite python manage.py test apps.tasks
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .models import Task
+from .registry import task
+from .worker import Worker
+
+calls = []
+
+
+@task(name='tests.record', max_attempts=3, retry_delay=10)
+def record(value):
+    calls.append(value)
+
+
+@task(name='tests.broken', max_attempts=2, retry_delay=10)
+def broken():
+    raise ValueError('실패')
+
+
+@override_settings(TASKS_EAGER=False)
+class WorkerTests(TestCase):
+    def setUp(self):
+        calls.clear()
+        self.worker = Worker(batch_size=10, name='test-worker')
+
+    def refresh(self, task_row):
+        task_row.refresh_from_db()
+        return task_row
+
+    def test_claim_due_pending_tasks(self):
+        due = record.delay('due')
+        later = record.enqueue(['later'], countdown=60)
+        done = record.delay('done')
+        Task.objects.filter(pk=done.pk).update(status=Task.DONE)
+
+        self.assertEqual([claimed.pk for claimed in self.worker.claim()], [due.pk])
+        due = self.refresh(due)
+        self.assertEqual((due.status, due.attempts, due.locked_by), (Task.RUNNING, 1, 'test-worker'))
+        self.assertEqual(self.refresh(later).status, Task.PENDING)
+        # 이미 가져간 작업은 다시 가져가지 않음
+        self.assertEqual(self.worker.claim(), [])
+
+    def test_run_once_executes(self):
+        row = record.delay('value')
+        self.assertEqual(self.worker.run_once(), 1)
+        self.assertEqual(calls, ['value'])
+        self.assertEqual(self.refresh(row).status, Task.DONE)
+
+    def test_retry_then_fail(self):
+        row = broken.delay()
+        started = timezone.now()
+        with self.assertLogs('apps.tasks.worker', 'WARNING'):
+            self.worker.run_once()
+        row = self.refresh(row)
+        self.assertEqual((row.status, row.attempts, row.locked_by), (Task.PENDING, 1, ''))
+        self.assertGreaterEqual(row.run_at, started + timedelta(seconds=10))
+        self.assertIn('ValueError', row.last_error)
+
+        Task.objects.filter(pk=row.pk).update(run_at=timezone.now())
+        with self.assertLogs('apps.tasks.worker', 'ERROR'):
+            self.worker.run_once()
+        row = self.refresh(row)
+        self.assertEqual((row.status, row.attempts), (Task.FAILED, 2))
+        self.assertIsNotNone(row.finished_at)
+
+    def test_maintain_recovers_stale_tasks(self):
+        stale_at = timezone.now() - timedelta(seconds=settings.TASKS_LOCK_TIMEOUT + 1)
+        retry = record.delay('retry')
+        exhausted = record.delay('exhausted')
+        active = record.delay('active')
+        Task.objects.filter(pk=retry.pk).update(status=Task.RUNNING, attempts=1, locked_at=stale_at)
+        Task.objects.filter(pk=exhausted.pk).update(status=Task.RUNNING, attempts=3, locked_at=stale_at)
+        Task.objects.filter(pk=active.pk).update(status=Task.RUNNING, attempts=3, locked_at=timezone.now())
+
+        with self.assertLogs('apps.tasks.worker', 'WARNING'):
+            self.worker.maintain()
+        self.assertEqual(self.refresh(retry).status, Task.PENDING)
+        exhausted = self.refresh(exhausted)
+        self.assertEqual(exhausted.status, Task.FAILED)
+        self.assertTrue(exhausted.last_error)
+        self.assertEqual(self.refresh(active).status, Task.RUNNING)
+
+    def test_maintain_deletes_old_results(self):
+        old = record.delay('old')
+        recent = record.delay('recent')
+        now = timezone.now()
+        Task.objects.filter(pk=old.pk).update(
+            status=Task.DONE, finished_at=now - timedelta(seconds=settings.TASKS_RESULT_TTL + 1)
+        )
+        Task.objects.filter(pk=recent.pk).update(status=Task.DONE, finished_at=now)
+
+        self.worker.maintain()
+        self.assertFalse(Task.objects.filter(pk=old.pk).exists())
+        self.assertTrue(Task.objects.filter(pk=recent.pk).exists())
@@ -0,0 +1,120 @@
+"""
+작업 워커
+- 실행할 작업을 SELECT ... FOR UPDATE SKIP LOCKED로 가져오므로
+  여러 워커 프로세스를 동시에 띄워도 같은 작업을 두 번 가져가지 않습니다.
+- 가져온 작업은 running으로 표시하고 잠금을 바로 풀어, 실행 시간 동안 행 잠금을 잡고 있지 않습니다.
+- 실패하면 재시도 간격을 두 배씩 늘려 다시 대기 상태로 돌리고, 최대 횟수를 넘으면 failed로 남깁니다.
+- 실행 중에 워커가 죽은 작업은 TASKS_LOCK_TIMEOUT이 지나면 다시 대기 상태로 돌립니다.
+  이미 최대 횟수만큼 실행한 작업은 failed로 남깁니다. (실행할 때마다 워커를 죽이는 작업이 계속 재실행되지 않도록)
+"""
+
+import logging
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+from .registry import get_task
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """작업 큐 워커 (runworker 명령어에서 사용)"""
+
+    def __init__(self, batch_size=10, name=None):
+        self.batch_size = batch_size
+        self.name = name or f'{socket.gethostname()}:{os.getpid()}'
+        self.last_maintenance = 0.0
+
+    def claim(self):
+        """실행할 작업을 가져와 running으로 표시"""
+        now = timezone.now()
+        with transaction.atomic():
+            tasks = list(
+                Task.objects.select_for_update(skip_locked=True)
+                .filter(status=Task.PENDING, run_at__lte=now)
+                .order_by('run_at', 'id')[:self.batch_size]
+            )
+            if tasks:
+                Task.objects.filter(pk__in=[task.pk for task in tasks]).update(
+                    status=Task.RUNNING, locked_by=self.name, locked_at=now, attempts=F('attempts') + 1
+                )
+        for task in tasks:
+            task.attempts += 1
+        return tasks
+
+    def execute(self, task):
+        try:
+            get_task(task.name)(*task.args, **task.kwargs)
+        except Exception:
+            self.fail(task, traceback.format_exc())
+        else:
+            Task.objects.filter(pk=task.pk).update(
+                status=Task.DONE, finished_at=timezone.now(), last_error=''
+            )
+
+    def fail(self, task, error):
+        now = timezone.now()
+        if task.attempts < task.max_attempts:
+            try:
+                retry_delay = get_task(task.name).retry_delay
+            except KeyError:
+                retry_delay = 0
+            delay = retry_delay * 2 ** (task.attempts - 1)
+            logger.warning('작업 실패 (%s회, %s초 뒤 재시도) %s\n%s', task.attempts, delay, task, error)
+            Task.objects.filter(pk=task.pk).update(
+                status=Task.PENDING, run_at=now + timedelta(seconds=delay), locked_by='', last_error=error
+            )
+        else:
+            logger.error('작업 실패 (재시도 초과) %s\n%s', task, error)
+            Task.objects.filter(pk=task.pk).update(status=Task.FAILED, finished_at=now, last_error=error)
+
+    def maintain(self):
+        """
+        주기적 정리
+        - 실행 중에 워커가 죽은 작업을 대기 상태로 되돌림 (최대 시도 횟수에 도달한 작업은 failed)
+        - 보관 기간이 지난 완료 작업 삭제
+        """
+        now = timezone.now()
+        stale = Task.objects.filter(
+            status=Task.RUNNING, locked_at__lt=now - timedelta(seconds=settings.TASKS_LOCK_TIMEOUT)
+        )
+        failed = stale.filter(attempts__gte=F('max_attempts')).update(
+            status=Task.FAILED, finished_at=now, locked_by='',
+            last_error='실행 중에 워커가 중단되었습니다. (재시도 초과)',
+        )
+        if failed:
+            logger.error('실행 중에 중단된 작업 %s개가 재시도 횟수를 넘어 실패 처리되었습니다.', failed)
+        recovered = stale.update(status=Task.PENDING, locked_by='')
+        if recovered:
+            logger.warning('중단된 작업 %s개를 다시 대기 상태로 돌렸습니다.', recovered)
+        Task.objects.filter(
+            status=Task.DONE, finished_at__lt=now - timedelta(seconds=settings.TASKS_RESULT_TTL)
+        ).delete()
+
+    def run_once(self):
+        """대기 중인 작업을 한 번 가져와 실행 (실행한 작업 수 반환)"""
+        if time.monotonic() - self.last_maintenance > 60:
+            self.maintain()
+            self.last_maintenance = time.monotonic()
+        tasks = self.claim()
+        for task in tasks:
+            self.execute(task)
+        return len(tasks)
+
+    def run(self, interval=1.0, should_stop=lambda: False):
+        """작업이 없으면 interval초 쉬면서 계속 실행"""
+        logger.info('워커 시작: %s', self.name)
+        while not should_stop():
+            close_old_connections()
+            if not self.run_once():
+                time.sleep(interval)
+        logger.info('워커 종료: %s', self.name)
@@ -0,0 +1,14 @@
+"""
+ASGI 설정 파일
+- 비동기 서버(Uvicorn)에서 Django 앱을 실행할 때 사용됩니다.
+- 읽기 위주 API는 비동기 뷰로 동작합니다. (ASYNC_VIEWS, apps/core/async_views.py)
+- 실행 예: gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker -w 4 --bind 0.0.0.0:8000
+"""
+
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ.setdefault('ASYNC_VIEWS', 'True')
+
+application = get_asgi_application()
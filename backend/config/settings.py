@@ -45,13 +45,17 @@ INSTALLED_APPS = [
     # 프로젝트 앱
     'apps.accounts',            # 사용자 계정 관리
     'apps.core',                # 핵심 기능
+    'apps.tasks',               # 비동기 작업 큐
 ]
 
 # =====================================
 # 미들웨어 설정
 # =====================================
 MIDDLEWARE = [
-    'corsheaders.middleware.CorsMiddleware',        # CORS 처리 (맨 위에 위치)
+    'apps.core.middleware.DatabaseConnectionMetricsMiddleware',  # 요청별 DB 연결 지표
+    'apps.core.middleware.ProfilingMiddleware',       # 뷰별 처리 시간/쿼리 지표 (/api/metrics/)
+    'apps.core.middleware.ReplicaPinningMiddleware',  # 쓰기 직후 읽기를 default DB로 고정
+    'corsheaders.middleware.CorsMiddleware',        # CORS 처리
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -85,23 +89,118 @@ TEMPLATES = [
 # WSGI 설정
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# =====================================
+# ASGI 설정
+# - config/asgi.py로 실행하면 ASYNC_VIEWS가 켜져 게시글 목록/상세, 댓글 목록, 검색이 비동기 뷰로 동작
+#   (apps/core/async_views.py). WSGI(Gunicorn 동기 워커)에서는 끄고 사용합니다.
+# =====================================
+ASYNC_VIEWS = os.environ.get('ASYNC_VIEWS', 'False').lower() in ('true', '1', 'yes')
+
 # =====================================
 # 데이터베이스 설정 (MySQL)
+# - ENGINE은 Django MySQL 백엔드에 연결 지표와 연결 풀을 더한 apps/core/db/mysql
+#   (DB_ENGINE=sqlite: 로컬 개발/테스트용 SQLite, DB_NAME은 파일 경로)
+# - 연결 재사용 방식 (환경 변수)
+#   * 기본 (DB_POOL_SIZE=0): 스레드별 지속 연결. 연결을 DB_CONN_MAX_AGE초 동안 유지하고
+#     DB_CONN_HEALTH_CHECKS가 켜져 있으면 요청 시작 시 재사용할 연결을 먼저 확인합니다.
+#     WSGI(Gunicorn sync/gthread) 워커는 스레드가 고정이라 "워커 수 x 스레드 수"만큼 연결이 유지됩니다.
+#   * 풀 (DB_POOL_SIZE>0): 프로세스마다 DB_POOL_SIZE개(+ 순간 DB_POOL_MAX_OVERFLOW개) 연결을 스레드끼리 공유.
+#     요청이 끝나면 연결을 풀에 반납하므로 CONN_MAX_AGE는 0으로 고정됩니다. (apps/core/db/pool.py)
+#     최대 연결 수 = 프로세스 수 x (DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW) 가 MySQL max_connections보다 작아야 합니다.
+#   * ASGI (ASYNC_VIEWS): 요청마다 새 스레드에서 ORM이 실행되어 스레드별 지속 연결은 재사용되지 않고 쌓이기만 하므로
+#     풀 없이 실행하면 CONN_MAX_AGE를 0으로 강제합니다. ASGI에서 연결을 재사용하려면 풀을 켜세요.
+# - 요청별 연결 횟수/시간은 응답의 Server-Timing(db-connect) 헤더와 /api/db-stats/ (관리자)에서 확인
 # =====================================
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', '60'))  # 초, 0이면 요청마다 연결
+DB_CONN_HEALTH_CHECKS = os.environ.get('DB_CONN_HEALTH_CHECKS', 'True').lower() in ('true', '1', 'yes')
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '0'))
+DB_ENGINE = os.environ.get('DB_ENGINE', 'mysql')  # mysql / sqlite
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
+        'ENGINE': 'apps.core.db.mysql',
         'NAME': os.environ.get('DB_NAME', 'webapp_db'),
         'USER': os.environ.get('DB_USER', 'root'),
         'PASSWORD': os.environ.get('DB_PASSWORD', '123123'),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '3306'),
+        'CONN_MAX_AGE': 0 if DB_POOL_SIZE or ASYNC_VIEWS else DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+        'POOL': {
+            'SIZE': DB_POOL_SIZE,
+            'MAX_OVERFLOW': int(os.environ.get('DB_POOL_MAX_OVERFLOW', '10')),
+            'TIMEOUT': float(os.environ.get('DB_POOL_TIMEOUT', '10')),     # 연결 대기 최대 시간(초)
+            'RECYCLE': int(os.environ.get('DB_POOL_RECYCLE', '3600')),     # 연결 최대 수명(초)
+            'PING_AFTER': int(os.environ.get('DB_POOL_PING_AFTER', '30')), # 이 시간(초) 이상 쉰 연결은 ping 후 사용
+        } if DB_POOL_SIZE else None,
         'OPTIONS': {
             'charset': 'utf8mb4',
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
         },
     }
 }
+if DB_ENGINE == 'sqlite':
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('DB_NAME', str(BASE_DIR / 'db.sqlite3')),
+        'CONN_MAX_AGE': DATABASES['default']['CONN_MAX_AGE'],
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+    }
+
+# =====================================
+# 읽기 복제본 설정 (apps/core/db/replicas.py)
+# - DB_REPLICAS: 쉼표로 구분한 복제본 목록, replica1, replica2 ... 별칭으로 등록
+#   MySQL은 host[:port] (DB 이름/계정은 default와 같고 DB_REPLICA_USER/DB_REPLICA_PASSWORD로 변경 가능)
+#   SQLite는 DB 파일 경로 (default와 같은 파일을 주면 로컬에서 두 별칭으로 라우팅을 확인할 수 있음)
+# - 게시글/댓글/카테고리/검색 API의 GET 요청만 복제본에서 읽고, 쓰기 요청이 성공하면
+#   REPLICA_PIN_SECONDS 동안 같은 클라이언트(쿠키)/사용자(캐시)의 읽기는 default에서 실행 (read-your-writes)
+# - 테스트 실행 시 복제본은 default 테스트 DB를 미러링 (TEST.MIRROR)
+# =====================================
+DATABASE_REPLICAS = []
+for index, replica in enumerate(filter(None, os.environ.get('DB_REPLICAS', '').split(',')), start=1):
+    if DB_ENGINE == 'sqlite':
+        overrides = {'NAME': replica.strip()}
+    else:
+        host, _, port = replica.strip().partition(':')
+        overrides = {
+            'HOST': host,
+            'PORT': port or DATABASES['default']['PORT'],
+            'USER': os.environ.get('DB_REPLICA_USER', DATABASES['default']['USER']),
+            'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+        }
+    DATABASES[f'replica{index}'] = {**DATABASES['default'], **overrides, 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(f'replica{index}')
+
+DATABASE_ROUTERS = ['apps.core.db.replicas.ReplicaRouter']
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', '5'))
+
+# =====================================
+# 캐시 설정
+# - 기본은 프로세스 메모리(locmem), 여러 서버에서 공유하려면 Redis/Memcached 백엔드로 교체
+#   (docker compose up -d redis 로 Redis 실행, 클라이언트 redis 패키지는 requirements.txt에 포함)
+#     CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+#     CACHE_LOCATION=redis://127.0.0.1:6379/1
+#   위 설정은 아래와 같은 CACHES가 됩니다.
+#     CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+#                           'LOCATION': 'redis://127.0.0.1:6379/1'}}
+# - 공유 캐시일 때만 JWT 인증 사용자 캐시(AUTH_USER_CACHE_*)와 캐시 기반 로그인 시도 제한(AXES_HANDLER)을 사용
+# =====================================
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'webapp-cache'),
+    }
+}
+# 여러 워커/서버가 같은 값을 보는 캐시인지 (locmem/더미 캐시는 워커마다 따로 저장)
+CACHE_IS_SHARED = CACHES['default']['BACKEND'] not in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# 비인증 사용자 응답 캐시 (apps/core/cache.py)
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_TIMEOUT = int(os.environ.get('RESPONSE_CACHE_TIMEOUT', '60'))  # 초
+RESPONSE_CACHE_LOCK_TIMEOUT = 10  # 동시 요청이 재계산을 기다리는 최대 시간 (초)
 
 # =====================================
 # 인증 백엔드 설정
@@ -122,6 +221,35 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# =====================================
+# 비밀번호 해시 설정 (apps/accounts/hashing.py)
+# - PASSWORD_HASHER: pbkdf2(기본) / argon2 (argon2-cffi 필요, 코어 하나를 쓰도록 조정한 Argon2id)
+#   목록의 첫 번째 방식으로 새 해시를 만들고, 나머지는 기존 해시 확인용 (로그인 성공 시 첫 번째 방식으로 다시 저장)
+# - PASSWORD_HASHING_WORKERS: 해시를 계산할 프로세스 수 (서버 워커 프로세스마다 따로 생성, 0이면 요청 스레드에서 계산)
+#   기본값은 0, 서버 워커 수 x 풀 프로세스 수가 CPU 수를 넘지 않도록 배포 환경에서 지정
+#   성능 비교: python manage.py benchmark_hashing
+# =====================================
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'pbkdf2')  # pbkdf2 / argon2
+_PASSWORD_HASHERS = {
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'argon2': 'apps.accounts.hashing.TunedArgon2PasswordHasher',
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+# Argon2 비용 (기본값: OWASP 권장 m=19MiB, t=2, p=1)
+ARGON2_TIME_COST = int(os.environ.get('ARGON2_TIME_COST', '2'))
+ARGON2_MEMORY_COST = int(os.environ.get('ARGON2_MEMORY_COST', str(19 * 1024)))  # KiB
+ARGON2_PARALLELISM = int(os.environ.get('ARGON2_PARALLELISM', '1'))
+
+PASSWORD_HASHING_WORKERS = int(os.environ.get('PASSWORD_HASHING_WORKERS', '0'))
+PASSWORD_HASHING_QUEUE_SIZE = int(os.environ.get('PASSWORD_HASHING_QUEUE_SIZE', '32'))  # 계산 중인 요청 외에 대기할 수 있는 요청 수
+PASSWORD_HASHING_QUEUE_TIMEOUT = 5  # 대기열에 자리가 날 때까지 기다리는 최대 시간(초), 넘으면 503
+
 # =====================================
 # 국제화 설정
 # =====================================
@@ -148,7 +276,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # =====================================
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.accounts.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -172,8 +300,18 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.accounts.serializers.ClaimsTokenObtainPairSerializer',
 }
 
+# JWT 인증 사용자 캐시 (apps/accounts/authentication.py)
+# - 공유 캐시(Redis/Memcached)일 때만 사용, locmem이면 사용자 무효화가 다른 워커에 전달되지 않으므로 매 요청 DB 조회
+AUTH_USER_CACHE_ALIAS = 'default'
+AUTH_USER_CACHE_TIMEOUT = int(os.environ.get('AUTH_USER_CACHE_TIMEOUT', '300'))  # 공유 캐시 (초)
+AUTH_USER_CACHE_LOCAL_TIMEOUT = int(os.environ.get('AUTH_USER_CACHE_LOCAL_TIMEOUT', '5'))  # 프로세스 메모리 (초, 0이면 사용 안 함)
+
+# 읽기 요청은 DB 조회 없이 토큰 클레임으로 사용자 구성 (token_user_reads = True인 뷰의 GET/HEAD/OPTIONS)
+JWT_TOKEN_USER_READS = os.environ.get('JWT_TOKEN_USER_READS', 'False').lower() in ('true', '1', 'yes')
+
 # =====================================
 # CORS 설정 (React 프론트엔드 연동)
 # =====================================
@@ -197,6 +335,13 @@ AXES_FAILURE_LIMIT = 5              # 5회 실패 시 잠금
 AXES_COOLOFF_TIME = timedelta(minutes=30)  # 30분 후 잠금 해제
 AXES_LOCKOUT_CALLABLE = None
 AXES_RESET_ON_SUCCESS = True        # 성공 시 실패 횟수 초기화
+# 공유 캐시(CACHE_BACKEND가 Redis/Memcached)이면 실패 횟수는 캐시에서 세고 잠금 이벤트만 DB(LockoutEvent)에 기록
+# (apps/accounts/lockout.py), 아니면 기본 DB 핸들러 사용 (워커마다 따로 세면 실패 한도가 워커 수만큼 늘어남)
+AXES_HANDLER = (
+    'apps.accounts.lockout.CacheLockoutHandler' if CACHE_IS_SHARED
+    else 'axes.handlers.database.AxesDatabaseHandler'
+)
+AXES_CACHE = 'default'
 
 # =====================================
 # 파일 업로드 설정
@@ -206,3 +351,69 @@ DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 
 # 허용된 파일 확장자
 ALLOWED_FILE_EXTENSIONS = ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.jpg', '.jpeg', '.png', '.gif']
+
+# 분할(청크) 업로드 설정 (apps/core/uploads.py)
+ATTACHMENT_MAX_SIZE = int(os.environ.get('ATTACHMENT_MAX_SIZE', str(500 * 1024 * 1024)))  # 500MB
+UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024       # 클라이언트에 권장하는 청크 크기 (5MB)
+UPLOAD_CHUNK_MAX_SIZE = 10 * 1024 * 1024  # 한 요청에 받을 수 있는 최대 청크 크기 (10MB)
+UPLOAD_TEMP_DIR = 'uploads/tmp'           # MEDIA_ROOT 기준 임시 파일 경로
+
+# 첨부파일 다운로드 (apps/core/downloads.py)
+# - ATTACHMENT_SENDFILE: ''(Django가 직접 전송) / 'x-accel-redirect'(Nginx) / 'x-sendfile'(Apache, lighttpd)
+# - x-accel-redirect 사용 시 Nginx에 MEDIA_ROOT를 가리키는 internal location이 필요합니다.
+#     location /protected/ { internal; alias /app/media/; }
+ATTACHMENT_SENDFILE = os.environ.get('ATTACHMENT_SENDFILE', '').lower()
+ATTACHMENT_SENDFILE_PREFIX = os.environ.get('ATTACHMENT_SENDFILE_PREFIX', '/protected/')
+ATTACHMENT_CACHE_MAX_AGE = 60 * 60  # 공개 게시글 첨부파일의 브라우저/프록시 캐시 시간 (초)
+
+# 썸네일 (apps/core/thumbnails.py)
+THUMBNAIL_SIZES = {'sm': 128, 'md': 480}  # 크기 이름 -> 최대 변 길이(px)
+THUMBNAIL_DIR = 'thumbnails'              # MEDIA_ROOT 기준 저장 경로
+THUMBNAIL_QUALITY = 80                    # WebP 품질
+
+# 좋아요 여부 일괄 조회(/api/posts/liked/?ids=...) 최대 게시글 수
+LIKED_STATUS_MAX_IDS = 100
+
+# 게시글 상세 응답에 포함할 댓글 수 (나머지는 /api/posts/{id}/comments/?cursor=... 로 조회)
+POST_DETAIL_COMMENTS = 20
+
+# 답글 최대 깊이 (최상위 댓글 0, 경로 길이 제한으로 최대 24)
+COMMENT_MAX_DEPTH = 10
+
+# 댓글 트리 목록(?mode=tree)에서 스레드마다 함께 보내는 처음 답글 수
+COMMENT_THREAD_REPLIES = 3
+
+# =====================================
+# 프로파일링 설정 (apps/core/profiling.py)
+# - 뷰별 처리 시간, DB 시간, 쿼리 수, 중복 쿼리를 집계해 /api/metrics/ (관리자, Prometheus 형식)로 노출
+# - PROFILING_SAMPLE_RATE: cProfile로 프로파일링할 동기 요청 비율 (0~1, 결과는 PROFILING_DIR/*.prof)
+#   확인: python -m pstats <파일> 또는 snakeviz <파일>
+# =====================================
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'True').lower() in ('true', '1', 'yes')
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_DIR = os.environ.get('PROFILING_DIR', str(BASE_DIR / 'profiles'))
+PROFILING_DUPLICATE_WARNING = 5  # 한 요청의 중복 쿼리가 이 수 이상이면 경고 로그 (0이면 끔)
+
+# =====================================
+# 작업 큐 설정 (apps/tasks)
+# - 파일 정리, 썸네일 생성 등 부가 작업은 큐에 넣고 `python manage.py runworker`가 실행
+# - TASKS_EAGER: 큐 대신 커밋 직후 같은 프로세스에서 바로 실행 (기본: DEBUG일 때, 워커 없이 개발/테스트)
+# =====================================
+TASKS_EAGER = os.environ.get('TASKS_EAGER', str(DEBUG)).lower() in ('true', '1', 'yes')
+TASKS_LOCK_TIMEOUT = 10 * 60    # 이 시간(초)이 지나도 끝나지 않은 작업은 워커가 죽은 것으로 보고 다시 실행
+TASKS_RESULT_TTL = 24 * 60 * 60  # 완료된 작업 보관 시간(초)
+
+# =====================================
+# 조회수 버퍼 설정
+# - 조회수를 메모리에 모았다가 주기적으로 일괄 반영 (0이면 요청마다 즉시 반영)
+# =====================================
+VIEW_COUNT_FLUSH_INTERVAL = int(os.environ.get('VIEW_COUNT_FLUSH_INTERVAL', '5'))  # 초
+
+# =====================================
+# 검색 설정
+# - auto: MySQL이면 FULLTEXT(ngram) 인덱스, 그 외에는 제목/내용 부분 일치(LIKE)
+# - inverted: Python 역색인 (프로세스마다 따로 만들고 갱신하므로 단일 프로세스 개발 환경에서만 지정)
+# =====================================
+SEARCH_BACKEND = os.environ.get('SEARCH_BACKEND', 'auto')  # auto / mysql / like / inverted
+SEARCH_MAX_CANDIDATES = 2000  # 역색인 백엔드가 점수 순으로 가져올 최대 후보 수 (SQL IN 목록 크기)
+SEARCH_MAX_RESULTS = 200  # 역색인 백엔드가 관련도 순으로 정렬할 최대 결과 수 (나머지 일치 결과는 최신순으로 뒤에)
@@ -9,6 +9,9 @@ const PostDetail = () => {
   const { user, isAuthenticated } = useAuth();
   const [post, setPost] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [comments, setComments] = useState([]);
+  const [commentsNext, setCommentsNext] = useState(null);
+  const [loadingComments, setLoadingComments] = useState(false);
   const [commentContent, setCommentContent] = useState('');
   const [submitting, setSubmitting] = useState(false);
 
@@ -20,6 +23,9 @@ const PostDetail = () => {
     try {
       const data = await postAPI.getDetail(id);
       setPost(data);
+      // 상세 응답에는 처음 일부 댓글만 포함되고, 나머지는 댓글 API로 이어서 조회
+      setComments(data.comments || []);
+      setCommentsNext(data.comments_next);
     } catch (error) {
       console.error('게시글 로드 실패:', error);
       alert('게시글을 찾을 수 없습니다.');
@@ -29,6 +35,21 @@ const PostDetail = () => {
     }
   };
 
+  const handleLoadMoreComments = async () => {
+    if (!commentsNext) return;
+    setLoadingComments(true);
+    try {
+      const cursor = new URL(commentsNext, window.location.origin).searchParams.get('cursor');
+      const data = await commentAPI.getList(id, { cursor });
+      setComments((prev) => [...prev, ...data.results]);
+      setCommentsNext(data.next);
+    } catch (error) {
+      alert('댓글을 불러오지 못했습니다.');
+    } finally {
+      setLoadingComments(false);
+    }
+  };
+
   const handleDelete = async () => {
     if (!window.confirm('정말 삭제하시겠습니까?')) return;
     try {
@@ -153,7 +174,7 @@ const PostDetail = () => {
       {/* 댓글 */}
       <div className="comment-section">
         <div className="comment-header">
-          댓글 {post.comments?.length || 0}개
+          댓글 {post.comment_count || 0}개
         </div>
 
         {isAuthenticated ? (
@@ -173,9 +194,9 @@ const PostDetail = () => {
           </div>
         )}
 
-        {post.comments && post.comments.length > 0 ? (
+        {comments.length > 0 ? (
           <ul className="comment-list">
-            {post.comments.map((comment) => (
+            {comments.map((comment) => (
               <li key={comment.id} className="comment-item">
                 <div className="comment-meta">
                   <span className="comment-author">{comment.author_name}</span>
@@ -196,6 +217,16 @@ const PostDetail = () => {
         ) : (
           <div className="no-comment">댓글이 없습니다.</div>
         )}
+
+        {commentsNext && (
+          <button
+            onClick={handleLoadMoreComments}
+            className="btn comment-more"
+            disabled={loadingComments}
+          >
+            {loadingComments ? '불러오는 중' : '댓글 더 보기'}
+          </button>
+        )}
       </div>
     </>
   );
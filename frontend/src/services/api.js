@@ -183,8 +183,8 @@ export const categoryAPI = {
 // =====================================
 
 export const commentAPI = {
-  getList: async (postId) => {
-    const response = await api.get(`posts/${postId}/comments/`);
+  getList: async (postId, params = {}) => {
+    const response = await api.get(`posts/${postId}/comments/`, { params });
     return response.data;
   },
 